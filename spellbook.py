@@ -9,28 +9,107 @@ Cortex Platform content packs.
 """
 
 import os
+import re
+import stat
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from spellbook import __version__
-from spellbook.pack_builder import PackBuilder
-from spellbook.pack_template import PackTemplate
-from spellbook.version_manager import VersionManager
-from spellbook.instance import InstanceManager
-from spellbook.xsiam_validator import XSIAMValidator
-from spellbook.content_importer import CorrelationImporter
-from spellbook.template_renderer import TemplateRenderer, list_templates
+
+if TYPE_CHECKING:
+    from spellbook.version_manager import VersionManager
 
 
 PINNED_SDK_VERSION = "1.38.20"
+VERSION_PATTERN = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+
+DOCKER_MOUNT_HELP = """\
+  When using Docker, ensure you mount the content directory:
+
+    docker run --rm -v $(pwd):/content \\
+      ghcr.io/gocortexio/spellbook <command>
+"""
+
+MISSING_CONFIG_DOCKER_HELP = DOCKER_MOUNT_HELP + """
+  Run this command from your content instance directory
+  (the folder containing spellbook.yaml and Packs/).
+"""
+
+MISSING_PACKS_DIR_HELP = """\
+  The Packs/ directory is required for this command.
+
+""" + DOCKER_MOUNT_HELP + """
+  Run this command from your content instance directory.
+
+"""
+
+GIT_IDENTITY_DOCKER_HELP = """\
+When using Docker, mount your git config:
+
+  docker run --rm \\
+    -v $(pwd):/content \\
+    -v ~/.gitconfig:/home/spellbook/.gitconfig:ro \\
+    ghcr.io/gocortexio/spellbook {command_name} {pack_name} --tag
 
+"""
+
+UPLOAD_DOCKER_EXAMPLE = """\
+  docker run --rm -v $(pwd):/content \\
+    -e DEMISTO_BASE_URL="https://your-instance.demisto.com" \\
+    -e DEMISTO_API_KEY="your-api-key" \\
+    ghcr.io/gocortexio/spellbook upload Packs/MyPack
+"""
+
+UPLOAD_XSIAM_DOCKER_EXAMPLE = """\
+  docker run --rm -v $(pwd):/content \\
+    -e DEMISTO_BASE_URL="https://your-instance.xdr.paloaltonetworks.com" \\
+    -e DEMISTO_API_KEY="your-api-key" \\
+    -e XSIAM_AUTH_ID="your-auth-id" \\
+    ghcr.io/gocortexio/spellbook upload Packs/MyPack --xsiam
+"""
+
+UPLOAD_ENV_FILE_HELP = """
+Or use an env file:
 
+  docker run --rm -v $(pwd):/content --env-file .env \\
+    ghcr.io/gocortexio/spellbook upload Packs/MyPack
+
+"""
+
+RELEASE_NOTES_MESSAGE_TEMPLATE = "#### {pack_name}\n\n- {message}\n"
+
+RELEASE_NOTES_TEMPLATE = """#### Parsing Rules
+
+##### {pack_name} Parsing Rule
+
+- (Describe parsing rule changes here)
+
+#### Modeling Rules
+
+##### {pack_name} Modeling Rule
+
+- (Describe modelling rule changes here)
+
+#### Correlation Rules
+
+##### {pack_name} - (Rule Name)
+
+- (Describe correlation rule changes here)
+"""
+
+
+@lru_cache(maxsize=1)
 def get_version_info():
-    """Get version information for spellbook, demisto-sdk, and Python."""
-    import sys
+    """Get version information for spellbook, demisto-sdk, and Python.
+
+    The result is cached for the life of the process, since none of these
+    versions can change while it runs.
+    """
     try:
         from importlib.metadata import version
         sdk_version = version("demisto-sdk")
@@ -60,45 +139,42 @@ def check_environment(config_path: str, require_packs: bool = True) -> bool:
         click.echo("  This file is required to run Spellbook commands.")
         click.echo("")
         if config_path == "spellbook.yaml":
-            click.echo("  When using Docker, ensure you mount the content directory:")
-            click.echo("")
-            click.echo("    docker run --rm -v $(pwd):/content \\")
-            click.echo("      ghcr.io/gocortexio/spellbook <command>")
-            click.echo("")
-            click.echo("  Run this command from your content instance directory")
-            click.echo("  (the folder containing spellbook.yaml and Packs/).")
+            click.echo(MISSING_CONFIG_DOCKER_HELP, nl=False)
         else:
             click.echo(f"  Check that the path '{config_path}' is correct.")
         click.echo("")
         sys.exit(1)
     
     if require_packs:
+        from spellbook.pack_builder import PackBuilder
+
         builder = PackBuilder(config_path)
         if not builder.check_packs_dir_exists():
             click.echo("")
             click.echo(f"[ERROR] Packs directory not found: {builder.packs_dir}")
             click.echo("")
-            click.echo("  The Packs/ directory is required for this command.")
-            click.echo("")
-            click.echo("  When using Docker, ensure you mount the content directory:")
-            click.echo("")
-            click.echo("    docker run --rm -v $(pwd):/content \\")
-            click.echo("      ghcr.io/gocortexio/spellbook <command>")
-            click.echo("")
-            click.echo("  Run this command from your content instance directory.")
-            click.echo("")
+            click.echo(MISSING_PACKS_DIR_HELP, nl=False)
             sys.exit(1)
     
     return True
 
 
-def run_xsiam_validation(packs_dir: Path, pack_name: str) -> None:
+def run_xsiam_validation(packs_dir: Path, pack_name: str, xsiam_validator=None) -> None:
     """Run non-blocking XSIAM validation on a pack and display results.
 
     Output uses grepable format. Does not block the calling operation.
+    Callers validating several packs pass one shared xsiam_validator and
+    call its save_cache() once at the end; without one, a validator is
+    created and its results cache saved for this pack alone.
     """
-    xsiam_validator = XSIAMValidator(packs_dir)
-    issues = xsiam_validator.validate_pack(pack_name)
+    from spellbook.xsiam_validator import XSIAMValidator, default_cache_path
+
+    if xsiam_validator is None:
+        xsiam_validator = XSIAMValidator(packs_dir, cache_path=default_cache_path())
+        issues = xsiam_validator.validate_pack(pack_name)
+        xsiam_validator.save_cache()
+    else:
+        issues = xsiam_validator.validate_pack(pack_name)
     if issues:
         click.echo("")
         click.echo(xsiam_validator.format_issues(issues))
@@ -107,14 +183,12 @@ def run_xsiam_validation(packs_dir: Path, pack_name: str) -> None:
 
 def validate_version_format(version: str) -> bool:
     """Check if version matches X.Y.Z format."""
-    import re
-    pattern = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
-    return pattern.match(version) is not None
+    return VERSION_PATTERN.match(version) is not None
 
 
 def normalise_version(version: str) -> str:
     """Strip 'v' prefix if present and return clean version string."""
-    if version.startswith("v") or version.startswith("V"):
+    if version.startswith(("v", "V")):
         return version[1:]
     return version
 
@@ -132,8 +206,9 @@ def check_git_repository(command_name: str = "bump-version") -> bool:
     try:
         git_check = subprocess.run(
             ["git", "rev-parse", "--git-dir"],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False
         )
         if git_check.returncode != 0:
             click.echo("")
@@ -175,6 +250,8 @@ def create_release_notes(pack_name: str, version: str, pack_path: Path, message:
     Returns:
         Path to the release notes file.
     """
+    from spellbook.fileio import write_atomic
+
     release_notes_dir = pack_path / "ReleaseNotes"
     release_notes_dir.mkdir(exist_ok=True)
 
@@ -183,32 +260,15 @@ def create_release_notes(pack_name: str, version: str, pack_path: Path, message:
 
     if not release_notes_path.exists():
         if message and tag:
-            release_content = f"#### {pack_name}\n\n- {message}\n"
-            with open(release_notes_path, "w", encoding="utf-8") as f:
-                f.write(release_content)
+            release_content = RELEASE_NOTES_MESSAGE_TEMPLATE.format(
+                pack_name=pack_name, message=message
+            )
+            write_atomic(release_notes_path, release_content.encode("utf-8"))
             click.echo(f"[OK] Created release notes: ReleaseNotes/{version_filename}")
             click.echo("[INFO] Release notes populated from commit message")
         else:
-            release_content = f"""#### Parsing Rules
-
-##### {pack_name} Parsing Rule
-
-- (Describe parsing rule changes here)
-
-#### Modeling Rules
-
-##### {pack_name} Modeling Rule
-
-- (Describe modelling rule changes here)
-
-#### Correlation Rules
-
-##### {pack_name} - (Rule Name)
-
-- (Describe correlation rule changes here)
-"""
-            with open(release_notes_path, "w", encoding="utf-8") as f:
-                f.write(release_content)
+            release_content = RELEASE_NOTES_TEMPLATE.format(pack_name=pack_name)
+            write_atomic(release_notes_path, release_content.encode("utf-8"))
             click.echo(f"[OK] Created release notes: ReleaseNotes/{version_filename}")
             click.echo("")
             click.echo("[INFO] Remember to update the release notes with your changes:")
@@ -234,13 +294,15 @@ def update_version_history(pack_name: str, pack_path: Path, version: str, commit
         version: Version string for the new entry (e.g. "1.2.3").
         commit_message: The commit message to use as the version history entry.
     """
+    from spellbook.fileio import write_atomic
+
     readme_path = pack_path / "README.md"
-    if not readme_path.exists():
+    try:
+        readme_content = readme_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         click.echo(f"[INFO] {pack_name}: README.md not found, skipping version history update")
         return
 
-    readme_content = readme_path.read_text(encoding="utf-8")
-
     start_marker = "<!-- spellbook:version-history:start -->"
     end_marker = "<!-- spellbook:version-history:end -->"
 
@@ -267,11 +329,50 @@ def update_version_history(pack_name: str, pack_path: Path, version: str, commit
         + readme_content[end_idx:]
     )
 
-    readme_path.write_text(new_content, encoding="utf-8")
+    write_atomic(readme_path, new_content.encode("utf-8"))
     click.echo(f"[OK] Updated version history in {pack_name}/README.md")
 
 
-def create_pack_tag(pack_name: str, version: str, pack_path: Path, command_name: str = "bump-version", message: str | None = None) -> bool:
+def get_git_identity() -> dict[str, str]:
+    """Read git user.name and user.email with a single git invocation.
+
+    Returns:
+        Dictionary with "user.name" and "user.email" keys; a key is
+        missing when the value is not configured. As with git config --get,
+        the last definition wins when a key is set in several config files.
+
+    Raises:
+        FileNotFoundError: If git is not installed.
+    """
+    result = subprocess.run(
+        ["git", "config", "--get-regexp", r"^user\.(name|email)$"],
+        capture_output=True, text=True, close_fds=False
+    )
+    identity = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        if value.strip():
+            identity[key] = value.strip()
+    return identity
+
+
+def _run_probe(cmd: list[str]) -> subprocess.CompletedProcess | None:
+    """Run an environment probe command, returning None if it is not installed."""
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True, close_fds=False)
+    except FileNotFoundError:
+        return None
+
+
+def _probe_git_identity() -> dict[str, str] | None:
+    """Return the git identity, or None if git is not installed."""
+    try:
+        return get_git_identity()
+    except FileNotFoundError:
+        return None
+
+
+def create_pack_tag(pack_name: str, version: str, pack_path: Path, command_name: str = "bump-version", message: str | None = None, version_manager: "VersionManager | None" = None) -> bool:
     """
     Stage all files in pack directory, commit, and create a Git tag.
     
@@ -281,24 +382,21 @@ def create_pack_tag(pack_name: str, version: str, pack_path: Path, command_name:
         pack_path: Path to the pack directory.
         command_name: Name of command for error messages.
         message: Optional custom commit message. If not provided, uses default format.
+        version_manager: Optional VersionManager whose tag cache is cleared
+            once the tag has been created.
     
     Returns:
         True if successful, False otherwise.
     """
     try:
-        git_user_name = subprocess.run(
-            ["git", "config", "--get", "user.name"],
-            capture_output=True, text=True
-        )
-        git_user_email = subprocess.run(
-            ["git", "config", "--get", "user.email"],
-            capture_output=True, text=True
-        )
+        identity = get_git_identity()
     except FileNotFoundError:
         click.echo("[WARN] Git not found, skipping tag creation")
         return False
+    git_user_name = identity.get("user.name")
+    git_user_email = identity.get("user.email")
     
-    if not git_user_name.stdout.strip() or not git_user_email.stdout.strip():
+    if not git_user_name or not git_user_email:
         click.echo("")
         click.echo("[ERROR] Git identity not configured")
         click.echo("")
@@ -306,18 +404,15 @@ def create_pack_tag(pack_name: str, version: str, pack_path: Path, command_name:
         click.echo("")
         click.echo("  Configuration           Status")
         click.echo("  ---------------------   ------")
-        name_status = "[OK] set" if git_user_name.stdout.strip() else "[MISSING]"
-        email_status = "[OK] set" if git_user_email.stdout.strip() else "[MISSING]"
+        name_status = "[OK] set" if git_user_name else "[MISSING]"
+        email_status = "[OK] set" if git_user_email else "[MISSING]"
         click.echo(f"  user.name               {name_status}")
         click.echo(f"  user.email              {email_status}")
         click.echo("")
-        click.echo("When using Docker, mount your git config:")
-        click.echo("")
-        click.echo("  docker run --rm \\")
-        click.echo("    -v $(pwd):/content \\")
-        click.echo("    -v ~/.gitconfig:/home/spellbook/.gitconfig:ro \\")
-        click.echo(f"    ghcr.io/gocortexio/spellbook {command_name} {pack_name} --tag")
-        click.echo("")
+        click.echo(
+            GIT_IDENTITY_DOCKER_HELP.format(command_name=command_name, pack_name=pack_name),
+            nl=False
+        )
         sys.exit(1)
     
     tag_name = f"{pack_name}-v{version}"
@@ -326,23 +421,28 @@ def create_pack_tag(pack_name: str, version: str, pack_path: Path, command_name:
             ["git", "add", str(pack_path)],
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            close_fds=False
         )
         commit_message = message if message else f"{pack_name} v{version}"
         subprocess.run(
             ["git", "commit", "-m", commit_message],
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            close_fds=False
         )
         click.echo(f"[OK] Committed: {commit_message}")
         subprocess.run(
             ["git", "tag", tag_name],
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            close_fds=False
         )
         click.echo(f"[OK] Created Git tag: {tag_name}")
+        if version_manager is not None:
+            version_manager.clear_tag_cache()
         click.echo(f"     Push with: git push && git push origin {tag_name}")
         return True
     except subprocess.CalledProcessError as e:
@@ -430,6 +530,8 @@ def init(instance_name, author, description, no_ci):
     and starter pack. The instance is independent from Spellbook
     and can be pushed to your own repository.
     """
+    from spellbook.instance import InstanceManager
+
     click.echo(f"Spellbook v{__version__}")
     click.echo("")
     manager = InstanceManager()
@@ -465,6 +567,8 @@ def init(instance_name, author, description, no_ci):
 @cli.command()
 def list_instances():
     """List all content instances."""
+    from spellbook.instance import InstanceManager
+
     manager = InstanceManager()
     instances = manager.list_instances()
 
@@ -474,8 +578,7 @@ def list_instances():
         return
 
     click.echo(f"Found {len(instances)} instance(s):\n")
-    for ws in instances:
-        click.echo(f"  - {ws}/")
+    click.echo("\n".join(f"  - {ws}/" for ws in instances))
 
 
 @cli.command()
@@ -487,6 +590,8 @@ def list_instances():
 )
 def list_packs(config):
     """List all discovered content packs."""
+    from spellbook.pack_builder import PackBuilder
+
     click.echo(f"Spellbook v{__version__}")
     click.echo("")
     builder = PackBuilder(config)
@@ -497,13 +602,14 @@ def list_packs(config):
         return
 
     click.echo(f"Found {len(packs)} pack(s):\n")
-    for pack in packs:
-        metadata = builder.read_pack_metadata(pack)
+    lines = []
+    for pack, metadata in builder.read_packs_metadata(packs).items():
         version = metadata.get("currentVersion", "unknown")
         description = metadata.get("description", "")[:50]
-        click.echo(f"  - {pack} (v{version})")
+        lines.append(f"  - {pack} (v{version})")
         if description:
-            click.echo(f"    {description}...")
+            lines.append(f"    {description}...")
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -520,27 +626,40 @@ def list_packs(config):
     default=True,
     help="Run validation before packaging."
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of packs to validate in parallel with --all (defaults to CPU count)."
+)
 @click.option(
     "--config",
     "-c",
     default="spellbook.yaml",
     help="Path to configuration file."
 )
-def build(pack_name, build_all, validate, config):
+def build(pack_name, build_all, validate, jobs, config):
     """Build and package content packs.
 
     Specify a PACK_NAME to build a single pack, or use --all to build
     all discovered packs. The version is read from pack_metadata.json.
     """
+    from spellbook.pack_builder import PackBuilder
+
     click.echo(f"Spellbook v{__version__}")
     builder = PackBuilder(config)
 
     if build_all:
         if validate:
+            from spellbook.xsiam_validator import XSIAMValidator, default_cache_path
+
+            xsiam_validator = XSIAMValidator(builder.packs_dir, cache_path=default_cache_path())
             for pack in builder.discover_packs():
-                run_xsiam_validation(builder.packs_dir, pack)
-        results = builder.build_all_packs(validate=validate)
-        success = sum(1 for r in results.values() if r is not None)
+                run_xsiam_validation(builder.packs_dir, pack, xsiam_validator)
+            xsiam_validator.save_cache()
+        results = builder.build_all_packs(validate=validate, jobs=jobs)
+        success = sum(r is not None for r in results.values())
         failed = len(results) - success
         click.echo(f"\nBuild complete: {success} succeeded, {failed} failed")
     elif pack_name:
@@ -568,21 +687,25 @@ def build(pack_name, build_all, validate, config):
 )
 def validate(pack_name, config):
     """Validate a content pack using demisto-sdk and XSIAM checks."""
+    from spellbook.pack_builder import PackBuilder
+    from spellbook.xsiam_validator import XSIAMValidator, default_cache_path
+
     builder = PackBuilder(config)
     builder.validate_pack_exists(pack_name)
     
     sdk_passed = builder.validate_pack(pack_name)
     
-    xsiam_validator = XSIAMValidator(builder.packs_dir)
+    xsiam_validator = XSIAMValidator(builder.packs_dir, cache_path=default_cache_path())
     xsiam_issues = xsiam_validator.validate_pack(pack_name)
-    xsiam_errors = [i for i in xsiam_issues if i.severity == "error"]
+    xsiam_validator.save_cache()
+    has_xsiam_errors = any(issue.severity == "error" for issue in xsiam_issues)
     
     if xsiam_issues:
         click.echo("")
         click.echo(xsiam_validator.format_issues(xsiam_issues))
         click.echo("")
     
-    if sdk_passed and not xsiam_errors:
+    if sdk_passed and not has_xsiam_errors:
         click.echo("[PASS] Validation passed")
     else:
         click.echo("[FAIL] Validation failed")
@@ -590,14 +713,28 @@ def validate(pack_name, config):
 
 
 @cli.command("validate-all")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of packs to validate in parallel (defaults to CPU count)."
+)
 @click.option(
     "--config",
     "-c",
     default="spellbook.yaml",
     help="Path to configuration file."
 )
-def validate_all(config):
-    """Validate all discovered content packs using demisto-sdk and XSIAM checks."""
+def validate_all(jobs, config):
+    """Validate all discovered content packs using demisto-sdk and XSIAM checks.
+
+    demisto-sdk runs for several packs at once; output is still printed
+    pack by pack in order.
+    """
+    from spellbook.pack_builder import PackBuilder
+    from spellbook.xsiam_validator import XSIAMValidator, default_cache_path
+
     builder = PackBuilder(config)
     packs = builder.discover_packs()
 
@@ -605,22 +742,21 @@ def validate_all(config):
         click.echo("No packs found.")
         return
 
-    xsiam_validator = XSIAMValidator(builder.packs_dir)
+    xsiam_validator = XSIAMValidator(builder.packs_dir, cache_path=default_cache_path())
     failed = []
     
-    for pack in packs:
-        click.echo(f"Validating {pack}...")
-        sdk_passed = builder.validate_pack(pack)
-        
+    for pack, sdk_passed in builder.validate_packs(packs, jobs=jobs):
         xsiam_issues = xsiam_validator.validate_pack(pack)
-        xsiam_errors = [i for i in xsiam_issues if i.severity == "error"]
+        has_xsiam_errors = any(issue.severity == "error" for issue in xsiam_issues)
         
         if xsiam_issues:
             click.echo(xsiam_validator.format_issues(xsiam_issues))
         
-        if not sdk_passed or xsiam_errors:
+        if not sdk_passed or has_xsiam_errors:
             failed.append(pack)
 
+    xsiam_validator.save_cache()
+
     if failed:
         click.echo(f"\n[FAIL] Validation failed for: {', '.join(failed)}")
         sys.exit(1)
@@ -659,6 +795,8 @@ def validate_all(config):
 )
 def create(pack_name, description, author, template, config):
     """Create a new content pack from template."""
+    from spellbook.pack_template import PackTemplate
+
     template_gen = PackTemplate(config)
     pack_path = template_gen.create_from_template(
         template,
@@ -678,9 +816,11 @@ def create(pack_name, description, author, template, config):
 )
 def version(pack_name, config):
     """Show version information for a pack."""
+    from spellbook.pack_builder import PackBuilder
+
     builder = PackBuilder(config)
     builder.validate_pack_exists(pack_name)
-    vm = VersionManager()
+    vm = builder.version_manager
 
     metadata = builder.read_pack_metadata(pack_name)
     current = metadata.get("currentVersion", "unknown")
@@ -689,9 +829,8 @@ def version(pack_name, config):
     click.echo(f"  Version:    {current}")
 
     if vm.is_git_repository():
-        latest_tag_version = vm.get_latest_version(pack_name)
-        if latest_tag_version != vm.DEFAULT_VERSION or vm.get_git_tags():
-            latest_tag = f"{pack_name}-v{latest_tag_version}"
+        if vm.pack_versions(pack_name):
+            latest_tag = vm.create_version_tag(pack_name, vm.get_latest_version(pack_name))
             click.echo(f"  Latest tag: {latest_tag}")
         else:
             click.echo("  Latest tag: (none)")
@@ -725,6 +864,8 @@ def set_version(pack_name, new_version, tag, message, config):
     Accepts version with or without 'v' prefix (e.g., 2.0.0 or v2.0.0).
     Use --tag to stage all pack files, commit, and create a Git tag.
     """
+    from spellbook.pack_builder import PackBuilder
+
     clean_version = normalise_version(new_version)
     
     if not validate_version_format(clean_version):
@@ -752,11 +893,10 @@ def set_version(pack_name, new_version, tag, message, config):
         check_git_repository("set-version")
     
     builder = PackBuilder(config)
-    builder.validate_pack_exists(pack_name)
+    pack_path = builder.validate_pack_exists(pack_name)
     builder.update_pack_version(pack_name, clean_version)
     click.echo(f"[OK] Set {pack_name} version to {clean_version}")
 
-    pack_path = builder.packs_dir / pack_name
     create_release_notes(pack_name, clean_version, pack_path, message, tag)
 
     run_xsiam_validation(builder.packs_dir, pack_name)
@@ -764,7 +904,10 @@ def set_version(pack_name, new_version, tag, message, config):
     if tag:
         commit_message = message if message else f"{pack_name} v{clean_version}"
         update_version_history(pack_name, pack_path, clean_version, commit_message)
-        create_pack_tag(pack_name, clean_version, pack_path, "set-version", message)
+        create_pack_tag(
+            pack_name, clean_version, pack_path, "set-version", message,
+            version_manager=builder.version_manager
+        )
 
 
 @cli.command("bump-version")
@@ -815,6 +958,8 @@ def bump_version(pack_name, major, minor, revision, tag, message, config):
 
     Use --tag to also create a Git tag for the new version.
     """
+    from spellbook.pack_builder import PackBuilder
+
     if message and not tag:
         click.echo("[ERROR] --message requires --tag")
         click.echo("")
@@ -829,7 +974,7 @@ def bump_version(pack_name, major, minor, revision, tag, message, config):
         check_git_repository("bump-version")
     
     builder = PackBuilder(config)
-    builder.validate_pack_exists(pack_name)
+    pack_path = builder.validate_pack_exists(pack_name)
 
     if major:
         increment_type = "major"
@@ -843,15 +988,12 @@ def bump_version(pack_name, major, minor, revision, tag, message, config):
 
     if tag:
         tag_version = builder.version_manager.get_latest_version(pack_name)
-        has_pack_tags = any(
-            builder.version_manager.parse_tag(t, pack_name)
-            for t in builder.version_manager.get_git_tags()
-        )
-        if has_pack_tags:
-            current_version = max(
-                [metadata_version, tag_version],
-                key=lambda v: builder.version_manager._version_tuple(v)
-            )
+        if builder.version_manager.pack_versions(pack_name):
+            version_tuple = builder.version_manager._version_tuple
+            if version_tuple(metadata_version) >= version_tuple(tag_version):
+                current_version = metadata_version
+            else:
+                current_version = tag_version
         else:
             current_version = metadata_version
     else:
@@ -864,7 +1006,6 @@ def bump_version(pack_name, major, minor, revision, tag, message, config):
     builder.update_pack_version(pack_name, new_version)
     click.echo(f"[OK] Bumped {pack_name} from {current_version} to {new_version}")
 
-    pack_path = builder.packs_dir / pack_name
     create_release_notes(pack_name, new_version, pack_path, message, tag)
 
     run_xsiam_validation(builder.packs_dir, pack_name)
@@ -872,7 +1013,10 @@ def bump_version(pack_name, major, minor, revision, tag, message, config):
     if tag:
         commit_message = message if message else f"{pack_name} v{new_version}"
         update_version_history(pack_name, pack_path, new_version, commit_message)
-        create_pack_tag(pack_name, new_version, pack_path, "bump-version", message)
+        create_pack_tag(
+            pack_name, new_version, pack_path, "bump-version", message,
+            version_manager=builder.version_manager
+        )
 
 
 @cli.command("rename-content")
@@ -890,6 +1034,8 @@ def rename_content(pack_name, config):
     mismatches. This command renames folders, files, and internal
     IDs in ModelingRules, ParsingRules, and CorrelationRules.
     """
+    from spellbook.pack_builder import PackBuilder
+
     click.echo("[INFO] The rename-content command is temporarily unavailable.")
     click.echo("")
     click.echo("This command is being improved to handle additional edge cases.")
@@ -905,16 +1051,14 @@ def rename_content(pack_name, config):
         return
 
     click.echo(f"Found {len(mismatched)} mismatched content item(s):")
-    for item in mismatched:
-        click.echo(f"  - {item}")
+    click.echo("\n".join(f"  - {item}" for item in mismatched))
     click.echo("")
 
     try:
         renamed = builder.rename_content(pack_name)
         if renamed:
             click.echo(f"[OK] Renamed {len(renamed)} item(s):")
-            for old, new in renamed.items():
-                click.echo(f"  {old} -> {new}")
+            click.echo("\n".join(f"  {old} -> {new}" for old, new in renamed.items()))
             click.echo("")
             click.echo("Content has been updated. You should now rebuild the pack:")
             click.echo(f"  gocortex-spellbook build {pack_name}")
@@ -964,6 +1108,8 @@ def upload(pack_path, xsiam, insecure, skip_validation, config):
     For XSIAM, also set:
       XSIAM_AUTH_ID    - Authentication ID from your instance
     """
+    from spellbook.pack_builder import PackBuilder
+
     base_url = os.environ.get("DEMISTO_BASE_URL")
     api_key = os.environ.get("DEMISTO_API_KEY")
     xsiam_auth_id = os.environ.get("XSIAM_AUTH_ID")
@@ -994,31 +1140,18 @@ def upload(pack_path, xsiam, insecure, skip_validation, config):
         click.echo("")
         click.echo("Example Docker command:")
         click.echo("")
-        if xsiam:
-            click.echo('  docker run --rm -v $(pwd):/content \\')
-            click.echo('    -e DEMISTO_BASE_URL="https://your-instance.xdr.paloaltonetworks.com" \\')
-            click.echo('    -e DEMISTO_API_KEY="your-api-key" \\')
-            click.echo('    -e XSIAM_AUTH_ID="your-auth-id" \\')
-            click.echo('    ghcr.io/gocortexio/spellbook upload Packs/MyPack --xsiam')
-        else:
-            click.echo('  docker run --rm -v $(pwd):/content \\')
-            click.echo('    -e DEMISTO_BASE_URL="https://your-instance.demisto.com" \\')
-            click.echo('    -e DEMISTO_API_KEY="your-api-key" \\')
-            click.echo('    ghcr.io/gocortexio/spellbook upload Packs/MyPack')
-        click.echo("")
-        click.echo("Or use an env file:")
-        click.echo("")
-        click.echo("  docker run --rm -v $(pwd):/content --env-file .env \\")
-        click.echo("    ghcr.io/gocortexio/spellbook upload Packs/MyPack")
-        click.echo("")
+        example = UPLOAD_XSIAM_DOCKER_EXAMPLE if xsiam else UPLOAD_DOCKER_EXAMPLE
+        click.echo(example + UPLOAD_ENV_FILE_HELP, nl=False)
         sys.exit(1)
 
     input_file = Path(pack_path)
-    if not input_file.exists():
+    try:
+        input_mode = input_file.stat().st_mode
+    except OSError:
         click.echo(f"[ERROR] Path not found: {pack_path}")
         sys.exit(1)
 
-    if not input_file.is_dir():
+    if not stat.S_ISDIR(input_mode):
         click.echo(f"[ERROR] Pack path must be a directory: {pack_path}")
         click.echo("")
         click.echo("Usage: upload Packs/MyPack --xsiam")
@@ -1043,37 +1176,6 @@ def upload(pack_path, xsiam, insecure, skip_validation, config):
         click.echo("")
 
     content_root = input_file.parent.parent.resolve()
-    git_dir = content_root / ".git"
-    git_initialised = False
-    
-    if not git_dir.exists():
-        click.echo("Setting up temporary git repository for upload...")
-        try:
-            subprocess.run(
-                ["git", "init"],
-                cwd=str(content_root),
-                capture_output=True,
-                check=True
-            )
-            git_initialised = True
-            subprocess.run(
-                ["git", "add", "-A"],
-                cwd=str(content_root),
-                capture_output=True,
-                check=True
-            )
-            subprocess.run(
-                ["git", "-c", "user.name=Spellbook", "-c", "user.email=spellbook@localhost",
-                 "commit", "-m", "Temporary commit for upload", "--allow-empty"],
-                cwd=str(content_root),
-                capture_output=True,
-                check=True
-            )
-        except subprocess.CalledProcessError as e:
-            click.echo(f"[WARN] Could not initialise git repository: {e}")
-
-    if not skip_validation:
-        run_xsiam_validation(input_file.parent, pack_name)
 
     cmd = ["demisto-sdk", "upload", "-i", str(input_file), "-z"]
 
@@ -1086,31 +1188,30 @@ def upload(pack_path, xsiam, insecure, skip_validation, config):
     if skip_validation:
         cmd.append("--skip-validation")
 
+    if not skip_validation:
+        run_xsiam_validation(input_file.parent, pack_name)
+
     click.echo(f"Uploading {pack_path}...")
     click.echo(f"Target: {base_url}")
 
-    try:
-        env = os.environ.copy()
-        env["CONTENT_PATH"] = str(content_root)
-        env["DEMISTO_SDK_CONTENT_PATH"] = str(content_root)
-        
-        result = subprocess.run(cmd, check=False, env=env, cwd=str(content_root))
-        if result.returncode == 0:
-            click.echo("[OK] Upload completed")
-        else:
-            click.echo("[FAIL] Upload failed")
-            sys.exit(result.returncode)
-    except FileNotFoundError:
-        click.echo("[ERROR] demisto-sdk not found")
-        click.echo("Install it with: pip install demisto-sdk")
-        sys.exit(1)
-    finally:
-        if git_initialised:
-            try:
-                import shutil
-                shutil.rmtree(git_dir)
-            except Exception:
-                pass
+    with builder.temporary_git_repo("upload", content_root=content_root):
+        try:
+            env = {
+                **os.environ,
+                "CONTENT_PATH": str(content_root),
+                "DEMISTO_SDK_CONTENT_PATH": str(content_root),
+            }
+
+            result = subprocess.run(cmd, check=False, env=env, cwd=str(content_root))
+            if result.returncode == 0:
+                click.echo("[OK] Upload completed")
+            else:
+                click.echo("[FAIL] Upload failed")
+                sys.exit(result.returncode)
+        except FileNotFoundError:
+            click.echo("[ERROR] demisto-sdk not found")
+            click.echo("Install it with: pip install demisto-sdk")
+            sys.exit(1)
 
 
 @cli.command(name="check-init")
@@ -1127,132 +1228,127 @@ def check_init(config):
     and ready for use. Run this command to troubleshoot issues before
     running other commands.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from spellbook.pack_builder import PackBuilder
+
+    # The probes are independent subprocesses; start them all now and
+    # collect the results in display order below.
+    executor = ThreadPoolExecutor(max_workers=3)
+    git_future = executor.submit(_run_probe, ["git", "--version"])
+    identity_future = executor.submit(_probe_git_identity)
+    sdk_future = executor.submit(_run_probe, ["demisto-sdk", "--version"])
+    executor.shutdown(wait=False)
+
     versions = get_version_info()
-    click.echo("")
-    click.echo("Spellbook Check-Init")
-    click.echo("====================")
-    click.echo("")
+    # Collect the report and write it in one go once all probes are in.
+    lines = []
+    lines.append("")
+    lines.append("Spellbook Check-Init")
+    lines.append("====================")
+    lines.append("")
     
-    click.echo("Version Information")
-    click.echo("-------------------")
-    click.echo(f"  spellbook-version: {versions['spellbook']}")
-    click.echo(f"  demisto-sdk-version: {versions['demisto_sdk']}")
-    click.echo(f"  python-version: {versions['python']}")
-    click.echo("")
+    lines.append("Version Information")
+    lines.append("-------------------")
+    lines.append(f"  spellbook-version: {versions['spellbook']}")
+    lines.append(f"  demisto-sdk-version: {versions['demisto_sdk']}")
+    lines.append(f"  python-version: {versions['python']}")
+    lines.append("")
     
     all_ok = True
     has_warnings = False
     
-    click.echo("Environment Checks")
-    click.echo("------------------")
+    lines.append("Environment Checks")
+    lines.append("------------------")
     
     config_file = Path(config)
     if config_file.exists():
-        click.echo(f"[OK] Configuration file: {config}")
+        lines.append(f"[OK] Configuration file: {config}")
     else:
-        click.echo(f"[FAIL] Configuration file: {config} (not found)")
+        lines.append(f"[FAIL] Configuration file: {config} (not found)")
         all_ok = False
     
     if config_file.exists():
         builder = PackBuilder(config)
         if builder.check_packs_dir_exists():
             packs = builder.discover_packs()
-            click.echo(f"[OK] Packs directory: {builder.packs_dir} ({len(packs)} pack(s))")
+            lines.append(f"[OK] Packs directory: {builder.packs_dir} ({len(packs)} pack(s))")
         else:
-            click.echo(f"[FAIL] Packs directory: {builder.packs_dir} (not found)")
+            lines.append(f"[FAIL] Packs directory: {builder.packs_dir} (not found)")
             all_ok = False
         
         if builder.artifacts_dir.exists():
-            click.echo(f"[OK] Artefacts directory: {builder.artifacts_dir}")
+            lines.append(f"[OK] Artefacts directory: {builder.artifacts_dir}")
         else:
-            click.echo(f"[INFO] Artefacts directory: {builder.artifacts_dir} (will be created)")
+            lines.append(f"[INFO] Artefacts directory: {builder.artifacts_dir} (will be created)")
     
-    try:
-        git_check = subprocess.run(["git", "--version"], capture_output=True, text=True)
-        if git_check.returncode == 0:
-            click.echo(f"[OK] Git: {git_check.stdout.strip()}")
-        else:
-            click.echo("[FAIL] Git: not found")
-            all_ok = False
-    except FileNotFoundError:
-        click.echo("[FAIL] Git: not found")
+    git_check = git_future.result()
+    if git_check and git_check.returncode == 0:
+        lines.append(f"[OK] Git: {git_check.stdout.strip()}")
+    else:
+        lines.append("[FAIL] Git: not found")
         all_ok = False
-        git_check = None
     
-    if git_check and git_check.returncode == 0:
-        try:
-            git_user_name = subprocess.run(
-                ["git", "config", "--get", "user.name"],
-                capture_output=True, text=True
-            )
-            git_user_email = subprocess.run(
-                ["git", "config", "--get", "user.email"],
-                capture_output=True, text=True
-            )
+    identity = identity_future.result()
+    if git_check and git_check.returncode == 0 and identity is not None:
+        git_user_name = identity.get("user.name")
+        git_user_email = identity.get("user.email")
+        
+        if git_user_name:
+            lines.append(f"[OK] Git user.name: {git_user_name}")
+        else:
+            lines.append("[WARN] Git user.name: not set (required for --tag)")
+            has_warnings = True
             
-            if git_user_name.stdout.strip():
-                click.echo(f"[OK] Git user.name: {git_user_name.stdout.strip()}")
-            else:
-                click.echo("[WARN] Git user.name: not set (required for --tag)")
-                has_warnings = True
-                
-            if git_user_email.stdout.strip():
-                click.echo(f"[OK] Git user.email: {git_user_email.stdout.strip()}")
-            else:
-                click.echo("[WARN] Git user.email: not set (required for --tag)")
-                has_warnings = True
-        except FileNotFoundError:
-            pass
-    
-    try:
-        sdk_check = subprocess.run(
-            ["demisto-sdk", "--version"],
-            capture_output=True, text=True
-        )
-        if sdk_check.returncode == 0:
-            click.echo(f"[OK] demisto-sdk: available")
+        if git_user_email:
+            lines.append(f"[OK] Git user.email: {git_user_email}")
         else:
-            click.echo("[FAIL] demisto-sdk: not found")
-            all_ok = False
-    except FileNotFoundError:
-        click.echo("[FAIL] demisto-sdk: not found")
+            lines.append("[WARN] Git user.email: not set (required for --tag)")
+            has_warnings = True
+    
+    sdk_check = sdk_future.result()
+    if sdk_check and sdk_check.returncode == 0:
+        lines.append(f"[OK] demisto-sdk: available")
+    else:
+        lines.append("[FAIL] demisto-sdk: not found")
         all_ok = False
     
-    click.echo("")
-    click.echo("Upload Environment Variables")
-    click.echo("----------------------------")
+    lines.append("")
+    lines.append("Upload Environment Variables")
+    lines.append("----------------------------")
     
     base_url = os.environ.get("DEMISTO_BASE_URL")
     api_key = os.environ.get("DEMISTO_API_KEY")
     xsiam_auth_id = os.environ.get("XSIAM_AUTH_ID")
     
     if base_url:
-        click.echo(f"[OK] DEMISTO_BASE_URL: {base_url[:30]}...")
+        lines.append(f"[OK] DEMISTO_BASE_URL: {base_url[:30]}...")
     else:
-        click.echo("[INFO] DEMISTO_BASE_URL: not set (required for upload)")
+        lines.append("[INFO] DEMISTO_BASE_URL: not set (required for upload)")
     
     if api_key:
-        click.echo("[OK] DEMISTO_API_KEY: set (hidden)")
+        lines.append("[OK] DEMISTO_API_KEY: set (hidden)")
     else:
-        click.echo("[INFO] DEMISTO_API_KEY: not set (required for upload)")
+        lines.append("[INFO] DEMISTO_API_KEY: not set (required for upload)")
     
     if xsiam_auth_id:
-        click.echo("[OK] XSIAM_AUTH_ID: set (hidden)")
+        lines.append("[OK] XSIAM_AUTH_ID: set (hidden)")
     else:
-        click.echo("[INFO] XSIAM_AUTH_ID: not set (required for XSIAM upload)")
+        lines.append("[INFO] XSIAM_AUTH_ID: not set (required for XSIAM upload)")
     
     upload_ready = base_url and api_key
     
-    click.echo("")
+    lines.append("")
     if not all_ok:
-        click.echo("[FAIL] Some checks failed - see above for details")
+        lines.append("[FAIL] Some checks failed - see above for details")
     elif has_warnings:
-        click.echo("[WARN] Ready for builds, but some items need attention")
+        lines.append("[WARN] Ready for builds, but some items need attention")
     elif not upload_ready:
-        click.echo("[INFO] Ready for local builds. Upload requires environment variables.")
+        lines.append("[INFO] Ready for local builds. Upload requires environment variables.")
     else:
-        click.echo("[OK] All checks passed")
-    click.echo("")
+        lines.append("[OK] All checks passed")
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 @cli.group()
@@ -1301,6 +1397,9 @@ def summon_correlation(pack_name, config):
       cat rules.json | spellbook summon correlation MyPack
       spellbook summon correlation MyPack < rules.json
     """
+    from spellbook.pack_builder import PackBuilder
+    from spellbook.content_importer import CorrelationImporter
+
     check_environment(config)
     builder = PackBuilder(config)
     builder.validate_pack_exists(pack_name)
@@ -1400,6 +1499,9 @@ def summon_template(template_name, pack_name, token_values, list_mode, config):
     Interactive mode (prompts for missing tokens):
         spellbook summon template intel_retrohunt MyPack
     """
+    from spellbook.pack_builder import PackBuilder
+    from spellbook.template_renderer import TemplateRenderer, list_templates
+
     click.echo(f"Spellbook v{__version__}")
     click.echo("")
 
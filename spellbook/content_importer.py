@@ -9,31 +9,75 @@ appropriate field transformations.
 """
 
 import json
+import os
+import pickle
 import re
-import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from .fileio import loads_json, uuid4_batch, write_file
+
+# Exports at least this large are rendered across worker processes.
+# Smaller ones finish quicker than a pool can start.
+PARALLEL_RENDER_MIN_RULES = 64
+
+# Rules sent to a worker process at a time
+PARALLEL_RENDER_CHUNK_SIZE = 16
+
+
+class _MultilineDumper(yaml.SafeDumper):
+    """
+    Safe dumper that writes multiline strings as literal blocks.
+
+    Built on the pure-Python emitter, so re-importing an export
+    reproduces the existing rule files byte for byte.
+    """
+
+
+def _represent_str(dumper: yaml.SafeDumper, data: str) -> yaml.ScalarNode:
+    """Represent strings containing newlines in literal block style."""
+    style = "|" if "\n" in data else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", data, style=style)
+
+
+_MultilineDumper.add_representer(str, _represent_str)
+
+
+def _render_rule_outcome(rule: dict, rule_id: str) -> Any:
+    """
+    Render one rule in a worker process.
+
+    Only the rule and its ID are pickled, not the importer. Errors
+    rendering the rule are returned rather than raised, so that anything
+    the pool itself raises is a pool failure.
+    """
+    return CorrelationImporter._outcome(CorrelationImporter._render_rule, rule, rule_id)
+
 
 class CorrelationImporter:
     """Import correlation rules from JSON exports to YAML files."""
 
-    FIELDS_TO_REMOVE = {
+    FIELDS_TO_REMOVE = frozenset({
         "rule_id",
         "simple_schedule",
         "lookup_mapping",
-    }
+    })
 
-    FIELDS_TO_PRESERVE_NULL = {
+    FIELDS_TO_PRESERVE_NULL = frozenset({
         "alert_type",
         "user_defined_severity",
         "user_defined_category",
-    }
+    })
+
+    # C0 control characters other than tab, line feed and carriage return
+    CONTROL_CHARACTERS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
 
     FIELDS_TO_ADD = {
-        "global_rule_id": lambda: str(uuid.uuid4()),
+        "global_rule_id": lambda: uuid4_batch(1)[0],
         "fromversion": lambda: "8.4.0",
     }
 
@@ -48,9 +92,9 @@ class CorrelationImporter:
     def import_from_json(self, json_content: str, pack_name: str) -> list[dict]:
         """Import correlation rules from JSON content.
 
-        Attempts strict JSON parsing first. If the content contains
-        unescaped control characters, retries with strict=False and
-        flags affected fields per rule.
+        Attempts strict JSON parsing first, using orjson when available.
+        If the content contains unescaped control characters, retries
+        with strict=False and flags affected fields per rule.
 
         Args:
             json_content: JSON string containing an array of correlation rules.
@@ -59,18 +103,11 @@ class CorrelationImporter:
         Returns:
             List of results with file paths and status.
         """
-        sanitised = False
         try:
-            rules = json.loads(json_content)
-        except json.JSONDecodeError as e:
-            if "control character" in str(e).lower() or "invalid control" in str(e).lower():
-                try:
-                    rules = json.loads(json_content, strict=False)
-                    sanitised = True
-                except json.JSONDecodeError as e2:
-                    raise ValueError(f"Invalid JSON: {e2}")
-            else:
-                raise ValueError(f"Invalid JSON: {e}")
+            rules = loads_json(json_content.encode("utf-8"))
+            sanitised = False
+        except ValueError:
+            rules, sanitised = self._parse_json_fallback(json_content)
 
         if not isinstance(rules, list):
             raise ValueError("JSON must be an array of correlation rules")
@@ -86,14 +123,17 @@ class CorrelationImporter:
         correlation_dir.mkdir(exist_ok=True)
 
         results = []
-        for i, rule in enumerate(rules, 1):
+        rendered = self._render_rules(rules)
+        for i, (rule, item) in enumerate(zip(rules, rendered), 1):
             try:
+                if isinstance(item, Exception):
+                    raise item
                 warnings = []
                 if sanitised:
                     affected = self._check_control_characters(rule)
                     if affected:
                         warnings.append(f"control characters found in: {', '.join(affected)}")
-                result = self._process_rule(rule, correlation_dir, i, len(rules))
+                result = self._write_rule(*item, correlation_dir, i, len(rules))
                 result["warnings"] = warnings
                 results.append(result)
             except Exception as e:
@@ -108,6 +148,28 @@ class CorrelationImporter:
 
         return results
 
+    def _parse_json_fallback(self, json_content: str) -> tuple[Any, bool]:
+        """Parse JSON with the standard library, tolerating control characters.
+
+        Used when the fast parser rejects the content, so that error
+        messages and the strict=False retry behave as they always have.
+
+        Args:
+            json_content: JSON string.
+
+        Returns:
+            Tuple of the parsed value and whether strict=False was needed.
+        """
+        try:
+            return json.loads(json_content), False
+        except json.JSONDecodeError as e:
+            if "control character" in str(e).lower() or "invalid control" in str(e).lower():
+                try:
+                    return json.loads(json_content, strict=False), True
+                except json.JSONDecodeError as e2:
+                    raise ValueError(f"Invalid JSON: {e2}")
+            raise ValueError(f"Invalid JSON: {e}")
+
     def _check_control_characters(self, rule: dict) -> list[str]:
         """Check which fields contain control characters.
 
@@ -117,40 +179,94 @@ class CorrelationImporter:
         Returns:
             List of field names containing control characters.
         """
-        affected = []
-        for key, value in rule.items():
-            if isinstance(value, str):
-                for ch in value:
-                    if ord(ch) < 32 and ch not in ('\n', '\r', '\t'):
-                        affected.append(key)
-                        break
-        return affected
-
-    def _process_rule(
-        self, rule: dict, output_dir: Path, index: int, total: int
-    ) -> dict:
-        """Process a single correlation rule.
+        return [
+            key for key, value in rule.items()
+            if isinstance(value, str) and self.CONTROL_CHARACTERS.search(value)
+        ]
+
+    def _render_rules(self, rules: list) -> list:
+        """Convert every rule to YAML, in input order.
+
+        Large exports are spread across a process pool, since cleaning
+        and dumping are CPU-bound. Files are not written here; the
+        caller writes them in order so that rules sharing a filename
+        behave exactly as they would serially.
+
+        Args:
+            rules: Rule dictionaries from JSON.
+
+        Returns:
+            One entry per rule: a (name, filename, yaml_content) tuple,
+            or the exception raised while rendering that rule.
+        """
+        rule_ids = uuid4_batch(len(rules))
+        if len(rules) >= PARALLEL_RENDER_MIN_RULES and (os.cpu_count() or 1) > 1:
+            # A pool that cannot start, loses a worker or cannot pickle
+            # its work falls back to rendering everything here
+            try:
+                with ProcessPoolExecutor() as executor:
+                    return list(executor.map(
+                        _render_rule_outcome, rules, rule_ids,
+                        chunksize=PARALLEL_RENDER_CHUNK_SIZE
+                    ))
+            except (OSError, NotImplementedError, BrokenProcessPool, pickle.PicklingError):
+                pass
+        return [
+            self._outcome(self._render_rule, rule, rule_id)
+            for rule, rule_id in zip(rules, rule_ids)
+        ]
+
+    @staticmethod
+    def _outcome(func, *args) -> Any:
+        """Call func, returning any exception it raises instead of raising it."""
+        try:
+            return func(*args)
+        except Exception as e:
+            return e
+
+    @classmethod
+    def _render_rule(cls, rule: dict, rule_id: str) -> tuple[str, str, str]:
+        """Clean a single correlation rule and convert it to YAML.
 
         Args:
             rule: Rule dictionary from JSON.
-            output_dir: Directory to write YAML file.
-            index: Rule index (1-based).
-            total: Total number of rules.
+            rule_id: global_rule_id to assign if the rule has none.
 
         Returns:
-            Result dictionary with status.
+            Tuple of rule name, target filename and YAML content.
         """
         name = rule.get("name")
         if not name:
             raise ValueError("Rule missing 'name' field")
 
-        cleaned_rule = self._clean_rule(rule)
-        filename = self._generate_filename(name)
+        cleaned_rule = cls._clean_rule(rule, global_rule_id=rule_id)
+        return name, cls._generate_filename(name), cls._to_yaml(cleaned_rule)
+
+    def _write_rule(
+        self,
+        name: str,
+        filename: str,
+        yaml_content: str,
+        output_dir: Path,
+        index: int,
+        total: int,
+    ) -> dict:
+        """Write a rendered correlation rule.
+
+        Args:
+            name: Rule name.
+            filename: Target filename.
+            yaml_content: Rendered YAML.
+            output_dir: Directory to write YAML file.
+            index: Rule index (1-based).
+            total: Total number of rules.
+
+        Returns:
+            Result dictionary with status.
+        """
         file_path = output_dir / filename
         overwritten = file_path.exists()
-
-        yaml_content = self._to_yaml(cleaned_rule)
-        file_path.write_text(yaml_content, encoding="utf-8")
+        write_file(file_path, yaml_content.encode("utf-8"))
 
         return {
             "index": index,
@@ -162,38 +278,47 @@ class CorrelationImporter:
             "overwritten": overwritten,
         }
 
-    def _clean_rule(self, rule: dict) -> dict:
+    @classmethod
+    def _clean_rule(cls, rule: dict, global_rule_id: str | None = None) -> dict:
         """Remove platform fields and add required fields.
 
         Args:
             rule: Original rule dictionary.
+            global_rule_id: Pre-generated ID to use if the rule has none.
+                A fresh UUID is generated when omitted.
 
         Returns:
             Cleaned rule dictionary.
         """
-        cleaned = {}
-
-        for key, value in rule.items():
-            if key in self.FIELDS_TO_REMOVE:
-                continue
-            if value is None and key not in self.FIELDS_TO_PRESERVE_NULL:
-                continue
-            cleaned[key] = self._normalise_line_endings(value, field_name=key)
+        remove = cls.FIELDS_TO_REMOVE
+        preserve_null = cls.FIELDS_TO_PRESERVE_NULL
+        cleaned = {
+            key: cls._normalise_line_endings(value, field_name=key)
+            for key, value in rule.items()
+            if key not in remove and (value is not None or key in preserve_null)
+        }
 
         if cleaned.get("severity") != "User Defined":
             cleaned.pop("user_defined_severity", None)
         if cleaned.get("alert_category") != "User Defined":
             cleaned.pop("user_defined_category", None)
 
-        for field_name, generator in self.FIELDS_TO_ADD.items():
+        if global_rule_id is not None:
+            cleaned.setdefault("global_rule_id", global_rule_id)
+        for field_name, generator in cls.FIELDS_TO_ADD.items():
             if field_name not in cleaned:
                 cleaned[field_name] = generator()
 
         return cleaned
 
-    XQL_FIELDS = {"xql_query", "search_query"}
+    XQL_FIELDS = frozenset({"xql_query", "search_query"})
 
-    def _normalise_line_endings(self, value: Any, field_name: str | None = None) -> Any:
+    # " - " and " " are rewritten; anything else outside [a-zA-Z0-9_-] is dropped
+    FILENAME_SUBSTITUTIONS = {" - ": "___", " ": "_"}
+    FILENAME_PATTERN = re.compile(r" - | |[^a-zA-Z0-9_\-]")
+
+    @classmethod
+    def _normalise_line_endings(cls, value: Any, field_name: str | None = None) -> Any:
         """Normalise line endings in string values.
 
         Strips carriage returns from all strings. For XQL query fields,
@@ -209,18 +334,19 @@ class CorrelationImporter:
         """
         if isinstance(value, str):
             result = value.replace("\r\n", "\n").replace("\r", "\n")
-            if field_name in self.XQL_FIELDS:
+            if field_name in cls.XQL_FIELDS:
                 result = re.sub(r"\n{2,}", "\n", result)
                 result = "\n".join(line.rstrip() for line in result.split("\n"))
                 result = result.strip()
             return result
         if isinstance(value, dict):
-            return {k: self._normalise_line_endings(v, field_name=k) for k, v in value.items()}
+            return {k: cls._normalise_line_endings(v, field_name=k) for k, v in value.items()}
         if isinstance(value, list):
-            return [self._normalise_line_endings(item, field_name=field_name) for item in value]
+            return [cls._normalise_line_endings(item, field_name=field_name) for item in value]
         return value
 
-    def _generate_filename(self, name: str) -> str:
+    @classmethod
+    def _generate_filename(cls, name: str) -> str:
         """Generate a valid filename from the rule name.
 
         Converts spaces to underscores, dashes to triple underscores,
@@ -232,12 +358,14 @@ class CorrelationImporter:
         Returns:
             Valid filename with .yml extension.
         """
-        filename = name.replace(" - ", "___")
-        filename = filename.replace(" ", "_")
-        filename = re.sub(r"[^a-zA-Z0-9_\-]", "", filename)
+        substitutions = cls.FILENAME_SUBSTITUTIONS
+        filename = cls.FILENAME_PATTERN.sub(
+            lambda match: substitutions.get(match.group(), ""), name
+        )
         return f"{filename}.yml"
 
-    def _to_yaml(self, data: dict) -> str:
+    @staticmethod
+    def _to_yaml(data: dict) -> str:
         """Convert dictionary to YAML string.
 
         Uses custom representer for multiline strings.
@@ -248,22 +376,9 @@ class CorrelationImporter:
         Returns:
             YAML string.
         """
-
-        class MultilineDumper(yaml.SafeDumper):
-            pass
-
-        def str_representer(dumper, data):
-            if "\n" in data:
-                return dumper.represent_scalar(
-                    "tag:yaml.org,2002:str", data, style="|"
-                )
-            return dumper.represent_scalar("tag:yaml.org,2002:str", data)
-
-        MultilineDumper.add_representer(str, str_representer)
-
         return yaml.dump(
             data,
-            Dumper=MultilineDumper,
+            Dumper=_MultilineDumper,
             default_flow_style=False,
             allow_unicode=True,
             sort_keys=False,
@@ -0,0 +1,185 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: GoCortexIO
+"""
+File I/O Helpers
+
+Shared JSON reading and writing for Spellbook modules. Uses orjson when
+it is installed (it ships with demisto-sdk) and falls back to the
+standard library otherwise. Both paths produce identical output.
+
+Also selects PyYAML's libyaml-backed safe loader when the installed
+PyYAML was built with it (the PyPI wheels are), falling back to the
+pure-Python class, and loads spellbook.yaml (or spellbook.json)
+configuration through a per-process cache. There is no matching dumper:
+libyaml's emitter formats some scalars differently, so YAML is written
+with yaml.SafeDumper to keep generated files stable.
+
+Random UUIDs for generated content IDs come from uuid4_batch.
+"""
+
+import copy
+import functools
+import json
+import os
+import stat
+import uuid
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as SafeYamlLoader
+except ImportError:
+    from yaml import SafeLoader as SafeYamlLoader
+
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def loads_json(data: bytes) -> Any:
+    """
+    Parse JSON from raw bytes.
+
+    A leading UTF-8 byte order mark is ignored.
+
+    Args:
+        data: Encoded JSON document.
+
+    Returns:
+        Parsed JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+        UnicodeDecodeError: If the document is not valid UTF-8 (stdlib
+            fallback only; orjson reports this as JSONDecodeError).
+    """
+    if data.startswith(UTF8_BOM):
+        data = data[len(UTF8_BOM):]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialise a value as two-space indented JSON with a trailing newline.
+
+    Non-ASCII characters are written as UTF-8 rather than escaped.
+
+    Args:
+        obj: JSON-serialisable value.
+
+    Returns:
+        Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n"
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config(path: str, mtime_ns: int) -> dict:
+    """Parse a configuration file, memoised on its path and mtime."""
+    if path.endswith(".json"):
+        with open(path, "rb") as f:
+            return loads_json(f.read()) or {}
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeYamlLoader) or {}
+
+
+def load_config(config_path: str | Path) -> dict:
+    """
+    Load a YAML configuration file, or a JSON one if the path ends in .json.
+
+    Parsed results are cached per process on the resolved path and
+    modification time, so loading the same configuration several times
+    (a PackBuilder and a PackTemplate in one command, say) only parses
+    the YAML once. Each caller gets its own copy to modify.
+
+    Args:
+        config_path: Path to the configuration file.
+
+    Returns:
+        Parsed configuration, or an empty dict if the file does not exist.
+    """
+    path = Path(config_path)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return {}
+    return copy.deepcopy(_parse_config(str(path.resolve()), st.st_mtime_ns))
+
+
+def write_file(path: str | Path, data: bytes) -> None:
+    """
+    Create or truncate a file and write data to it.
+
+    Uses a raw descriptor rather than a buffered file object, which
+    keeps bulk writes of many small files to open, write and close.
+
+    Args:
+        path: File to write.
+        data: Complete new contents.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Replace a file's contents in a single rename.
+
+    The data is written to a temporary file in the same directory and
+    moved over the target with os.replace, so readers (and an interrupted
+    run) see either the old file or the complete new one. The new file
+    keeps the permissions of the one it replaces, or the usual umask
+    defaults if there was none.
+
+    Args:
+        path: File to write.
+        data: Complete new contents.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666
+    tmp_path = path.with_name(f".{path.name}.{os.urandom(4).hex()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def uuid4_batch(count: int) -> list[str]:
+    """
+    Generate random (version 4) UUID strings from a single urandom read.
+
+    Args:
+        count: Number of UUIDs to generate
+
+    Returns:
+        count UUID strings in the usual 8-4-4-4-12 hex form
+    """
+    randbuf = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=randbuf[offset:offset + 16], version=4))
+        for offset in range(0, len(randbuf), 16)
+    ]
@@ -8,10 +8,19 @@ Creates and manages user content instances with their own Git structure.
 
 import os
 import shutil
+import string
 from pathlib import Path
 
 import yaml
 
+from .fileio import write_file
+
+
+RESOURCES_DIR = Path(__file__).parent / "resources"
+GITHUB_WORKFLOWS_DIR = RESOURCES_DIR / "github_workflows"
+GITLAB_CI_TEMPLATE = RESOURCES_DIR / "gitlab-ci.yml"
+INSTANCE_README_TEMPLATE = RESOURCES_DIR / "instance_readme.md"
+
 
 class InstanceManager:
     """Manages user content instances."""
@@ -58,15 +67,10 @@ class InstanceManager:
 
         self._create_packs_directory(instance_path)
 
-        if include_ci:
-            self._create_github_workflows(instance_path)
-            self._create_gitlab_workflows(instance_path)
-
-        self._create_spellbook_config(instance_path, author)
-
-        self._create_gitignore(instance_path)
-
-        self._create_readme(instance_path, name, description, include_ci)
+        self._write_files(
+            instance_path,
+            self._plan_files(name, author, description, include_ci),
+        )
 
         self._create_sample_pack(instance_path, author)
 
@@ -79,229 +83,58 @@ class InstanceManager:
         packs_dir = instance_path / "Packs"
         packs_dir.mkdir()
 
-    def _create_github_workflows(self, instance_path: Path) -> None:
-        """Copy GitHub workflow templates to instance."""
-        workflows_dir = instance_path / ".github" / "workflows"
-        workflows_dir.mkdir(parents=True)
-
-        build_workflow = '''name: Build Content Packs
-
-on:
-  push:
-    tags:
-      - '*-v*'
-  workflow_dispatch:
-    inputs:
-      pack_name:
-        description: 'Pack name to build (leave blank for all packs)'
-        required: false
-        default: ''
-
-jobs:
-  build:
-    name: Build Pack
-    runs-on: ubuntu-latest
-    steps:
-      - name: Checkout repository
-        uses: actions/checkout@v4
-        with:
-          fetch-depth: 0
-
-      - name: Build packs
-        run: |
-          mkdir -p artifacts
-          docker run --rm --user $(id -u):$(id -g) \\
-            -v ${{ github.workspace }}/Packs:/content/Packs \\
-            -v ${{ github.workspace }}/artifacts:/content/artifacts \\
-            -v ${{ github.workspace }}/spellbook.yaml:/content/spellbook.yaml \\
-            ghcr.io/gocortexio/spellbook:latest \\
-            build --all --no-validate
-
-      - name: Upload artefacts
-        uses: actions/upload-artifact@v4
-        with:
-          name: content-packs
-          path: artifacts/*.zip
-          retention-days: 30
-
-  release:
-    name: Create Release
-    needs: build
-    runs-on: ubuntu-latest
-    if: startsWith(github.ref, 'refs/tags/')
-    permissions:
-      contents: write
-    steps:
-      - name: Download artefacts
-        uses: actions/download-artifact@v4
-        with:
-          name: content-packs
-          path: release-artifacts
-
-      - name: Create release
-        uses: softprops/action-gh-release@v2
-        with:
-          files: release-artifacts/*.zip
-          generate_release_notes: true
-        env:
-          GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
-'''
-        conjure_path = workflows_dir / "conjure.yml"
-        with open(conjure_path, "w", encoding="utf-8") as f:
-            f.write(build_workflow)
-
-        validate_workflow = '''name: Validate Content Packs
-
-on:
-  pull_request:
-    paths:
-      - 'Packs/**'
-  push:
-    branches:
-      - main
-      - master
-    paths:
-      - 'Packs/**'
-
-jobs:
-  validate:
-    name: Validate Packs
-    runs-on: ubuntu-latest
-    steps:
-      - name: Checkout repository
-        uses: actions/checkout@v4
-
-      - name: Validate packs
-        run: |
-          docker run --rm \\
-            -v ${{ github.workspace }}/Packs:/content/Packs \\
-            -v ${{ github.workspace }}/spellbook.yaml:/content/spellbook.yaml \\
-            ghcr.io/gocortexio/spellbook:latest \\
-            validate-all
-'''
-        validate_path = workflows_dir / "validate.yml"
-        with open(validate_path, "w", encoding="utf-8") as f:
-            f.write(validate_workflow)
-
-    def _create_gitlab_workflows(self, instance_path: Path) -> None:
-        """Create GitLab CI/CD pipeline configuration."""
-        gitlab_ci = '''stages:
-  - validate
-  - build
-  - upload
-  - release
-
-variables:
-  DOCKER_DRIVER: overlay2
-
-validate_packs:
-  stage: validate
-  image: docker:25.0
-  services:
-    - docker:25.0-dind
-  rules:
-    - if: $CI_MERGE_REQUEST_ID
-      changes:
-        - Packs/**/*
-    - if: $CI_COMMIT_BRANCH =~ /^(main|master)$/
-      changes:
-        - Packs/**/*
-  script:
-    - |
-      docker run --rm \\
-        -v ${CI_PROJECT_DIR}/Packs:/content/Packs \\
-        -v ${CI_PROJECT_DIR}/spellbook.yaml:/content/spellbook.yaml \\
-        ghcr.io/gocortexio/spellbook:latest \\
-        validate-all
-
-build_pack:
-  stage: build
-  image: docker:25.0
-  services:
-    - docker:25.0-dind
-  rules:
-    - if: $CI_COMMIT_TAG =~ /.*-v.*/
-  before_script:
-    - mkdir -p artifacts
-    - chmod 777 artifacts
-  script:
-    - |
-      # Extract pack name and version from tag (e.g., SamplePack-v1.0.3)
-      PACK_NAME=$(echo "${CI_COMMIT_TAG}" | sed 's/-v[0-9].*$//')
-      PACK_VERSION=$(echo "${CI_COMMIT_TAG}" | sed 's/.*-v//')
-      echo "Building pack: ${PACK_NAME} version: ${PACK_VERSION}"
-      # Write variables to dotenv file for downstream jobs
-      echo "PACK_NAME=${PACK_NAME}" > build.env
-      echo "PACK_VERSION=${PACK_VERSION}" >> build.env
-      # Build the specific pack
-      docker run --rm \\
-        -v ${CI_PROJECT_DIR}/Packs:/content/Packs \\
-        -v ${CI_PROJECT_DIR}/artifacts:/content/artifacts \\
-        -v ${CI_PROJECT_DIR}/spellbook.yaml:/content/spellbook.yaml \\
-        ghcr.io/gocortexio/spellbook:latest \\
-        build "${PACK_NAME}" --no-validate
-      # Verify the zip was created
-      ls -la artifacts/
-  artifacts:
-    paths:
-      - artifacts/*.zip
-      - build.env
-    reports:
-      dotenv: build.env
-    expire_in: 30 days
-
-upload_to_registry:
-  stage: upload
-  image: curlimages/curl:latest
-  rules:
-    - if: $CI_COMMIT_TAG =~ /.*-v.*/
-  needs:
-    - job: build_pack
-      artifacts: true
-  script:
-    - |
-      ZIP_FILE="artifacts/${PACK_NAME}-v${PACK_VERSION}.zip"
-      if [ ! -f "${ZIP_FILE}" ]; then
-        echo "[ERROR] Expected file not found: ${ZIP_FILE}"
-        echo "Available files:"
-        ls -la artifacts/
-        exit 1
-      fi
-      echo "Uploading ${ZIP_FILE} to Package Registry..."
-      curl --header "JOB-TOKEN: ${CI_JOB_TOKEN}" \\
-           --upload-file "${ZIP_FILE}" \\
-           "${CI_API_V4_URL}/projects/${CI_PROJECT_ID}/packages/generic/content-packs/${PACK_VERSION}/${PACK_NAME}-v${PACK_VERSION}.zip"
-
-create_release:
-  stage: release
-  image: registry.gitlab.com/gitlab-org/release-cli:latest
-  rules:
-    - if: $CI_COMMIT_TAG =~ /.*-v.*/
-  needs:
-    - job: build_pack
-      artifacts: true
-    - job: upload_to_registry
-  script:
-    - echo "Creating release for ${CI_COMMIT_TAG}"
-  release:
-    tag_name: $CI_COMMIT_TAG
-    description: "Release ${CI_COMMIT_TAG}"
-    assets:
-      links:
-        - name: "${PACK_NAME}-v${PACK_VERSION}.zip"
-          url: "${CI_API_V4_URL}/projects/${CI_PROJECT_ID}/packages/generic/content-packs/${PACK_VERSION}/${PACK_NAME}-v${PACK_VERSION}.zip"
-          link_type: package
-'''
-        gitlab_ci_path = instance_path / ".gitlab-ci.yml"
-        with open(gitlab_ci_path, "w", encoding="utf-8") as f:
-            f.write(gitlab_ci)
-
-    def _create_spellbook_config(
+    def _plan_files(
         self,
-        instance_path: Path,
-        author: str
-    ) -> None:
-        """Create spellbook.yaml configuration file."""
+        name: str,
+        author: str,
+        description: str,
+        include_ci: bool
+    ) -> list[tuple[str, bytes]]:
+        """
+        Build the top-level files of a new instance without writing them.
+
+        Args:
+            name: Name of the instance folder.
+            author: Default author for packs.
+            description: Description of the instance.
+            include_ci: Whether to include CI/CD workflows.
+
+        Returns:
+            List of (path relative to the instance, contents) pairs.
+        """
+        plan = []
+        if include_ci:
+            for workflow in ("conjure.yml", "validate.yml"):
+                plan.append((
+                    f".github/workflows/{workflow}",
+                    (GITHUB_WORKFLOWS_DIR / workflow).read_bytes(),
+                ))
+            plan.append((".gitlab-ci.yml", GITLAB_CI_TEMPLATE.read_bytes()))
+
+        plan.append(("spellbook.yaml", self._spellbook_config_content(author).encode("utf-8")))
+        plan.append((".gitignore", self._gitignore_content().encode("utf-8")))
+        plan.append((
+            "README.md",
+            self._readme_content(name, description, include_ci).encode("utf-8"),
+        ))
+        return plan
+
+    def _write_files(self, instance_path: Path, plan: list[tuple[str, bytes]]) -> None:
+        """
+        Write planned files, creating each parent directory once.
+
+        Args:
+            instance_path: Root of the instance.
+            plan: List of (relative path, contents) pairs.
+        """
+        targets = [(instance_path / rel_path, data) for rel_path, data in plan]
+        for parent in {path.parent for path, _ in targets}:
+            parent.mkdir(parents=True, exist_ok=True)
+        for path, data in targets:
+            write_file(path, data)
+
+    def _spellbook_config_content(self, author: str) -> str:
+        """Render the spellbook.yaml configuration file."""
         config = {
             "packs_directory": "Packs",
             "artifacts_directory": "artifacts",
@@ -326,13 +159,11 @@ create_release:
             }
         }
 
-        config_path = instance_path / "spellbook.yaml"
-        with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        return yaml.dump(config, Dumper=yaml.SafeDumper, default_flow_style=False, sort_keys=False)
 
-    def _create_gitignore(self, instance_path: Path) -> None:
-        """Create .gitignore for the instance."""
-        gitignore_content = '''# Build artefacts
+    def _gitignore_content(self) -> str:
+        """Render the .gitignore for the instance."""
+        return '''# Build artefacts
 artifacts/
 *.zip
 
@@ -377,18 +208,14 @@ htmlcov/
 # Logs
 *.log
 '''
-        gitignore_path = instance_path / ".gitignore"
-        with open(gitignore_path, "w", encoding="utf-8") as f:
-            f.write(gitignore_content)
 
-    def _create_readme(
+    def _readme_content(
         self,
-        instance_path: Path,
         name: str,
         description: str,
         include_ci: bool = True
-    ) -> None:
-        """Create README.md for the instance."""
+    ) -> str:
+        """Render the README.md for the instance."""
         ci_structure = """|-- .github/workflows/      # CI/CD pipelines
 """ if include_ci else ""
 
@@ -410,103 +237,19 @@ git push origin PackName-v1.0.0
 ```
 """ if include_ci else ""
 
-        readme_content = f'''# {name}
-
-{description or "Cortex Platform content packs repository."}
-
-## Overview
-
-This repository contains Cortex Platform content packs built using GoCortex Spellbook.
-
-## Structure
-
-```
-{name}/
-|-- Packs/                  # Content packs
-|   +-- SamplePack/         # Starter pack with examples
-|       |-- pack_metadata.json
-|       |-- README.md
-|       |-- CorrelationRules/
-|       |-- ParsingRules/
-|       |-- ModelingRules/
-|       |-- XSIAMDashboards/
-|       +-- ReleaseNotes/
-{ci_structure}|-- artifacts/              # Built pack zip files
-+-- spellbook.yaml          # Build configuration
-```
-
-## Building Packs
-
-Build packs locally using Docker. The built zip files appear in the `artifacts/` directory.
-
-```bash
-# Build all packs (run from this directory)
-docker run --rm -v $(pwd):/content \\
-  ghcr.io/gocortexio/spellbook:latest build --all
-
-# Build a specific pack
-docker run --rm -v $(pwd):/content \\
-  ghcr.io/gocortexio/spellbook:latest build SamplePack
-
-# The zip files are created in artifacts/
-ls artifacts/
-```
-
-## Creating a New Pack
-
-```bash
-docker run --rm -v $(pwd):/content \\
-  ghcr.io/gocortexio/spellbook:latest create MyNewPack --description "My new pack"
-```
-
-## Validating Packs
-
-```bash
-# Validate all packs
-docker run --rm -v $(pwd):/content \\
-  ghcr.io/gocortexio/spellbook:latest validate-all
-
-# Validate a specific pack
-docker run --rm -v $(pwd):/content \\
-  ghcr.io/gocortexio/spellbook:latest validate SamplePack
-```
-{ci_section}
-## Uploading to Cortex Platform
-
-Upload packs directly to your Cortex Platform tenant. Set the environment variables first,
-then pass them through to Docker:
-
-```bash
-export DEMISTO_BASE_URL="https://your-instance.xdr.paloaltonetworks.com"
-export DEMISTO_API_KEY="your-api-key"
-export XSIAM_AUTH_ID="your-auth-id"
-
-docker run --rm -v $(pwd):/content \\
-  -v ~/.gitconfig:/home/spellbook/.gitconfig:ro \\
-  -e DEMISTO_BASE_URL \\
-  -e DEMISTO_API_KEY \\
-  -e XSIAM_AUTH_ID \\
-  ghcr.io/gocortexio/spellbook:latest upload Packs/SamplePack --xsiam
-```
-
-## References
-
-- Cortex Platform Content Pack Format: https://xsoar.pan.dev/docs/packs/packs-format
-'''
-        readme_path = instance_path / "README.md"
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write(readme_content)
+        template = string.Template(INSTANCE_README_TEMPLATE.read_text(encoding="utf-8"))
+        return template.substitute(
+            name=name,
+            description=description or "Cortex Platform content packs repository.",
+            ci_structure=ci_structure,
+            ci_section=ci_section,
+        )
 
     def _create_sample_pack(self, instance_path: Path, author: str = "") -> None:
         """Create a sample pack in the instance."""
         from .pack_template import PackTemplate
 
-        packs_dir = instance_path / "Packs"
-
-        template = PackTemplate.__new__(PackTemplate)
-        template.config = {}
-        template.packs_dir = packs_dir
-        template.defaults = {
+        template = PackTemplate.for_instance(instance_path / "Packs", {
             "support": "community",
             "author": author or "Your Organisation",
             "url": "",
@@ -516,7 +259,7 @@ docker run --rm -v $(pwd):/content \\
             "useCases": [],
             "keywords": [],
             "marketplaces": ["xsoar", "marketplacev2"]
-        }
+        })
 
         pack_path = template.create_pack(
             "SamplePack",
@@ -540,10 +283,11 @@ docker run --rm -v $(pwd):/content \\
         Returns:
             List of instance names.
         """
-        instances = []
-        for item in self.base_path.iterdir():
-            if item.is_dir():
-                if (item / "spellbook.yaml").exists():
-                    if (item / "Packs").exists():
-                        instances.append(item.name)
-        return instances
+        with os.scandir(self.base_path) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, "spellbook.yaml"))
+                and os.path.exists(os.path.join(entry.path, "Packs"))
+            ]
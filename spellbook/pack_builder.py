@@ -6,20 +6,140 @@ Pack Builder Module
 Handles discovery, validation, and packaging of Cortex Platform content packs.
 """
 
+import copy
+import functools
+import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
+import tempfile
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
 
 import click
 import yaml
 
+from .fileio import (
+    SafeYamlLoader,
+    dumps_json,
+    load_config,
+    loads_json,
+    write_atomic,
+    write_file,
+)
 from .version_manager import VersionManager
 
 
 EXCLUDED_PACKS = ["SamplePack"]
+METADATA_READ_WORKERS = 16
+NAMING_CONTENT_TYPES = ("ModelingRules", "ParsingRules", "CorrelationRules")
+CORRELATION_RULE_ID_LINE = re.compile(r"^global_rule_id:[^\n]*$", re.MULTILINE)
+CORRELATION_DATASET_LINE = re.compile(r"^dataset:[^\n]*$", re.MULTILINE)
+CORRELATION_QUERY_HEAD = re.compile(
+    r"^xql_query:[ \t]*\|(?P<chomp>[-+]?)[ \t]*\n(?P<indent> +)[^\n]*", re.MULTILINE
+)
+PACKAGE_SKIP_DIRS = frozenset({
+    "__pycache__",
+    ".git",
+    ".venv",
+    ".pytest_cache",
+    ".mypy_cache",
+    "node_modules",
+})
+PACKAGE_SKIP_SUFFIXES = (".pyc", ".pyo")
+PACKAGE_READ_WORKERS = 8
+PACKAGE_READ_AHEAD = 16
+# Stored files above this size are streamed in PACKAGE_COPY_CHUNK pieces
+# rather than read ahead whole
+PACKAGE_STREAM_MIN_SIZE = 1024 * 1024
+PACKAGE_COPY_CHUNK = 1024 * 1024
+# Files modified this close to the time a .zip.stamp is taken are
+# fingerprinted by content as well, as a later edit in the same
+# timestamp tick would leave their mtime and size unchanged
+PACKAGE_RACY_WINDOW_NS = 2_000_000_000
+# validation.skip_checks names and the demisto-sdk validate flags they map to
+SKIP_CHECK_FLAGS = {
+    "pack-dependencies": "--skip-pack-dependencies",
+    "pack-release-notes": "--skip-pack-release-notes",
+    "conf-json": "--no-conf-json",
+    "docker-checks": "--no-docker-checks",
+}
+ZIP_COMPRESSION = {
+    "deflated": zipfile.ZIP_DEFLATED,
+    "stored": zipfile.ZIP_STORED,
+}
+
+
+def _resolve_jobs(jobs: int | None, task_count: int) -> int:
+    """Return the worker count for a pool, capped at the number of tasks."""
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, task_count))
+
+
+def _remove_tree(path: str) -> None:
+    """
+    Delete a directory tree, ignoring errors.
+
+    On POSIX the system rm is used: a freshly written Git object store
+    holds one file per object, and rm unlinks those far faster than a
+    per-entry Python walk. shutil.rmtree is the fallback.
+    """
+    if os.name == "posix":
+        try:
+            subprocess.run(
+                ["rm", "-rf", "--", path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
+        except OSError:
+            pass
+        if not os.path.lexists(path):
+            return
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _scan_content_naming(
+    pack_path: str,
+    pack_name: str,
+    signature: tuple[int | None, ...]
+) -> tuple[str, ...]:
+    """
+    List content items whose names do not start with the pack name.
+
+    Memoised on the content directories' mtimes (``signature``), which
+    change whenever an entry in them is created, removed or renamed.
+    """
+    mismatched = []
+
+    for content_type in NAMING_CONTENT_TYPES:
+        try:
+            entries = os.scandir(os.path.join(pack_path, content_type))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    checked = name
+                else:
+                    checked, extension = os.path.splitext(name)
+                    if extension not in (".yml", ".yaml") or not entry.is_file():
+                        continue
+                if not checked.startswith(pack_name):
+                    mismatched.append(os.path.join(content_type, name))
+
+    return tuple(mismatched)
 
 
 class PackBuilder:
@@ -76,13 +196,83 @@ class PackBuilder:
             self.config.get("version_tag_pattern", "{pack_name}-v{version}")
         )
 
+        self._metadata_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+        self._packs_cache: tuple[int, dict[str, int], list[str]] | None = None
+        self._skip_check_flags: list[str] | None = None
+
+    @functools.cached_property
+    def content_root(self) -> Path:
+        """
+        Absolute path of the content repository (the packs directory's parent).
+
+        Resolved once per builder. Callers must not rely on it tracking
+        later changes to packs_dir.
+        """
+        return self.packs_dir.parent.resolve()
+
+    @functools.cached_property
+    def sdk_env(self) -> dict[str, str]:
+        """
+        Environment for demisto-sdk subprocesses, pointing it at content_root.
+
+        Built once per builder and shared by every call, so callers must
+        not modify it.
+        """
+        content_root = str(self.content_root)
+        return {
+            **os.environ,
+            "CONTENT_PATH": content_root,
+            "DEMISTO_SDK_CONTENT_PATH": content_root,
+        }
+
+    def _resolve_skip_check_flags(self) -> list[str]:
+        """
+        demisto-sdk validate flags for the configured validation.skip_checks.
+
+        Worked out once per builder, so each unknown name is warned
+        about once rather than on every validation run. The validation
+        entry points call this before printing anything else, so the
+        warnings come ahead of any validation output.
+
+        Returns:
+            The flags, in the order configured.
+
+        Raises:
+            SystemExit: If validation.skip_checks is not a list.
+        """
+        if self._skip_check_flags is not None:
+            return self._skip_check_flags
+        skip_checks = self.config.get("validation", {}).get("skip_checks", [])
+        if skip_checks is None:
+            skip_checks = []
+        if not isinstance(skip_checks, list):
+            click.echo(
+                f"[ERROR] validation.skip_checks must be a list of check names, "
+                f"not {type(skip_checks).__name__} ({skip_checks!r})"
+            )
+            raise SystemExit(1)
+        flags = []
+        seen = []
+        for check in skip_checks:
+            if check in seen:
+                continue
+            seen.append(check)
+            if isinstance(check, str) and check in SKIP_CHECK_FLAGS:
+                flags.append(SKIP_CHECK_FLAGS[check])
+            else:
+                click.echo(f"[WARN] Unknown validation.skip_checks entry '{check}'")
+        self._skip_check_flags = flags
+        return flags
+
     def _load_config(self, config_path: str) -> dict:
-        """Load configuration from YAML file."""
-        path = Path(config_path)
-        if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
-        return {}
+        """
+        Load configuration from YAML file.
+
+        Parsed results are cached per process (see fileio.load_config), so
+        constructing several builders for the same configuration only
+        parses the YAML once.
+        """
+        return load_config(config_path)
     
     def check_config_exists(self) -> bool:
         """Check if the configuration file exists."""
@@ -96,23 +286,60 @@ class PackBuilder:
         """
         Discover all content packs in the packs directory.
 
+        The result is memoised on the modification times of the packs
+        directory, which changes whenever a pack directory is added,
+        removed or renamed, and of each candidate directory in it, which
+        changes whenever its pack_metadata.json is created or removed.
+
         Returns:
             List of pack names found.
         """
-        if not self.packs_dir.exists():
+        try:
+            mtime_ns = os.stat(self.packs_dir).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
             return []
+        if self._packs_cache is not None and self._packs_cache[0] == mtime_ns:
+            if self._candidates_unchanged(self._packs_cache[1]):
+                return list(self._packs_cache[2])
 
-        packs = []
         exclude = self.config.get("exclude_packs", [])
         exclude_set = set(exclude + EXCLUDED_PACKS)
 
-        for item in self.packs_dir.iterdir():
-            if item.is_dir() and item.name not in exclude_set:
-                metadata_file = item / "pack_metadata.json"
-                if metadata_file.exists():
-                    packs.append(item.name)
+        candidates = {}
+        packs = []
+        try:
+            with os.scandir(self.packs_dir) as entries:
+                for entry in entries:
+                    if entry.name in exclude_set or not entry.is_dir():
+                        continue
+                    candidates[entry.name] = entry.stat().st_mtime_ns
+                    if os.path.exists(os.path.join(entry.path, "pack_metadata.json")):
+                        packs.append(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
 
-        return sorted(packs)
+        packs.sort()
+        self._packs_cache = (mtime_ns, candidates, packs)
+        return list(packs)
+
+    def _candidates_unchanged(self, candidates: dict[str, int]) -> bool:
+        """
+        Check the candidate pack directories seen by discover_packs.
+
+        Args:
+            candidates: Directory name to modification time, as recorded.
+
+        Returns:
+            True if every directory still has its recorded mtime.
+        """
+        packs_dir = str(self.packs_dir)
+        for name, mtime_ns in candidates.items():
+            try:
+                if os.stat(os.path.join(packs_dir, name)).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
 
     def get_pack_path(self, pack_name: str) -> Path:
         """Get the full path to a pack directory."""
@@ -128,17 +355,19 @@ class PackBuilder:
         Returns:
             True if pack exists with pack_metadata.json, False otherwise.
         """
-        pack_path = self.get_pack_path(pack_name)
-        metadata_path = pack_path / "pack_metadata.json"
-        return pack_path.exists() and metadata_path.exists()
+        metadata_path = self.get_pack_path(pack_name) / "pack_metadata.json"
+        return metadata_path.exists()
 
-    def validate_pack_exists(self, pack_name: str) -> None:
+    def validate_pack_exists(self, pack_name: str) -> Path:
         """
         Validate that a pack exists, raising a friendly error if not.
 
         Args:
             pack_name: Name of the pack to validate.
 
+        Returns:
+            Path to the pack directory.
+
         Raises:
             SystemExit: If pack does not exist.
         """
@@ -150,6 +379,7 @@ class PackBuilder:
             else:
                 click.echo("No packs found in Packs/ directory")
             raise SystemExit(1)
+        return self.get_pack_path(pack_name)
 
     def read_pack_metadata(self, pack_name: str) -> dict:
         """
@@ -162,16 +392,50 @@ class PackBuilder:
             Dictionary containing pack metadata.
         """
         metadata_path = self.get_pack_path(pack_name) / "pack_metadata.json"
-        if metadata_path.exists():
-            try:
-                with open(metadata_path, "r", encoding="utf-8-sig") as f:
-                    content = f.read()
-                if content.strip():
-                    return json.loads(content)
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                click.echo(f"[WARN] {metadata_path}: could not parse ({e})")
+        try:
+            stat = metadata_path.stat()
+        except FileNotFoundError:
+            return {"name": pack_name, "currentVersion": "1.0.0"}
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._metadata_cache.get(pack_name)
+        if cached and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
+        try:
+            content = metadata_path.read_bytes()
+            if content.strip():
+                metadata = loads_json(content)
+                self._metadata_cache[pack_name] = (signature, metadata)
+                return copy.deepcopy(metadata)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            click.echo(f"[WARN] {metadata_path}: could not parse ({e})")
         return {"name": pack_name, "currentVersion": "1.0.0"}
 
+    def read_packs_metadata(self, pack_names: list[str]) -> dict[str, dict]:
+        """
+        Read metadata for several packs at once.
+
+        Files are read on a small thread pool so that slow filesystems
+        (network mounts, Docker bind mounts) are not hit one file at a time.
+
+        Args:
+            pack_names: Names of the packs to read.
+
+        Returns:
+            Dictionary mapping pack names to their metadata, in the order
+            given.
+        """
+        if len(pack_names) < 2:
+            return {name: self.read_pack_metadata(name) for name in pack_names}
+
+        workers = min(METADATA_READ_WORKERS, len(pack_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(
+                pack_names,
+                executor.map(self.read_pack_metadata, pack_names)
+            ))
+
     def update_pack_metadata(
         self,
         pack_name: str,
@@ -192,9 +456,12 @@ class PackBuilder:
             
         metadata.update(updates)
 
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
-            f.write("\n")
+        write_atomic(metadata_path, dumps_json(metadata))
+
+        self._metadata_cache.pop(pack_name, None)
+        # A newly written pack_metadata.json can turn a directory into a pack
+        # without changing the packs directory's mtime.
+        self._packs_cache = None
 
     def update_pack_version(
         self,
@@ -217,90 +484,357 @@ class PackBuilder:
         self.update_pack_metadata(pack_name, {"currentVersion": version})
         return version
 
-    def validate_pack(self, pack_name: str) -> bool:
+    def _validation_enabled(self) -> bool:
+        """Check whether demisto-sdk validation is enabled in the config."""
+        return self.config.get("validation", {}).get("enabled", True)
+
+    @contextmanager
+    def temporary_git_repo(
+        self,
+        purpose: str = "validation",
+        content_root: Path | None = None
+    ) -> Iterator[None]:
         """
-        Validate a pack using demisto-sdk.
+        Provide a throwaway Git repository for the duration of the block.
+
+        demisto-sdk expects the content root to be a Git repository with at
+        least one commit. If the content root has no .git entry, one is
+        initialised and committed on entry and removed again on exit. An
+        existing repository is left untouched.
+
+        The repository data lives in a scratch directory under the system
+        temp dir; only a small .git pointer file is written into the
+        content root, so object writes and cleanup never touch (possibly
+        bind-mounted) content.
+
+        Args:
+            purpose: Operation name used in console output.
+            content_root: Directory to initialise. Defaults to the parent
+                of the packs directory.
+        """
+        if content_root is None:
+            content_root = self.content_root
+        git_file = content_root / ".git"
+        scratch_dir = None
+        try:
+            if not git_file.exists():
+                click.echo(f"Setting up temporary git repository for {purpose}...")
+                scratch_dir = tempfile.mkdtemp(prefix="spellbook-", suffix=".git")
+                try:
+                    subprocess.run(
+                        ["git", "init", f"--separate-git-dir={scratch_dir}"],
+                        cwd=str(content_root),
+                        capture_output=True,
+                        check=True,
+                        close_fds=False
+                    )
+                    subprocess.run(
+                        ["git", "add", "-A"],
+                        cwd=str(content_root),
+                        capture_output=True,
+                        check=True,
+                        close_fds=False
+                    )
+                    subprocess.run(
+                        ["git", "-c", "user.name=Spellbook", "-c", "user.email=spellbook@localhost",
+                         "commit", "-m", f"Temporary commit for {purpose}", "--allow-empty"],
+                        cwd=str(content_root),
+                        capture_output=True,
+                        check=True,
+                        close_fds=False
+                    )
+                except subprocess.CalledProcessError as e:
+                    click.echo(f"[WARN] Could not initialise git repository: {e}")
+            yield
+        finally:
+            if scratch_dir is not None:
+                try:
+                    git_file.unlink()
+                except FileNotFoundError:
+                    pass
+                _remove_tree(scratch_dir)
+
+    def _run_sdk_validate(self, pack_name: str) -> subprocess.CompletedProcess | None:
+        """
+        Run demisto-sdk validate on a pack and capture its output.
+
+        Produces no console output, so it is safe to call from worker
+        threads. The caller reports the result with _report_validation.
 
         Args:
             pack_name: Name of the pack to validate.
 
         Returns:
-            True if validation passed, False otherwise.
+            The completed process, or None if demisto-sdk is not installed.
         """
-        validation_config = self.config.get("validation", {})
-        if not validation_config.get("enabled", True):
-            click.echo(f"Validation disabled, skipping {pack_name}")
-            return True
+        return self._run_sdk_validate_paths([self.get_pack_path(pack_name)])
 
-        pack_path = self.get_pack_path(pack_name)
-        content_root = pack_path.parent.parent.resolve()
-        
-        git_dir = content_root / ".git"
-        git_initialised = False
-        if not git_dir.exists():
-            click.echo("Setting up temporary git repository for validation...")
-            try:
-                subprocess.run(
-                    ["git", "init"],
-                    cwd=str(content_root),
-                    capture_output=True,
-                    check=True
-                )
-                git_initialised = True
-                subprocess.run(
-                    ["git", "add", "-A"],
-                    cwd=str(content_root),
-                    capture_output=True,
-                    check=True
-                )
-                subprocess.run(
-                    ["git", "-c", "user.name=Spellbook", "-c", "user.email=spellbook@localhost",
-                     "commit", "-m", "Temporary commit for validation", "--allow-empty"],
-                    cwd=str(content_root),
-                    capture_output=True,
-                    check=True
-                )
-            except subprocess.CalledProcessError as e:
-                click.echo(f"[WARN] Could not initialise git repository: {e}")
-        
-        cmd = ["demisto-sdk", "validate", "-i", str(pack_path)]
+    def _run_sdk_validate_paths(
+        self,
+        pack_paths: list[Path],
+        stream: bool = False
+    ) -> subprocess.CompletedProcess | None:
+        """
+        Run a single demisto-sdk validate over one or more pack paths.
 
-        skip_checks = validation_config.get("skip_checks", [])
-        for check in skip_checks:
-            cmd.extend(["--skip-pack-dependencies"])
+        Args:
+            pack_paths: Pack directories passed to demisto-sdk as a
+                comma-separated -i value.
+            stream: Echo demisto-sdk's output line by line as it runs
+                instead of capturing it. The returned process then has
+                empty stdout and stderr.
 
-        env = os.environ.copy()
-        env["CONTENT_PATH"] = str(content_root)
-        env["DEMISTO_SDK_CONTENT_PATH"] = str(content_root)
+        Returns:
+            The completed process, or None if demisto-sdk is not installed.
+        """
+        content_root = self.content_root
+
+        cmd = [
+            "demisto-sdk", "validate",
+            "-i", ",".join(str(pack_path) for pack_path in pack_paths),
+            *self._resolve_skip_check_flags(),
+        ]
+
+        if stream:
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    env=self.sdk_env,
+                    cwd=str(content_root)
+                )
+            except FileNotFoundError:
+                return None
+            with proc:
+                for line in proc.stdout:
+                    click.echo(line, nl=False)
+            return subprocess.CompletedProcess(cmd, proc.returncode, "", "")
 
         try:
-            result = subprocess.run(
+            return subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                env=env,
+                env=self.sdk_env,
                 cwd=str(content_root)
             )
-            click.echo(result.stdout, nl=False)
-            if result.stderr:
-                click.echo(result.stderr, nl=False)
-            
-            if result.returncode == 0:
-                click.echo(f"Validation passed for {pack_name}")
-                self._check_gitkeep_files(pack_name)
-                return True
-            else:
-                click.echo(f"Validation failed for {pack_name}")
-                return False
         except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _echo_sdk_output(result: subprocess.CompletedProcess) -> None:
+        """Print the captured output of a demisto-sdk run."""
+        click.echo(result.stdout, nl=False)
+        if result.stderr:
+            click.echo(result.stderr, nl=False)
+
+    def _report_validation(
+        self,
+        pack_name: str,
+        result: subprocess.CompletedProcess | None
+    ) -> bool:
+        """
+        Print the outcome of a demisto-sdk validate run.
+
+        Args:
+            pack_name: Name of the validated pack.
+            result: Value returned by _run_sdk_validate.
+
+        Returns:
+            True if validation passed or was skipped, False otherwise.
+        """
+        if result is None:
             click.echo("demisto-sdk not found, skipping validation")
             return True
-        finally:
-            if git_initialised:
-                try:
-                    shutil.rmtree(git_dir)
-                except Exception:
-                    pass
+
+        self._echo_sdk_output(result)
+
+        if result.returncode == 0:
+            click.echo(f"Validation passed for {pack_name}")
+            self._check_gitkeep_files(pack_name)
+            return True
+
+        click.echo(f"Validation failed for {pack_name}")
+        return False
+
+    def validate_pack(self, pack_name: str) -> bool:
+        """
+        Validate a pack using demisto-sdk.
+
+        Args:
+            pack_name: Name of the pack to validate.
+
+        Returns:
+            True if validation passed, False otherwise.
+        """
+        if not self._validation_enabled():
+            click.echo(f"Validation disabled, skipping {pack_name}")
+            return True
+
+        self._resolve_skip_check_flags()
+        with self.temporary_git_repo("validation"):
+            result = self._run_sdk_validate_paths(
+                [self.get_pack_path(pack_name)], stream=True
+            )
+        return self._report_validation(pack_name, result)
+
+    def _iter_sdk_validations(
+        self,
+        pack_names: list[str],
+        jobs: int | None = None
+    ) -> Iterator[tuple[str, subprocess.CompletedProcess | None]]:
+        """
+        Run demisto-sdk validate for several packs concurrently.
+
+        The temporary Git repository is set up once for the whole batch.
+        Results are yielded in the order of pack_names as each completes.
+
+        Args:
+            pack_names: Names of the packs to validate.
+            jobs: Maximum number of concurrent demisto-sdk processes.
+                Defaults to the number of CPUs.
+
+        Yields:
+            Tuples of pack name and the value returned by _run_sdk_validate.
+        """
+        workers = _resolve_jobs(jobs, len(pack_names))
+        with self.temporary_git_repo("validation"):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._run_sdk_validate, pack_name)
+                    for pack_name in pack_names
+                ]
+                for pack_name, future in zip(pack_names, futures):
+                    yield pack_name, future.result()
+
+    def _validate_batch(self, pack_names: list[str]) -> set[str] | None:
+        """
+        Validate several packs in a single demisto-sdk run.
+
+        Only runs when validation.batch is enabled (the default) and there
+        is more than one pack. Must be called inside temporary_git_repo.
+        The combined output is printed only if the run passes. If it
+        fails, the packs its output names are the ones to validate
+        individually, so their errors are reported per pack; the rest
+        passed. A failed run whose output names no pack leaves every
+        pack to validate individually.
+
+        Args:
+            pack_names: Names of the packs to validate.
+
+        Returns:
+            Names of the packs that still need validating individually
+            (empty if the batch passed), or None if demisto-sdk is not
+            installed (validation skipped).
+        """
+        batch = self.config.get("validation", {}).get("batch", True)
+        if not batch or len(pack_names) < 2:
+            return set(pack_names)
+
+        click.echo(f"Validating {len(pack_names)} packs in a single demisto-sdk run...")
+        result = self._run_sdk_validate_paths(
+            [self.get_pack_path(pack_name) for pack_name in pack_names]
+        )
+        if result is None:
+            click.echo("demisto-sdk not found, skipping validation")
+            return None
+
+        if result.returncode == 0:
+            self._echo_sdk_output(result)
+            return set()
+
+        failed = self._packs_in_output(result, pack_names)
+        if not failed:
+            click.echo("[INFO] Batch validation did not pass, validating packs individually")
+            return set(pack_names)
+        names = ", ".join(pack_name for pack_name in pack_names if pack_name in failed)
+        click.echo(f"[INFO] Batch validation did not pass, validating {names} individually")
+        return failed
+
+    def _packs_in_output(
+        self,
+        result: subprocess.CompletedProcess,
+        pack_names: list[str]
+    ) -> set[str]:
+        """
+        Find which of the given packs a demisto-sdk run's output mentions.
+
+        demisto-sdk reports each problem against a file path, relative
+        to the content root or absolute, so a pack is mentioned when a
+        path inside it ("Packs/<name>/...") appears in the output.
+
+        Args:
+            result: Completed demisto-sdk run.
+            pack_names: Packs that were validated.
+
+        Returns:
+            Names of the packs mentioned.
+        """
+        output = result.stdout + (result.stderr or "")
+        path_pattern = re.compile(
+            rf"(?:^|[\\/\s'\"(\[])"
+            rf"{re.escape(self.packs_dir.name)}[\\/]([^\\/\s:'\")\]]+)",
+            re.MULTILINE
+        )
+        wanted = set(pack_names)
+        return {
+            match[1] for match in path_pattern.finditer(output)
+            if match[1] in wanted
+        }
+
+    def validate_packs(
+        self,
+        pack_names: list[str],
+        jobs: int | None = None
+    ) -> Iterator[tuple[str, bool]]:
+        """
+        Validate several packs using demisto-sdk in parallel.
+
+        All packs are first validated in one demisto-sdk run (unless
+        validation.batch is false). If that run fails, demisto-sdk runs
+        again, concurrently, only for the packs its output blames (or for
+        every pack if it blames none); each pack's result is printed in
+        order, so the console log reads the same as a serial run.
+
+        Args:
+            pack_names: Names of the packs to validate.
+            jobs: Maximum number of concurrent demisto-sdk processes.
+                Defaults to the number of CPUs.
+
+        Yields:
+            Tuples of pack name and whether validation passed.
+        """
+        if not self._validation_enabled():
+            for pack_name in pack_names:
+                click.echo(f"Validating {pack_name}...")
+                click.echo(f"Validation disabled, skipping {pack_name}")
+                yield pack_name, True
+            return
+
+        # Settle the demisto-sdk flags, and warn about them, up front
+        self._resolve_skip_check_flags()
+        with self.temporary_git_repo("validation"):
+            pending = self._validate_batch(pack_names)
+            if pending is None:
+                for pack_name in pack_names:
+                    click.echo(f"Validating {pack_name}...")
+                    yield pack_name, True
+                return
+
+            rechecked = self._iter_sdk_validations(
+                [pack_name for pack_name in pack_names if pack_name in pending], jobs
+            )
+            for pack_name in pack_names:
+                click.echo(f"Validating {pack_name}...")
+                if pack_name in pending:
+                    _, result = next(rechecked)
+                    yield pack_name, self._report_validation(pack_name, result)
+                else:
+                    click.echo(f"Validation passed for {pack_name}")
+                    self._check_gitkeep_files(pack_name)
+                    yield pack_name, True
 
     def _check_gitkeep_files(self, pack_name: str) -> None:
         """
@@ -331,7 +865,15 @@ class PackBuilder:
         Package a pack into a zip file.
 
         Creates a zip archive containing all files and directories in the pack,
-        matching the format expected by demisto-sdk upload.
+        matching the format expected by demisto-sdk upload. Tooling caches
+        and bytecode (PACKAGE_SKIP_DIRS, or packaging.exclude_dirs, and
+        PACKAGE_SKIP_SUFFIXES) are left out.
+
+        A digest of each file's path, mtime and size (plus the compression
+        settings) is kept in a .zip.stamp file next to the archive, along
+        with the time it was taken. Files modified within
+        PACKAGE_RACY_WINDOW_NS of that time are hashed by content too. If
+        the zip exists and the digest still matches, it is not rebuilt.
 
         Args:
             pack_name: Name of the pack to package.
@@ -357,6 +899,19 @@ class PackBuilder:
             click.echo(f"No output directory configured for {pack_name}")
             return None
 
+        compression_name = packaging_config.get("compression", "deflated")
+        compression = ZIP_COMPRESSION.get(compression_name)
+        if compression is None:
+            click.echo(
+                f"[ERROR] Unknown packaging.compression '{compression_name}' "
+                f"(expected one of: {', '.join(ZIP_COMPRESSION)})"
+            )
+            return None
+        compresslevel = None
+        if compression == zipfile.ZIP_DEFLATED:
+            compresslevel = packaging_config.get("compression_level")
+        skip_dirs = frozenset(packaging_config.get("exclude_dirs", PACKAGE_SKIP_DIRS))
+
         output_dir.mkdir(parents=True, exist_ok=True)
 
         metadata = self.read_pack_metadata(pack_name)
@@ -365,23 +920,168 @@ class PackBuilder:
         zip_name = f"{pack_name}-v{version}.zip"
         zip_path = output_dir / zip_name
 
+        stamp_path = zip_path.with_suffix(".zip.stamp")
+
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(pack_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, pack_path)
+            pack_root = str(pack_path)
+            entries = []
+            stats = []
+            for root, dirs, files in os.walk(pack_root):
+                dirs[:] = [d for d in dirs if d not in skip_dirs]
+                for file in files:
+                    if file.endswith(PACKAGE_SKIP_SUFFIXES):
+                        continue
+                    file_path = os.path.join(root, file)
+                    arcname = os.path.relpath(file_path, pack_root)
+                    st = os.stat(file_path)
+                    entries.append((file_path, arcname))
+                    stats.append((arcname, file_path, st.st_mtime_ns, st.st_size))
+            stats.sort()
+
+            stamp = self._read_stamp(stamp_path) if zip_path.exists() else None
+            if stamp is not None:
+                recorded_digest, stamp_time_ns = stamp
+                if self._package_digest(
+                    (compression, compresslevel), stats, stamp_time_ns
+                ) == recorded_digest:
+                    click.echo(f"Package up to date: {zip_path}")
+                    return zip_path
+
+            stamp_time_ns = time.time_ns()
+            digest = self._package_digest(
+                (compression, compresslevel), stats, stamp_time_ns
+            )
+
+            # Drop the old stamp first: if this write is interrupted, the
+            # partial zip must not be taken for an up-to-date one
+            stamp_path.unlink(missing_ok=True)
+            with zipfile.ZipFile(
+                zip_path, 'w', compression, compresslevel=compresslevel
+            ) as zipf:
+                if compression == zipfile.ZIP_STORED and len(entries) > 1:
+                    self._write_prefetched(zipf, entries)
+                else:
+                    for file_path, arcname in entries:
                         zipf.write(file_path, arcname)
+            write_file(stamp_path, f"{digest} {stamp_time_ns}".encode("ascii"))
 
             click.echo(f"Created package: {zip_path}")
             return zip_path
 
         except Exception as e:
             click.echo(f"Failed to create package for {pack_name}: {e}")
-            if zip_path.exists():
-                zip_path.unlink()
+            for path in (zip_path, stamp_path):
+                if path.exists():
+                    path.unlink()
+            return None
+
+    @staticmethod
+    def _package_digest(
+        settings: tuple,
+        stats: list[tuple[str, str, int, int]],
+        stamp_time_ns: int
+    ) -> str:
+        """
+        Digest the files package_pack would write into a zip.
+
+        Args:
+            settings: The compression and compression level.
+            stats: (arcname, path, mtime_ns, size) per file, sorted.
+            stamp_time_ns: Time the stamp is (or was) taken at.
+
+        Returns:
+            The hex digest recorded in the .zip.stamp file.
+        """
+        racy_after_ns = stamp_time_ns - PACKAGE_RACY_WINDOW_NS
+        fingerprint = [settings]
+        for arcname, file_path, mtime_ns, size in stats:
+            entry = (arcname, mtime_ns, size)
+            if mtime_ns > racy_after_ns:
+                with open(file_path, "rb") as f:
+                    entry += (hashlib.file_digest(f, "blake2b").hexdigest(),)
+            fingerprint.append(entry)
+        return hashlib.blake2b(
+            repr(fingerprint).encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    @staticmethod
+    def _read_stamp(stamp_path: Path) -> tuple[str, int] | None:
+        """
+        Read the digest and time recorded by the last package_pack run.
+
+        Args:
+            stamp_path: Stamp file written next to the zip.
+
+        Returns:
+            The recorded digest and stamp time, or None if there is no
+            readable stamp.
+        """
+        try:
+            digest, stamp_time_ns = stamp_path.read_text(encoding="ascii").split()
+            return digest, int(stamp_time_ns)
+        except (OSError, UnicodeDecodeError, ValueError):
             return None
 
+    @staticmethod
+    def _write_prefetched(
+        zipf: zipfile.ZipFile,
+        entries: list[tuple[str, str]]
+    ) -> None:
+        """
+        Add files to a stored (uncompressed) zip while reading ahead.
+
+        Without compression, writing an entry is a plain copy, so file
+        reads dominate. Worker threads read up to PACKAGE_READ_AHEAD files
+        ahead of the writer, which adds them to the archive in order.
+        Files larger than PACKAGE_STREAM_MIN_SIZE are not held in memory;
+        the writer copies them in PACKAGE_COPY_CHUNK pieces instead of
+        zipfile's default 8 KiB.
+
+        Args:
+            zipf: Archive open for writing with ZIP_STORED.
+            entries: (file path, archive name) pairs in archive order.
+        """
+        def read_entry(
+            file_path: str,
+            arcname: str
+        ) -> tuple[zipfile.ZipInfo, bytes | None]:
+            info = zipfile.ZipInfo.from_file(file_path, arcname)
+            if info.file_size > PACKAGE_STREAM_MIN_SIZE:
+                return info, None
+            with open(file_path, "rb") as f:
+                return info, f.read()
+
+        def add_entry(file_path: str, info: zipfile.ZipInfo, data: bytes | None) -> None:
+            if data is not None:
+                zipf.writestr(info, data, compress_type=zipfile.ZIP_STORED)
+                return
+            with open(file_path, "rb") as src, zipf.open(info, "w") as dest:
+                shutil.copyfileobj(src, dest, PACKAGE_COPY_CHUNK)
+
+        workers = _resolve_jobs(PACKAGE_READ_WORKERS, len(entries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for file_path, arcname in entries:
+                pending.append((
+                    file_path, executor.submit(read_entry, file_path, arcname)
+                ))
+                if len(pending) >= PACKAGE_READ_AHEAD:
+                    path, future = pending.popleft()
+                    add_entry(path, *future.result())
+            while pending:
+                path, future = pending.popleft()
+                add_entry(path, *future.result())
+
+    def _print_build_header(self, pack_name: str) -> None:
+        """Print the banner shown at the start of a pack build."""
+        click.echo(f"\n{'='*60}")
+        click.echo(f"Building pack: {pack_name}")
+        click.echo(f"{'='*60}")
+
+        metadata = self.read_pack_metadata(pack_name)
+        version = metadata.get("currentVersion", "1.0.0")
+        click.echo(f"Version: {version}")
+
     def build_pack(
         self,
         pack_name: str,
@@ -397,13 +1097,7 @@ class PackBuilder:
         Returns:
             Path to created zip file, or None if build failed.
         """
-        click.echo(f"\n{'='*60}")
-        click.echo(f"Building pack: {pack_name}")
-        click.echo(f"{'='*60}")
-
-        metadata = self.read_pack_metadata(pack_name)
-        version = metadata.get("currentVersion", "1.0.0")
-        click.echo(f"Version: {version}")
+        self._print_build_header(pack_name)
 
         if validate:
             if not self.validate_pack(pack_name):
@@ -414,13 +1108,21 @@ class PackBuilder:
 
     def build_all_packs(
         self,
-        validate: bool = True
+        validate: bool = True,
+        jobs: int | None = None
     ) -> dict[str, Path | None]:
         """
         Build all discovered packs.
 
+        When validating, all packs are first validated in one demisto-sdk
+        run (unless validation.batch is false). If that run fails,
+        demisto-sdk runs for several packs concurrently while finished
+        packs are packaged in order on the calling thread.
+
         Args:
             validate: Whether to run validation.
+            jobs: Maximum number of concurrent demisto-sdk processes.
+                Defaults to the number of CPUs.
 
         Returns:
             Dictionary mapping pack names to their zip file paths.
@@ -428,11 +1130,32 @@ class PackBuilder:
         packs = self.discover_packs()
         results = {}
 
-        for pack_name in packs:
-            results[pack_name] = self.build_pack(
-                pack_name,
-                validate=validate
-            )
+        if not validate or not self._validation_enabled():
+            for pack_name in packs:
+                results[pack_name] = self.build_pack(
+                    pack_name,
+                    validate=validate
+                )
+            return results
+
+        with self.temporary_git_repo("validation"):
+            batch_passed = self._validate_batch(packs)
+            if batch_passed is not False:
+                for pack_name in packs:
+                    self._print_build_header(pack_name)
+                    if batch_passed:
+                        click.echo(f"Validation passed for {pack_name}")
+                        self._check_gitkeep_files(pack_name)
+                    results[pack_name] = self.package_pack(pack_name)
+                return results
+
+            for pack_name, result in self._iter_sdk_validations(packs, jobs):
+                self._print_build_header(pack_name)
+                if not self._report_validation(pack_name, result):
+                    click.echo(f"Build failed for {pack_name}: validation errors")
+                    results[pack_name] = None
+                    continue
+                results[pack_name] = self.package_pack(pack_name)
 
         return results
 
@@ -440,6 +1163,11 @@ class PackBuilder:
         """
         Check if content items have mismatched naming.
 
+        Only the entries directly inside each content directory are
+        inspected, so the result is memoised on those directories'
+        modification times and rescanned only after something is added,
+        removed or renamed.
+
         Args:
             pack_name: Name of the pack to check.
 
@@ -450,23 +1178,18 @@ class PackBuilder:
         if not pack_path.exists():
             return []
 
-        mismatched = []
-        content_types = ["ModelingRules", "ParsingRules", "CorrelationRules"]
-
-        for content_type in content_types:
-            content_dir = pack_path / content_type
-            if not content_dir.exists():
-                continue
-
-            for item in content_dir.iterdir():
-                if item.is_dir():
-                    if not item.name.startswith(pack_name):
-                        mismatched.append(str(item.relative_to(pack_path)))
-                elif item.is_file() and item.suffix in [".yml", ".yaml"]:
-                    if not item.stem.startswith(pack_name):
-                        mismatched.append(str(item.relative_to(pack_path)))
+        signature = []
+        for content_type in NAMING_CONTENT_TYPES:
+            try:
+                signature.append((pack_path / content_type).stat().st_mtime_ns)
+            except FileNotFoundError:
+                signature.append(None)
 
-        return mismatched
+        return list(_scan_content_naming(
+            str(pack_path.resolve()),
+            pack_name,
+            tuple(signature)
+        ))
 
     def rename_content(self, pack_name: str) -> dict[str, str]:
         """
@@ -499,84 +1222,88 @@ class PackBuilder:
 
     def _rename_modeling_rules(self, pack_path: Path, pack_name: str) -> dict[str, str]:
         """Rename ModelingRules content to match pack name."""
-        renamed = {}
-        rules_dir = pack_path / "ModelingRules"
-        if not rules_dir.exists():
-            return renamed
+        return self._rename_rule_folders(
+            pack_path / "ModelingRules",
+            f"{pack_name}ModelingRule",
+            pack_name,
+            "modeling",
+            "_schema.json"
+        )
 
-        new_rule_id = f"{pack_name}ModelingRule"
-        new_folder = rules_dir / new_rule_id
+    def _rename_parsing_rules(self, pack_path: Path, pack_name: str) -> dict[str, str]:
+        """Rename ParsingRules content to match pack name."""
+        return self._rename_rule_folders(
+            pack_path / "ParsingRules",
+            f"{pack_name}ParsingRule",
+            pack_name,
+            "parsing",
+            "_samples.json"
+        )
 
-        for item in list(rules_dir.iterdir()):
-            if item.is_dir() and item.name != new_rule_id:
-                old_name = item.name
-                old_id = old_name
-
-                for f in list(item.iterdir()):
-                    if f.suffix == ".yml":
-                        self._update_yaml_id(f, new_rule_id, pack_name, "modeling")
-                        new_fname = f"{new_rule_id}.yml"
-                        if f.name != new_fname:
-                            new_path = f.parent / new_fname
-                            f.rename(new_path)
-                            renamed[f.name] = new_fname
-                    elif f.suffix == ".xif":
-                        new_fname = f"{new_rule_id}.xif"
-                        if f.name != new_fname:
-                            new_path = f.parent / new_fname
-                            f.rename(new_path)
-                            renamed[f.name] = new_fname
-                    elif f.name.endswith("_schema.json"):
-                        new_fname = f"{new_rule_id}_schema.json"
-                        if f.name != new_fname:
-                            new_path = f.parent / new_fname
-                            f.rename(new_path)
-                            renamed[f.name] = new_fname
-
-                if item.name != new_rule_id:
-                    item.rename(new_folder)
-                    renamed[old_name] = new_rule_id
+    def _rename_rule_folders(
+        self,
+        rules_dir: Path,
+        new_rule_id: str,
+        pack_name: str,
+        rule_type: str,
+        json_suffix: str
+    ) -> dict[str, str]:
+        """
+        Rename modelling or parsing rule folders and their files.
 
-        return renamed
+        Each rule folder's YAML is updated in place, then its .yml, .xif
+        and JSON companion files are renamed to new_rule_id, followed by
+        the folder itself. Renames are planned first and applied in one
+        pass, skipping any that would not change the name.
 
-    def _rename_parsing_rules(self, pack_path: Path, pack_name: str) -> dict[str, str]:
-        """Rename ParsingRules content to match pack name."""
+        Args:
+            rules_dir: ModelingRules or ParsingRules directory.
+            new_rule_id: New rule ID, used for file and folder names.
+            pack_name: Name of the pack.
+            rule_type: "modeling" or "parsing".
+            json_suffix: Suffix of the rule's JSON companion file.
+
+        Returns:
+            Dictionary mapping old names to new names.
+        """
         renamed = {}
-        rules_dir = pack_path / "ParsingRules"
         if not rules_dir.exists():
             return renamed
 
-        new_rule_id = f"{pack_name}ParsingRule"
-        new_folder = rules_dir / new_rule_id
+        rules_root = str(rules_dir)
+        new_folder = os.path.join(rules_root, new_rule_id)
+        renames = {
+            ".yml": f"{new_rule_id}.yml",
+            ".xif": f"{new_rule_id}.xif",
+        }
+        new_json = f"{new_rule_id}{json_suffix}"
 
         for item in list(rules_dir.iterdir()):
-            if item.is_dir() and item.name != new_rule_id:
-                old_name = item.name
-
-                for f in list(item.iterdir()):
-                    if f.suffix == ".yml":
-                        self._update_yaml_id(f, new_rule_id, pack_name, "parsing")
-                        new_fname = f"{new_rule_id}.yml"
-                        if f.name != new_fname:
-                            new_path = f.parent / new_fname
-                            f.rename(new_path)
-                            renamed[f.name] = new_fname
-                    elif f.suffix == ".xif":
-                        new_fname = f"{new_rule_id}.xif"
-                        if f.name != new_fname:
-                            new_path = f.parent / new_fname
-                            f.rename(new_path)
-                            renamed[f.name] = new_fname
-                    elif f.name.endswith("_samples.json"):
-                        new_fname = f"{new_rule_id}_samples.json"
-                        if f.name != new_fname:
-                            new_path = f.parent / new_fname
-                            f.rename(new_path)
-                            renamed[f.name] = new_fname
-
-                if item.name != new_rule_id:
-                    item.rename(new_folder)
-                    renamed[old_name] = new_rule_id
+            if not item.is_dir() or item.name == new_rule_id:
+                continue
+
+            item_path = str(item)
+            moves = []
+            with os.scandir(item_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    extension = os.path.splitext(name)[1]
+                    if extension in renames:
+                        if extension == ".yml":
+                            self._update_yaml_id(Path(entry.path), new_rule_id, pack_name, rule_type)
+                        new_fname = renames[extension]
+                    elif name.endswith(json_suffix):
+                        new_fname = new_json
+                    else:
+                        continue
+                    if name != new_fname:
+                        moves.append((entry.path, os.path.join(item_path, new_fname)))
+                        renamed[name] = new_fname
+
+            for src, dst in moves:
+                os.rename(src, dst)
+            os.rename(item_path, new_folder)
+            renamed[item.name] = new_rule_id
 
         return renamed
 
@@ -587,43 +1314,115 @@ class PackBuilder:
         if not rules_dir.exists():
             return renamed
 
-        for item in list(rules_dir.iterdir()):
-            if item.is_file() and item.suffix in [".yml", ".yaml"]:
-                with open(item, "r", encoding="utf-8") as f:
-                    content = yaml.safe_load(f)
-
-                if content:
-                    old_id = content.get("global_rule_id", "")
-                    if old_id and not old_id.startswith(pack_name):
-                        rule_suffix = old_id.split("_", 1)[-1] if "_" in old_id else "Rule"
-                        new_id = f"{pack_name}_{rule_suffix}"
-                        content["global_rule_id"] = new_id
-
-                        vendor = pack_name.lower()
-                        if "dataset" in content:
-                            content["dataset"] = f"{vendor}_raw"
-                        if "xql_query" in content:
-                            old_query = content["xql_query"]
-                            lines = old_query.split("\n")
-                            if lines and lines[0].strip().startswith("dataset"):
-                                lines[0] = f"  dataset = {vendor}_raw"
-                            content["xql_query"] = "\n".join(lines)
-
-                        with open(item, "w", encoding="utf-8") as f:
-                            yaml.dump(content, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
-                        new_fname = f"{new_id}.yml"
-                        if item.name != new_fname:
-                            new_path = item.parent / new_fname
-                            item.rename(new_path)
-                            renamed[item.name] = new_fname
+        rules_root = str(rules_dir)
+        with os.scandir(rules_root) as it:
+            entries = [
+                entry for entry in it
+                if entry.is_file()
+                and os.path.splitext(entry.name)[1] in (".yml", ".yaml")
+            ]
+
+        for entry in entries:
+            with open(entry.path, encoding="utf-8") as f:
+                text = f.read()
+            content = yaml.load(text, Loader=SafeYamlLoader)
+
+            if content:
+                old_id = content.get("global_rule_id", "")
+                if old_id and not old_id.startswith(pack_name):
+                    rule_suffix = old_id.split("_", 1)[-1] if "_" in old_id else "Rule"
+                    new_id = f"{pack_name}_{rule_suffix}"
+                    content["global_rule_id"] = new_id
+
+                    vendor = pack_name.lower()
+                    query_changed = False
+                    if "dataset" in content:
+                        content["dataset"] = f"{vendor}_raw"
+                    if "xql_query" in content:
+                        old_query = content["xql_query"]
+                        lines = old_query.split("\n")
+                        if lines and lines[0].strip().startswith("dataset"):
+                            lines[0] = f"  dataset = {vendor}_raw"
+                            query_changed = True
+                        content["xql_query"] = "\n".join(lines)
+
+                    edited = self._edit_correlation_rule_text(
+                        text, content, new_id, vendor, query_changed
+                    )
+                    with open(entry.path, "w", encoding="utf-8") as f:
+                        if edited is not None:
+                            f.write(edited)
+                        else:
+                            yaml.dump(content, f, Dumper=yaml.SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+                    new_fname = f"{new_id}.yml"
+                    if entry.name != new_fname:
+                        os.rename(entry.path, os.path.join(rules_root, new_fname))
+                        renamed[entry.name] = new_fname
 
         return renamed
 
+    @staticmethod
+    def _edit_correlation_rule_text(
+        text: str,
+        content: dict,
+        new_id: str,
+        vendor: str,
+        query_changed: bool
+    ) -> str | None:
+        """
+        Apply correlation rule renames as line edits to the original YAML.
+
+        Rewriting only the affected lines keeps the rest of the file's
+        formatting (block scalars, comments, key order) intact and avoids
+        re-serialising the whole document. The edited text is parsed
+        again and only used if it yields exactly the renamed content.
+
+        Args:
+            text: Original YAML text.
+            content: Rule content with the renames already applied.
+            new_id: New global_rule_id.
+            vendor: Lowercased pack name used for the dataset.
+            query_changed: Whether the first xql_query line was replaced.
+
+        Returns:
+            Edited YAML text, or None if the edits could not be applied
+            and the caller should re-serialise the content instead.
+        """
+        text, count = CORRELATION_RULE_ID_LINE.subn(f"global_rule_id: {new_id}", text)
+        if count != 1:
+            return None
+
+        if "dataset" in content:
+            text, count = CORRELATION_DATASET_LINE.subn(f"dataset: {vendor}_raw", text)
+            if count != 1:
+                return None
+
+        if query_changed:
+            # The replacement line carries two extra leading spaces, so the
+            # block needs an explicit indentation indicator.
+            def replace_head(match: re.Match) -> str:
+                indent = match.group("indent")
+                return (
+                    f"xql_query: |{len(indent)}{match.group('chomp')}\n"
+                    f"{indent}  dataset = {vendor}_raw"
+                )
+
+            text, count = CORRELATION_QUERY_HEAD.subn(replace_head, text)
+            if count != 1:
+                return None
+
+        try:
+            if yaml.load(text, Loader=SafeYamlLoader) != content:
+                return None
+        except yaml.YAMLError:
+            return None
+        return text
+
     def _update_yaml_id(self, yaml_path: Path, new_id: str, pack_name: str, rule_type: str) -> None:
         """Update id and name fields in a YAML file."""
         with open(yaml_path, "r", encoding="utf-8") as f:
-            content = yaml.safe_load(f)
+            content = yaml.load(f, Loader=SafeYamlLoader)
 
         if content:
             content["id"] = new_id
@@ -636,4 +1435,4 @@ class PackBuilder:
                 content["samples"] = f"{new_id}_samples.json"
 
             with open(yaml_path, "w", encoding="utf-8") as f:
-                yaml.dump(content, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+                yaml.dump(content, f, Dumper=yaml.SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
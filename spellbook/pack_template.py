@@ -6,18 +6,211 @@ Pack Template Module
 Creates new content pack scaffolding from templates.
 """
 
-import json
 import os
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import click
-import yaml
+
+from .fileio import dumps_json, load_config, uuid4_batch, write_file
+
+
+# Static pack files. The README and release notes templates are filled
+# in with str.format.
+PACK_README_TEMPLATE = """# {pack_name}
+
+{description}
+
+## Overview
+
+This pack contains content for use with Cortex Platform.
+
+## Content Items
+
+### Parsing Rules
+
+Rules for parsing raw log data into structured fields.
+
+### Modelling Rules
+
+Rules for mapping parsed data to the XDM (Cross Data Model) schema.
+
+### Correlation Rules
+
+Detection rules that identify security events and generate alerts.
+
+### XSIAM Dashboards
+
+Visual dashboards for monitoring and analysis.
+
+### XSIAM Reports
+
+Report templates for scheduled reporting.
+
+### Integrations
+
+(List integrations here)
+
+### Scripts
+
+(List scripts here)
+
+### Playbooks
+
+(List playbooks here)
+
+### Triggers
+
+Automation triggers for event-driven workflows.
+
+### Jobs
+
+Scheduled jobs for recurring tasks.
+
+## Installation
+
+Upload the pack zip file to your Cortex Platform instance.
+
+## Requirements
+
+- Cortex Platform version 6.0 or later
+
+## Support
+
+For support, please refer to the pack metadata for contact information.
+
+## Version History (Managed by GoCortex Spellbook)
+
+<!-- spellbook:version-history:start -->
+### 1.0.0
+
+- Initial release.
+
+<!-- spellbook:version-history:end -->
+"""
+
+PACK_IGNORE_CONTENT = """# Pack ignore file
+# Use this file to ignore specific linter errors or tests
+
+# Ignore a specific test
+# [file:playbook-Test.yml]
+# ignore=auto-test
+
+# Ignore linter errors
+# [file:integration.yml]
+# ignore=IN126,PA116
+
+# Require network for tests
+# [tests_require_network]
+# integration-id
+"""
+
+SECRETS_IGNORE_CONTENT = """# Secrets ignore file
+# Add words that should be allowed in secret scanning
+
+# Example allowed words:
+# example_api_key
+# test_token
+"""
+
+_PACK_IGNORE_BYTES = PACK_IGNORE_CONTENT.encode("utf-8")
+_SECRETS_IGNORE_BYTES = SECRETS_IGNORE_CONTENT.encode("utf-8")
+
+RELEASE_NOTES_TEMPLATE = """#### Parsing Rules
+
+##### {pack_name} Parsing Rule
+
+- Initial release of {pack_name} parsing rules.
+
+#### Modeling Rules
+
+##### {pack_name} Modeling Rule
+
+- Initial release of {pack_name} modelling rules for XDM mapping.
+
+#### Correlation Rules
+
+##### {pack_name} - Multiple Failed Login Attempts
+
+- Initial release of brute force detection correlation rule.
+
+#### XSIAM Dashboards
+
+##### {pack_name} Example
+
+- Initial release of example dashboard.
+
+#### XSIAM Reports
+
+##### {pack_name} Example
+
+- Initial release of example report.
+
+#### Triggers
+
+##### {pack_name} Alert Handler
+
+- Initial release of alert handler trigger.
+"""
+
+
+# Regex fragments shared by the sample parsing and modelling rules
+XIF_DATETIME_PATTERN = r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"
+XIF_TIMESTAMP_PATTERN = XIF_DATETIME_PATTERN + r"[Z\d\.]*"
+XIF_HOSTNAME_PATTERN = XIF_TIMESTAMP_PATTERN + r"\s+(\S+)"
+XIF_PROCESS_PATTERN = XIF_TIMESTAMP_PATTERN + r"\s+\S+\s+(\w+)"
+XIF_MESSAGE_PATTERN = XIF_TIMESTAMP_PATTERN + r"\s+\S+\s+\w+[:\s]+(.*)$"
+
+
+@dataclass(frozen=True, slots=True)
+class PackLayout:
+    """Paths of the files and directories PackTemplate writes in a pack.
+
+    Computed once per pack as plain strings so the _create_* helpers do
+    not each rebuild them with pathlib.
+    """
+    name: str
+    root: str
+    metadata: str
+    readme: str
+    pack_ignore: str
+    secrets_ignore: str
+    correlation_dir: str
+    parsing_dir: str
+    modeling_dir: str
+    dashboards_dir: str
+    reports_dir: str
+    triggers_dir: str
+    notes_dir: str
+
+    @classmethod
+    def for_pack(cls, pack_path: Path, pack_name: str) -> "PackLayout":
+        """Build the layout for pack_name rooted at pack_path."""
+        root = str(pack_path)
+        join = os.path.join
+        return cls(
+            name=pack_name,
+            root=root,
+            metadata=join(root, "pack_metadata.json"),
+            readme=join(root, "README.md"),
+            pack_ignore=join(root, ".pack-ignore"),
+            secrets_ignore=join(root, ".secrets-ignore"),
+            correlation_dir=join(root, "CorrelationRules"),
+            parsing_dir=join(root, "ParsingRules", f"{pack_name}ParsingRules"),
+            modeling_dir=join(root, "ModelingRules", f"{pack_name}ModelingRules"),
+            dashboards_dir=join(root, "XSIAMDashboards"),
+            reports_dir=join(root, "XSIAMReports"),
+            triggers_dir=join(root, "Triggers"),
+            notes_dir=join(root, "ReleaseNotes"),
+        )
 
 
 class PackTemplate:
     """Creates new pack structures from templates."""
 
+    __slots__ = ("config", "packs_dir", "defaults", "_dir_cache")
+
     CONTENT_DIRECTORIES = [
         "Integrations",
         "Scripts",
@@ -58,14 +251,30 @@ class PackTemplate:
         self.config = self._load_config(config_path)
         self.packs_dir = Path(self.config.get("packs_directory", "Packs"))
         self.defaults = self.config.get("defaults", {})
+        self._dir_cache: set[str] = set()
+
+    @classmethod
+    def for_instance(cls, packs_dir: Path, defaults: dict) -> "PackTemplate":
+        """
+        Create a generator for an instance that has no configuration file yet.
+
+        Args:
+            packs_dir: Packs directory to create packs in.
+            defaults: Default pack metadata values.
+
+        Returns:
+            PackTemplate writing to packs_dir with the given defaults.
+        """
+        template = cls.__new__(cls)
+        template.config = {}
+        template.packs_dir = packs_dir
+        template.defaults = defaults
+        template._dir_cache = set()
+        return template
 
     def _load_config(self, config_path: str) -> dict:
-        """Load configuration from YAML file."""
-        path = Path(config_path)
-        if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
-        return {}
+        """Load configuration from YAML file (cached, see fileio.load_config)."""
+        return load_config(config_path)
 
     def create_pack(
         self,
@@ -89,41 +298,76 @@ class PackTemplate:
             Path to the created pack directory.
         """
         pack_path = self.packs_dir / pack_name
-        pack_path.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(str(pack_path))
+        layout = PackLayout.for_pack(pack_path, pack_name)
 
         self._create_metadata(
-            pack_path,
-            pack_name,
+            layout,
             description,
             author,
             categories
         )
 
-        self._create_readme(pack_path, pack_name, description)
+        self._create_readme(layout, description)
 
-        self._create_pack_ignore(pack_path)
+        self._create_pack_ignore(layout)
 
-        self._create_secrets_ignore(pack_path)
+        self._create_secrets_ignore(layout)
 
         directories = create_directories or self.CONTENT_DIRECTORIES
-        for directory in directories:
-            dir_path = pack_path / directory
-            dir_path.mkdir(exist_ok=True)
-            gitkeep = dir_path / ".gitkeep"
-            gitkeep.touch()
+        self._create_content_directories(layout, directories)
 
         click.echo(f"Created pack: {pack_path}")
         return pack_path
 
+    def _ensure_dir(self, path: str) -> None:
+        """
+        Create a directory (and its parents) unless this generator already has.
+
+        Directories created or confirmed by this instance are remembered, so
+        the helpers that share a content directory with create_pack's
+        scaffolding skip the repeated makedirs. Entries are never forgotten,
+        so a directory removed by something else while the instance is in
+        use would not be recreated.
+
+        Args:
+            path: Directory to create.
+        """
+        if path in self._dir_cache:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._dir_cache.add(path)
+
+    def _create_content_directories(self, layout: PackLayout, directories: list[str]) -> None:
+        """
+        Create content type directories, each holding an empty .gitkeep.
+
+        Works on plain string paths and creates each .gitkeep with a
+        single open rather than an existence check and touch. Existing
+        directories and .gitkeep files are left as they are.
+
+        Args:
+            layout: Layout of the pack to create them in.
+            directories: Content type directory names.
+        """
+        for directory in directories:
+            dir_path = os.path.join(layout.root, directory)
+            self._ensure_dir(dir_path)
+            os.close(os.open(
+                os.path.join(dir_path, ".gitkeep"),
+                os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC,
+                0o666
+            ))
+
     def _create_metadata(
         self,
-        pack_path: Path,
-        pack_name: str,
+        layout: PackLayout,
         description: str,
         author: str | None,
         categories: list[str] | None
     ) -> None:
         """Create pack_metadata.json file."""
+        pack_name = layout.name
         metadata = {
             "name": pack_name,
             "description": description or f"{pack_name} content pack",
@@ -143,140 +387,42 @@ class PackTemplate:
             "githubUser": []
         }
 
-        metadata_path = pack_path / "pack_metadata.json"
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
-            f.write("\n")
+        write_file(layout.metadata, dumps_json(metadata))
 
     def _create_readme(
         self,
-        pack_path: Path,
-        pack_name: str,
+        layout: PackLayout,
         description: str
     ) -> None:
         """Create README.md file."""
-        readme_content = f"""# {pack_name}
-
-{description or 'Content pack for Cortex Platform.'}
-
-## Overview
-
-This pack contains content for use with Cortex Platform.
-
-## Content Items
-
-### Parsing Rules
-
-Rules for parsing raw log data into structured fields.
-
-### Modelling Rules
-
-Rules for mapping parsed data to the XDM (Cross Data Model) schema.
-
-### Correlation Rules
-
-Detection rules that identify security events and generate alerts.
-
-### XSIAM Dashboards
-
-Visual dashboards for monitoring and analysis.
-
-### XSIAM Reports
-
-Report templates for scheduled reporting.
-
-### Integrations
-
-(List integrations here)
-
-### Scripts
-
-(List scripts here)
-
-### Playbooks
-
-(List playbooks here)
-
-### Triggers
-
-Automation triggers for event-driven workflows.
-
-### Jobs
-
-Scheduled jobs for recurring tasks.
-
-## Installation
-
-Upload the pack zip file to your Cortex Platform instance.
-
-## Requirements
-
-- Cortex Platform version 6.0 or later
-
-## Support
-
-For support, please refer to the pack metadata for contact information.
-
-## Version History (Managed by GoCortex Spellbook)
-
-<!-- spellbook:version-history:start -->
-### 1.0.0
-
-- Initial release.
-
-<!-- spellbook:version-history:end -->
-"""
-        readme_path = pack_path / "README.md"
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write(readme_content)
+        readme_content = PACK_README_TEMPLATE.format(
+            pack_name=layout.name,
+            description=description or "Content pack for Cortex Platform."
+        )
+        write_file(layout.readme, readme_content.encode("utf-8"))
 
-    def _create_pack_ignore(self, pack_path: Path) -> None:
+    def _create_pack_ignore(self, layout: PackLayout) -> None:
         """Create .pack-ignore file."""
-        content = """# Pack ignore file
-# Use this file to ignore specific linter errors or tests
-
-# Ignore a specific test
-# [file:playbook-Test.yml]
-# ignore=auto-test
-
-# Ignore linter errors
-# [file:integration.yml]
-# ignore=IN126,PA116
-
-# Require network for tests
-# [tests_require_network]
-# integration-id
-"""
-        ignore_path = pack_path / ".pack-ignore"
-        with open(ignore_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        write_file(layout.pack_ignore, _PACK_IGNORE_BYTES)
 
-    def _create_secrets_ignore(self, pack_path: Path) -> None:
+    def _create_secrets_ignore(self, layout: PackLayout) -> None:
         """Create .secrets-ignore file."""
-        content = """# Secrets ignore file
-# Add words that should be allowed in secret scanning
+        write_file(layout.secrets_ignore, _SECRETS_IGNORE_BYTES)
 
-# Example allowed words:
-# example_api_key
-# test_token
-"""
-        secrets_path = pack_path / ".secrets-ignore"
-        with open(secrets_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    def _create_correlation_rule(self, pack_path: Path, pack_name: str) -> None:
+    def _create_correlation_rule(self, layout: PackLayout) -> None:
         """Create sample correlation rule for Cortex Platform.
         
         Follows the demisto-sdk correlationrule.yml schema with all required
         fields. Based on working examples from demisto/content repository.
         """
-        rules_dir = pack_path / "CorrelationRules"
-        rules_dir.mkdir(exist_ok=True)
+        pack_name = layout.name
+        rules_dir = layout.correlation_dir
+        self._ensure_dir(rules_dir)
 
         rule_name = f"{pack_name} - Multiple Failed Login Attempts"
         vendor = pack_name.lower()
         dataset = f"{vendor}_raw"
-        global_id = str(uuid.uuid4())
+        global_id = uuid4_batch(1)[0]
 
         rule_yml = f"""action: ALERTS
 alert_category: CREDENTIAL_ACCESS
@@ -313,13 +459,12 @@ xql_query: |
 """
 
         rule_filename = rule_name.replace(" ", "_").replace("-", "_")
-        rule_path = rules_dir / f"{rule_filename}.yml"
-        with open(rule_path, "w", encoding="utf-8") as f:
-            f.write(rule_yml)
+        rule_path = os.path.join(rules_dir, f"{rule_filename}.yml")
+        write_file(rule_path, rule_yml.encode("utf-8"))
 
         self._create_scheduled_correlation_rule(rules_dir, pack_name, dataset)
 
-    def _create_scheduled_correlation_rule(self, rules_dir: Path, pack_name: str, dataset: str) -> None:
+    def _create_scheduled_correlation_rule(self, rules_dir: str, pack_name: str, dataset: str) -> None:
         """Create sample scheduled correlation rule for Cortex Platform.
         
         Demonstrates how to configure a CRON-based scheduled correlation rule
@@ -327,7 +472,7 @@ xql_query: |
         search_window fields.
         """
         rule_name = f"{pack_name} - Multiple Failed Login Attempts-Scheduled"
-        global_id = str(uuid.uuid4())
+        global_id = uuid4_batch(1)[0]
 
         rule_yml = f"""action: ALERTS
 alert_category: CREDENTIAL_ACCESS
@@ -366,19 +511,19 @@ xql_query: |
 """
 
         rule_filename = rule_name.replace(" ", "_").replace("-", "_")
-        rule_path = rules_dir / f"{rule_filename}.yml"
-        with open(rule_path, "w", encoding="utf-8") as f:
-            f.write(rule_yml)
+        rule_path = os.path.join(rules_dir, f"{rule_filename}.yml")
+        write_file(rule_path, rule_yml.encode("utf-8"))
 
-    def _create_parsing_rule(self, pack_path: Path, pack_name: str) -> None:
+    def _create_parsing_rule(self, layout: PackLayout) -> None:
         """Create sample parsing rule for Cortex Platform.
         
         Follows the demisto-sdk parsingrule.yml schema. The rules and samples
         fields are empty strings as the SDK unifies them automatically.
         Based on working examples from demisto/content repository.
         """
-        rules_dir = pack_path / "ParsingRules" / f"{pack_name}ParsingRules"
-        rules_dir.mkdir(parents=True, exist_ok=True)
+        pack_name = layout.name
+        rules_dir = layout.parsing_dir
+        self._ensure_dir(rules_dir)
 
         rule_id = f"{pack_name} Parsing Rule"
         rule_file_base = f"{pack_name}ParsingRules"
@@ -394,32 +539,31 @@ samples: ''
 """
 
         xif_content = f"""[INGEST:vendor="{pack_name}", product="{pack_name}", target_dataset="{dataset}", no_hit=keep]
-filter _raw_log ~= "\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}"
+filter _raw_log ~= "{XIF_DATETIME_PATTERN}"
 | alter
-    tmp_timestamp = arrayindex(regextract(_raw_log, "(\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}[Z\\d\\.]*)"), 0),
-    hostname = arrayindex(regextract(_raw_log, "\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}[Z\\d\\.]*\\s+(\\S+)"), 0),
-    process_name = arrayindex(regextract(_raw_log, "\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}[Z\\d\\.]*\\s+\\S+\\s+(\\w+)"), 0),
-    message = arrayindex(regextract(_raw_log, "\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}[Z\\d\\.]*\\s+\\S+\\s+\\w+[:\\s]+(.*)$"), 0)
+    tmp_timestamp = arrayindex(regextract(_raw_log, "({XIF_TIMESTAMP_PATTERN})"), 0),
+    hostname = arrayindex(regextract(_raw_log, "{XIF_HOSTNAME_PATTERN}"), 0),
+    process_name = arrayindex(regextract(_raw_log, "{XIF_PROCESS_PATTERN}"), 0),
+    message = arrayindex(regextract(_raw_log, "{XIF_MESSAGE_PATTERN}"), 0)
 | alter
     _time = if(tmp_timestamp ~= "\\.", parse_timestamp("%Y-%m-%dT%H:%M:%E3SZ", tmp_timestamp), parse_timestamp("%Y-%m-%dT%H:%M:%SZ", tmp_timestamp))
 | fields -tmp_timestamp;
 """
 
-        with open(rules_dir / f"{rule_file_base}.yml", "w", encoding="utf-8") as f:
-            f.write(rule_yml)
+        write_file(os.path.join(rules_dir, f"{rule_file_base}.yml"), rule_yml.encode("utf-8"))
 
-        with open(rules_dir / f"{rule_file_base}.xif", "w", encoding="utf-8") as f:
-            f.write(xif_content)
+        write_file(os.path.join(rules_dir, f"{rule_file_base}.xif"), xif_content.encode("utf-8"))
 
-    def _create_modeling_rule(self, pack_path: Path, pack_name: str) -> None:
+    def _create_modeling_rule(self, layout: PackLayout) -> None:
         """Create sample modelling rule for Cortex Platform.
         
         Follows the demisto-sdk modelingrule.yml schema. The rules and schema
         fields are empty strings as the SDK unifies them automatically.
         Based on working VMwareESXi example from demisto/content repository.
         """
-        rules_dir = pack_path / "ModelingRules" / f"{pack_name}ModelingRules"
-        rules_dir.mkdir(parents=True, exist_ok=True)
+        pack_name = layout.name
+        rules_dir = layout.modeling_dir
+        self._ensure_dir(rules_dir)
 
         rule_file_base = f"{pack_name}ModelingRules"
         vendor = pack_name.lower()
@@ -435,11 +579,11 @@ tags: {pack_name}
 
         xif_content = f"""[MODEL: dataset="{dataset}"]
 alter
-    event_type = arrayindex(regextract(_raw_log, "\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}[Z\\d\\.]*\\s+\\S+\\s+(\\w+)"), 0),
+    event_type = arrayindex(regextract(_raw_log, "{XIF_PROCESS_PATTERN}"), 0),
     username = arrayindex(regextract(_raw_log, "user[=:\\s]+(\\S+)"), 0),
     source_ip = arrayindex(regextract(_raw_log, "from\\s+(\\d+\\.\\d+\\.\\d+\\.\\d+)"), 0),
     source_port = arrayindex(regextract(_raw_log, "port\\s+(\\d+)"), 0),
-    message = arrayindex(regextract(_raw_log, "\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}[Z\\d\\.]*\\s+\\S+\\s+\\w+[:\\s]+(.*)$"), 0)
+    message = arrayindex(regextract(_raw_log, "{XIF_MESSAGE_PATTERN}"), 0)
 | alter
     xdm.event.type = event_type,
     xdm.source.user.username = username,
@@ -458,72 +602,32 @@ alter
 }}
 """
 
-        with open(rules_dir / f"{rule_file_base}.yml", "w", encoding="utf-8") as f:
-            f.write(rule_yml)
+        write_file(os.path.join(rules_dir, f"{rule_file_base}.yml"), rule_yml.encode("utf-8"))
 
-        with open(rules_dir / f"{rule_file_base}.xif", "w", encoding="utf-8") as f:
-            f.write(xif_content)
+        write_file(os.path.join(rules_dir, f"{rule_file_base}.xif"), xif_content.encode("utf-8"))
 
-        with open(rules_dir / f"{rule_file_base}_schema.json", "w", encoding="utf-8") as f:
-            f.write(schema_json)
+        write_file(os.path.join(rules_dir, f"{rule_file_base}_schema.json"), schema_json.encode("utf-8"))
 
-    def _create_release_notes(self, pack_path: Path, pack_name: str) -> None:
+    def _create_release_notes(self, layout: PackLayout) -> None:
         """Create ReleaseNotes folder with initial version file.
         
         Creates a 1_0_0.md file documenting the initial release.
         """
-        notes_dir = pack_path / "ReleaseNotes"
-        notes_dir.mkdir(exist_ok=True)
+        self._ensure_dir(layout.notes_dir)
 
-        release_content = f"""#### Parsing Rules
+        release_content = RELEASE_NOTES_TEMPLATE.format(pack_name=layout.name)
 
-##### {pack_name} Parsing Rule
+        write_file(os.path.join(layout.notes_dir, "1_0_0.md"), release_content.encode("utf-8"))
 
-- Initial release of {pack_name} parsing rules.
-
-#### Modeling Rules
-
-##### {pack_name} Modeling Rule
-
-- Initial release of {pack_name} modelling rules for XDM mapping.
-
-#### Correlation Rules
-
-##### {pack_name} - Multiple Failed Login Attempts
-
-- Initial release of brute force detection correlation rule.
-
-#### XSIAM Dashboards
-
-##### {pack_name} Example
-
-- Initial release of example dashboard.
-
-#### XSIAM Reports
-
-##### {pack_name} Example
-
-- Initial release of example report.
-
-#### Triggers
-
-##### {pack_name} Alert Handler
-
-- Initial release of alert handler trigger.
-"""
-
-        with open(notes_dir / "1_0_0.md", "w", encoding="utf-8") as f:
-            f.write(release_content)
-
-    def _create_xsiam_dashboard(self, pack_path: Path, pack_name: str) -> None:
+    def _create_xsiam_dashboard(self, layout: PackLayout) -> None:
         """Create sample XSIAM dashboard for Cortex Platform.
         
         Creates an example dashboard JSON file that can be uploaded to XSIAM.
         The dashboard includes a header and sample widgets.
         Structure matches the format exported from XSIAM Dashboard Manager.
         """
-        dashboards_dir = pack_path / "XSIAMDashboards"
-        dashboards_dir.mkdir(exist_ok=True)
+        pack_name = layout.name
+        self._ensure_dir(layout.dashboards_dir)
         
         dashboard_id = f"{pack_name.lower()}_example_dashboard"
         dashboard_name = f"{pack_name} Example"
@@ -560,20 +664,18 @@ alter
             "name": dashboard_name
         }
         
-        dashboard_path = dashboards_dir / f"{pack_name}ExampleDashboard.json"
-        with open(dashboard_path, "w", encoding="utf-8") as f:
-            json.dump(dashboard_data, f, indent=2)
-            f.write("\n")
+        dashboard_path = os.path.join(layout.dashboards_dir, f"{pack_name}ExampleDashboard.json")
+        write_file(dashboard_path, dumps_json(dashboard_data))
     
-    def _create_xsiam_report(self, pack_path: Path, pack_name: str) -> None:
+    def _create_xsiam_report(self, layout: PackLayout) -> None:
         """Create sample XSIAM report for Cortex Platform.
         
         Creates an example report JSON file that can be uploaded to XSIAM.
         The report includes a header and sample layout.
         Structure matches the format exported from XSIAM Report Templates.
         """
-        reports_dir = pack_path / "XSIAMReports"
-        reports_dir.mkdir(exist_ok=True)
+        pack_name = layout.name
+        self._ensure_dir(layout.reports_dir)
         
         report_id = f"{pack_name.lower()}_example_report"
         report_name = f"{pack_name} Example"
@@ -612,19 +714,17 @@ alter
             "name": report_name
         }
         
-        report_path = reports_dir / f"{pack_name}ExampleReport.json"
-        with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(report_data, f, indent=2)
-            f.write("\n")
+        report_path = os.path.join(layout.reports_dir, f"{pack_name}ExampleReport.json")
+        write_file(report_path, dumps_json(report_data))
 
-    def _create_trigger(self, pack_path: Path, pack_name: str) -> None:
+    def _create_trigger(self, layout: PackLayout) -> None:
         """Create sample trigger for Cortex Platform.
         
         Creates an example trigger JSON file that links alerts to playbooks.
         Triggers define which playbook runs when specific alert conditions are met.
         """
-        triggers_dir = pack_path / "Triggers"
-        triggers_dir.mkdir(exist_ok=True)
+        pack_name = layout.name
+        self._ensure_dir(layout.triggers_dir)
         
         trigger_id = f"{pack_name.lower()}_example_trigger"
         trigger_name = f"{pack_name} Alert Handler"
@@ -648,10 +748,8 @@ alter
             }
         }
         
-        trigger_path = triggers_dir / f"{pack_name}ExampleTrigger.json"
-        with open(trigger_path, "w", encoding="utf-8") as f:
-            json.dump(trigger_data, f, indent=2)
-            f.write("\n")
+        trigger_path = os.path.join(layout.triggers_dir, f"{pack_name}ExampleTrigger.json")
+        write_file(trigger_path, dumps_json(trigger_data))
 
     def create_xsiam_content(self, pack_path: Path, pack_name: str) -> None:
         """Create Cortex Platform content structure.
@@ -660,14 +758,24 @@ alter
         CorrelationRules, XSIAMDashboards, XSIAMReports, Triggers, and ReleaseNotes.
         All templates follow the official demisto-sdk schemas and are based
         on working examples from the demisto/content repository.
+
+        Each step writes to its own content directory, so they run
+        concurrently on a thread pool to overlap filesystem latency.
         """
-        self._create_parsing_rule(pack_path, pack_name)
-        self._create_modeling_rule(pack_path, pack_name)
-        self._create_correlation_rule(pack_path, pack_name)
-        self._create_xsiam_dashboard(pack_path, pack_name)
-        self._create_xsiam_report(pack_path, pack_name)
-        self._create_trigger(pack_path, pack_name)
-        self._create_release_notes(pack_path, pack_name)
+        steps = (
+            self._create_parsing_rule,
+            self._create_modeling_rule,
+            self._create_correlation_rule,
+            self._create_xsiam_dashboard,
+            self._create_xsiam_report,
+            self._create_trigger,
+            self._create_release_notes,
+        )
+        layout = PackLayout.for_pack(pack_path, pack_name)
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(step, layout) for step in steps]
+        for future in futures:
+            future.result()
 
     def list_templates(self) -> list[str]:
         """List available pack templates."""
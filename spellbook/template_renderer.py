@@ -16,6 +16,8 @@ from typing import Any
 
 import yaml
 
+from .fileio import SafeYamlLoader
+
 
 BUILTIN_TEMPLATES_DIR = Path(__file__).parent / "templates"
 TOKEN_PATTERN = re.compile(r"%%([A-Z_]+)%%")
@@ -42,6 +44,24 @@ CONTENT_TYPE_DIRS = {
 XQL_EXTENSION = ".xql"
 
 
+class _TemplateDumper(yaml.SafeDumper):
+    """
+    Safe dumper that writes multiline strings as literal blocks.
+
+    Stays on the pure-Python dumper: libyaml's emitter folds long quoted
+    scalars at different points, which would change rendered files.
+    """
+
+
+def _represent_str(dumper: yaml.SafeDumper, data: str) -> yaml.ScalarNode:
+    """Represent strings containing newlines in literal block style."""
+    style = "|" if "\n" in data else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", data, style=style)
+
+
+_TemplateDumper.add_representer(str, _represent_str)
+
+
 def _format_encoding_error(
     file_path: Path, template_name: str, content_type: str, err: UnicodeDecodeError
 ) -> str:
@@ -209,7 +229,7 @@ class TemplateRenderer:
             ) from None
 
         if template_file.suffix in (".yml", ".yaml"):
-            data = yaml.safe_load(raw_content)
+            data = yaml.load(raw_content, Loader=SafeYamlLoader)
             self._replace_tokens_in_dict(data, values)
 
             for token_name, xql_content in xql_snippets.items():
@@ -318,22 +338,9 @@ class TemplateRenderer:
 
     def _to_yaml(self, data: dict) -> str:
         """Convert dictionary to YAML string with block style for multiline strings."""
-
-        class TemplateDumper(yaml.SafeDumper):
-            pass
-
-        def str_representer(dumper, data):
-            if "\n" in data:
-                return dumper.represent_scalar(
-                    "tag:yaml.org,2002:str", data, style="|"
-                )
-            return dumper.represent_scalar("tag:yaml.org,2002:str", data)
-
-        TemplateDumper.add_representer(str, str_representer)
-
         return yaml.dump(
             data,
-            Dumper=TemplateDumper,
+            Dumper=_TemplateDumper,
             default_flow_style=False,
             allow_unicode=True,
             sort_keys=False,
@@ -16,6 +16,7 @@ class VersionManager:
 
     DEFAULT_VERSION = "1.0.0"
     VERSION_PATTERN = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+    TAG_PATTERN = re.compile(r"^(?P<pack>.+)-v(?P<version>\d+\.\d+\.\d+)$")
 
     def __init__(self, tag_pattern: str = "{pack_name}-v{version}"):
         """
@@ -25,6 +26,9 @@ class VersionManager:
             tag_pattern: Pattern for Git tags containing pack name and version.
         """
         self.tag_pattern = tag_pattern
+        self._git_tags: list[str] | None = None
+        self._tags_by_pack: dict[str, list[str]] | None = None
+        self._pack_versions: dict[str, list[str]] = {}
 
     def is_git_repository(self) -> bool:
         """
@@ -38,7 +42,8 @@ class VersionManager:
                 ["git", "rev-parse", "--git-dir"],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                close_fds=False
             )
             return bool(result.stdout.strip())
         except subprocess.CalledProcessError:
@@ -46,26 +51,76 @@ class VersionManager:
         except FileNotFoundError:
             return False
 
-    def get_git_tags(self) -> list:
+    def get_git_tags(self, pack_name: str | None = None) -> list:
         """
-        Retrieve all Git tags from the repository.
+        Retrieve Git tags from the repository.
+
+        The full tag list is read once per instance. Call clear_tag_cache()
+        after creating a tag to pick it up.
+
+        Args:
+            pack_name: Only list tags starting with "{pack_name}-v". Git
+                applies the filter, so repositories with many tags for
+                other packs are not listed in full. Uses the full list
+                instead if it has already been read.
+
+        Returns:
+            List of tag names. Tags for a single pack are sorted newest
+            version first.
+        """
+        if pack_name is not None and self._git_tags is None:
+            return self._run_git_tag(f"{pack_name}-v*", newest_first=True)
+        if self._git_tags is None:
+            self._git_tags = self._run_git_tag()
+        tags = self._git_tags
+        if pack_name is not None:
+            prefix = f"{pack_name}-v"
+            # The full list is in refname order; match git's -v:refname
+            return sorted(
+                (tag for tag in tags if tag.startswith(prefix)),
+                key=lambda tag: self._version_tuple(tag[len(prefix):]),
+                reverse=True
+            )
+        return list(tags)
+
+    @staticmethod
+    def _run_git_tag(
+        pattern: str | None = None,
+        newest_first: bool = False
+    ) -> list[str]:
+        """
+        Run git tag --list, optionally restricted to a glob pattern.
+
+        Args:
+            pattern: Tag glob passed to git, or None for every tag.
+            newest_first: Have git sort the tags by descending version
+                (--sort=-v:refname).
 
         Returns:
-            List of tag names sorted by version.
+            Tag names, or an empty list if Git is unavailable or fails.
         """
+        cmd = ["git", "tag", "--list"]
+        if newest_first:
+            cmd.append("--sort=-v:refname")
+        if pattern is not None:
+            cmd.append(pattern)
         try:
             result = subprocess.run(
-                ["git", "tag", "--list"],
+                cmd,
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                close_fds=False
             )
-            tags = result.stdout.strip().split("\n")
-            return [tag for tag in tags if tag]
-        except subprocess.CalledProcessError:
-            return []
-        except FileNotFoundError:
+        except (subprocess.CalledProcessError, FileNotFoundError):
             return []
+        return [tag for tag in result.stdout.strip().split("\n") if tag]
+
+    def clear_tag_cache(self) -> None:
+        """Forget cached tag data so the next lookup re-reads Git."""
+        self._git_tags = None
+        self._tags_by_pack = None
+        self._pack_versions.clear()
 
     def parse_tag(self, tag: str, pack_name: str) -> str | None:
         """
@@ -85,6 +140,60 @@ class VersionManager:
                 return version
         return None
 
+    def tags_by_pack(self) -> dict[str, list[str]]:
+        """
+        Group tagged versions by pack name.
+
+        Git tags are listed and parsed once per instance; later calls
+        return the cached mapping.
+
+        Returns:
+            Dictionary mapping pack names to the versions tagged for them.
+        """
+        if self._tags_by_pack is None:
+            grouped: dict[str, list[str]] = {}
+            for tag in self.get_git_tags():
+                match = self.TAG_PATTERN.match(tag)
+                if match:
+                    grouped.setdefault(match["pack"], []).append(match["version"])
+            self._tags_by_pack = grouped
+        return self._tags_by_pack
+
+    def pack_versions(self, pack_name: str) -> list[str]:
+        """
+        List the versions tagged for a single pack.
+
+        Reuses tags_by_pack() if the full tag list has already been
+        read, otherwise asks Git for this pack's tags only, already
+        sorted by version.
+        Results are cached per pack.
+
+        Args:
+            pack_name: The name of the pack.
+
+        Returns:
+            Tagged version strings, newest first, empty if the pack has
+            no tags.
+        """
+        versions = self._pack_versions.get(pack_name)
+        if versions is None:
+            if self._git_tags is not None:
+                versions = sorted(
+                    self.tags_by_pack().get(pack_name, []),
+                    key=self._version_tuple,
+                    reverse=True
+                )
+            else:
+                # Same test as parse_tag, in a single match per tag
+                tag_pattern = re.compile(rf"{re.escape(pack_name)}-v(\d+\.\d+\.\d+)")
+                versions = []
+                for tag in self.get_git_tags(pack_name):
+                    match = tag_pattern.fullmatch(tag)
+                    if match:
+                        versions.append(match[1])
+            self._pack_versions[pack_name] = versions
+        return versions
+
     def get_latest_version(self, pack_name: str) -> str:
         """
         Get the latest version for a pack from Git tags.
@@ -95,18 +204,10 @@ class VersionManager:
         Returns:
             Latest version string or default version if no tags found.
         """
-        tags = self.get_git_tags()
-        versions = []
-
-        for tag in tags:
-            version = self.parse_tag(tag, pack_name)
-            if version:
-                versions.append(version)
-
+        versions = self.pack_versions(pack_name)
         if not versions:
             return self.DEFAULT_VERSION
 
-        versions.sort(key=lambda v: self._version_tuple(v), reverse=True)
         return versions[0]
 
     def increment_version(
@@ -157,16 +258,11 @@ class VersionManager:
         Returns:
             Next version string.
         """
-        current = self.get_latest_version(pack_name)
-        if current == self.DEFAULT_VERSION:
-            tags = self.get_git_tags()
-            pack_has_tags = any(
-                self.parse_tag(tag, pack_name) for tag in tags
-            )
-            if not pack_has_tags:
-                return self.DEFAULT_VERSION
+        versions = self.pack_versions(pack_name)
+        if not versions:
+            return self.DEFAULT_VERSION
 
-        return self.increment_version(current, increment_type)
+        return self.increment_version(versions[0], increment_type)
 
     def create_version_tag(self, pack_name: str, version: str) -> str:
         """
@@ -183,8 +279,8 @@ class VersionManager:
 
     def _version_tuple(self, version: str) -> tuple[int, int, int]:
         """Convert version string to comparable tuple."""
-        match = self.VERSION_PATTERN.match(version)
-        if match:
-            major, minor, revision = map(int, match.groups())
+        parts = version.split(".")
+        if len(parts) == 3 and all(part.isdecimal() for part in parts):
+            major, minor, revision = map(int, parts)
             return (major, minor, revision)
         return (0, 0, 0)
@@ -8,13 +8,54 @@ not detected by demisto-sdk. These rules are based on actual upload
 failures encountered when pushing content to XSIAM.
 """
 
+import fnmatch
+import functools
+import hashlib
+import itertools
+import mmap
+import operator
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterator
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from . import __version__
+from .fileio import dumps_json, loads_json, write_atomic
 
-@dataclass
+
+# Line boundaries str.splitlines() recognises besides "\n" (text-mode reads
+# have already turned "\r\n" and "\r" into "\n")
+EXTRA_LINE_BREAKS = re.compile("[\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# Bytes that stop a file being checked as raw bytes: anything non-ASCII,
+# "\r" (which text mode would translate), extra line breaks, and the
+# controls str patterns count as whitespace but bytes patterns do not
+TEXT_ONLY_BYTES = re.compile(rb"[\r\v\f\x1c-\x1f\x80-\xff]")
+
+# Packs directories with at least this many packs are validated across
+# worker processes. Smaller ones finish quicker than a pool can start.
+PARALLEL_VALIDATE_MIN_PACKS = 16
+
+# Content files at least this large are memory-mapped rather than read
+MMAP_MIN_SIZE = 256 * 1024
+
+# Most files kept in the results cache; the least recently used go first
+CACHE_MAX_ENTRIES = 50_000
+
+# Files modified this recently (in nanoseconds) are not cached, since a
+# further change within the same timestamp tick could go unnoticed
+CACHE_RACY_WINDOW_NS = 2_000_000_000
+
+# Part of the results cache digest alongside the rules and the Spellbook
+# version; bump it whenever the way files are read or matched changes
+SCANNER_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """Represents a validation issue found in content."""
     rule_name: str
@@ -24,7 +65,7 @@ class ValidationIssue:
     line_number: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationRule:
     """Defines a validation rule for content checking."""
     name: str
@@ -33,6 +74,104 @@ class ValidationRule:
     pattern: str  # Regex pattern to detect issues
     message: str
     severity: str = "error"
+    literal_prefilter: str = ""  # Text every match contains, looked for before the regex
+    compiled: re.Pattern = field(init=False, repr=False, compare=False)
+    compiled_bytes: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen, so the derived fields are set past the generated __setattr__
+        object.__setattr__(self, "compiled", re.compile(self.pattern, re.MULTILINE))
+        object.__setattr__(
+            self, "compiled_bytes", re.compile(self.pattern.encode(), re.MULTILINE)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _RuleGroup:
+    """
+    Rules checked together: same content type and file pattern.
+
+    The rules' names and compiled patterns are kept in parallel tuples,
+    which is all the per-line loop needs.
+    """
+    matches: Callable[[str], bool]  # Filename test for the file pattern
+    combined: re.Pattern  # Alternation of every rule's pattern
+    combined_bytes: re.Pattern
+    names: tuple[str, ...]
+    patterns: tuple[re.Pattern, ...]
+    byte_patterns: tuple[re.Pattern, ...]
+    literals: tuple[str, ...]
+    byte_literals: tuple[bytes, ...]
+
+
+def default_cache_path() -> Path:
+    """
+    Return where the validator keeps its results cache between runs.
+
+    Returns:
+        xsiam_validator.json in a spellbook directory under
+        $XDG_CACHE_HOME, or ~/.cache if that is not set.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "spellbook" / "xsiam_validator.json"
+
+
+def _filename_matcher(file_pattern: str) -> Callable[[str], bool]:
+    """
+    Build a test for filenames matching a glob.
+
+    Globs that are just "*" and a literal suffix, as all the rules' are,
+    become a plain str.endswith check rather than an fnmatch call.
+
+    Args:
+        file_pattern: Glob such as "*.yml".
+
+    Returns:
+        Function taking a filename and returning whether it matches. It
+        pickles, so validators can be sent to worker processes.
+    """
+    suffix = file_pattern[1:]
+    if file_pattern.startswith("*") and not any(char in suffix for char in "*?["):
+        return operator.methodcaller("endswith", suffix)
+    return functools.partial(fnmatch.fnmatchcase, pat=file_pattern)
+
+
+def _iter_files(top: str, relative_top: str) -> Iterator[tuple[str, str]]:
+    """
+    Walk a directory tree the way Path.rglob does.
+
+    Each directory's files are yielded before its subdirectories are
+    entered, in directory listing order. Symlinks to files are yielded,
+    but symlinks to directories are not entered, so link loops and links
+    out of the tree are never walked.
+
+    Args:
+        top: Directory to walk.
+        relative_top: Path of top to report, for building relative paths.
+
+    Yields:
+        (path, relative path) pairs for every regular file found.
+    """
+    stack = [(top, relative_top)]
+    while stack:
+        directory, relative_dir = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, os.path.join(relative_dir, entry.name)))
+                elif entry.is_file():
+                    yield entry.path, os.path.join(relative_dir, entry.name)
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
 
 
 class XSIAMValidator:
@@ -51,7 +190,8 @@ class XSIAMValidator:
             file_pattern="*.xif",
             pattern=r'\[INGEST:[^\]]*content_id\s*=',
             message="Invalid field 'content_id' in INGEST directive - XSIAM does not support this field",
-            severity="error"
+            severity="error",
+            literal_prefilter="[INGEST:"
         ),
         
         # Correlation Rules checks
@@ -61,7 +201,8 @@ class XSIAMValidator:
             file_pattern="*.yml",
             pattern=r'^\s*simple_schedule\s*:',
             message="Invalid field 'simple_schedule' in correlation rule - use crontab, execution_mode, and search_window instead",
-            severity="error"
+            severity="error",
+            literal_prefilter="simple_schedule"
         ),
         ValidationRule(
             name="parentheses_in_correlation_name",
@@ -69,7 +210,8 @@ class XSIAMValidator:
             file_pattern="*.yml",
             pattern=r'^\s*name\s*:\s*.*[\(\)]',
             message="Parentheses in correlation rule name may cause XSIAM issues - use hyphens instead",
-            severity="warning"
+            severity="warning",
+            literal_prefilter="name"
         ),
         
     ]
@@ -89,19 +231,70 @@ class XSIAMValidator:
         "XDRCTemplates",
     ]
 
-    def __init__(self, packs_dir: Path):
+    def __init__(self, packs_dir: Path, cache_path: Path | None = None):
         """
         Initialise the XSIAM validator.
         
         Args:
             packs_dir: Path to the Packs directory.
+            cache_path: File to keep content rule results in between
+                runs, keyed on each file's modification time and size.
+                Nothing is cached if not given. Call save_cache() to
+                write it back.
         """
         self.packs_dir = packs_dir
+        self.cache_path = cache_path
+        self._rules_by_name = {rule.name: rule for rule in self.RULES}
+
+        # Rules sharing a directory and file pattern are checked in one
+        # pass, with their patterns fused into a single alternation that
+        # screens out lines none of them match.
+        grouped: dict[tuple[str, str], list[ValidationRule]] = {}
+        for rule in self.RULES:
+            grouped.setdefault((rule.content_type, rule.file_pattern), []).append(rule)
+        self._rule_groups: dict[str, list[_RuleGroup]] = {}
+        for (content_type, file_pattern), rules in grouped.items():
+            combined = "|".join(f"(?P<{rule.name}>{rule.pattern})" for rule in rules)
+            self._rule_groups.setdefault(content_type, []).append(_RuleGroup(
+                matches=_filename_matcher(file_pattern),
+                combined=re.compile(combined, re.MULTILINE),
+                combined_bytes=re.compile(combined.encode(), re.MULTILINE),
+                names=tuple(rule.name for rule in rules),
+                patterns=tuple(rule.compiled for rule in rules),
+                byte_patterns=tuple(rule.compiled_bytes for rule in rules),
+                literals=tuple(rule.literal_prefilter for rule in rules),
+                byte_literals=tuple(rule.literal_prefilter.encode() for rule in rules),
+            ))
+
+        # Every content directory either kind of check looks at
+        self._content_types = list(dict.fromkeys(
+            self.FILENAME_CHECK_DIRECTORIES + [rule.content_type for rule in self.RULES]
+        ))
+        self._filename_check_types = frozenset(self.FILENAME_CHECK_DIRECTORIES)
+
+        # Cached results only hold while the rules and the scanner stay the same
+        self._rules_digest = hashlib.blake2b(dumps_json({
+            "scanner": [SCANNER_VERSION, __version__],
+            "rules": [
+                [rule.name, rule.content_type, rule.file_pattern, rule.pattern, rule.literal_prefilter]
+                for rule in self.RULES
+            ],
+        })).hexdigest()
+        self._cache: dict[str, list] | None = None
+        self._cache_dirty = False
+        # Cache keys are absolute paths, joined onto this rather than
+        # normalised file by file
+        self._cache_root = os.path.abspath(packs_dir)
+        if cache_path is not None:
+            self._cache = self._load_cache()
 
     def validate_pack(self, pack_name: str) -> list[ValidationIssue]:
         """
         Validate a single pack against XSIAM rules.
         
+        Each content directory is walked once, with every file handed to
+        the filename checks and the content rules that apply to it.
+        
         Args:
             pack_name: Name of the pack to validate.
             
@@ -112,70 +305,239 @@ class XSIAMValidator:
         if not pack_path.exists():
             return []
         
-        issues = []
+        # Content issues are reported rule by rule, in RULES order, then
+        # filename issues directory by directory
+        issues_by_rule: dict[str, list[ValidationIssue]] = {
+            rule.name: [] for rule in self.RULES
+        }
+        filename_issues_by_type: dict[str, list[ValidationIssue]] = {
+            content_type: [] for content_type in self.FILENAME_CHECK_DIRECTORIES
+        }
         
-        for rule in self.RULES:
-            rule_issues = self._check_rule(pack_path, rule)
-            issues.extend(rule_issues)
+        for content_type, file_path, relative_path in self._walk_pack(pack_path):
+            filename = os.path.basename(file_path)
+            
+            if content_type in self._filename_check_types:
+                self._check_filename(
+                    filename, relative_path, filename_issues_by_type[content_type]
+                )
+            
+            groups = [
+                group for group in self._rule_groups.get(content_type, ())
+                if group.matches(filename)
+            ]
+            if not groups:
+                continue
+            if self._cache is None:
+                findings = self._scan_file(file_path, groups)
+            else:
+                findings = self._cached_scan(file_path, relative_path, groups)
+            for rule_name, line_number in findings:
+                rule = self._rules_by_name[rule_name]
+                issues_by_rule[rule_name].append(ValidationIssue(
+                    rule_name=rule_name,
+                    severity=rule.severity,
+                    file_path=relative_path,
+                    message=rule.message,
+                    line_number=line_number
+                ))
         
-        # Check filenames for problematic characters
-        filename_issues = self._check_filenames(pack_path)
-        issues.extend(filename_issues)
+        issues = [issue for rule_issues in issues_by_rule.values() for issue in rule_issues]
+        for filename_issues in filename_issues_by_type.values():
+            issues.extend(filename_issues)
         
         return issues
     
-    def _check_filenames(self, pack_path: Path) -> list[ValidationIssue]:
+    def _scan_file(self, file_path: str, groups: list[_RuleGroup]) -> list[tuple[str, int]]:
         """
-        Check filenames for problematic characters.
+        Check a file against the rule groups that apply to it.
         
-        Detects spaces and other problematic characters in content filenames
-        that may cause issues with XSIAM uploads.
+        Args:
+            file_path: File to check.
+            groups: Rule groups whose file pattern the file matches.
+            
+        Returns:
+            (rule name, line number) for every rule a line breaks.
+        """
+        content = self._read_content(file_path, [group.combined_bytes for group in groups])
+        if content is None:
+            return []
+        findings = []
+        for group in groups:
+            findings.extend(self._check_rules(content, group))
+        return findings
+
+    def _cached_scan(
+        self,
+        file_path: str,
+        relative_path: str,
+        groups: list[_RuleGroup]
+    ) -> list[tuple[str, int]]:
+        """
+        Check a file, reusing the cached findings if it has not changed.
         
         Args:
-            pack_path: Path to the pack directory.
+            file_path: File to check.
+            relative_path: Path of the file relative to the Packs directory.
+            groups: Rule groups whose file pattern the file matches.
             
         Returns:
-            List of validation issues for problematic filenames.
+            (rule name, line number) for every rule a line breaks.
         """
-        issues = []
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return self._scan_file(file_path, groups)
         
-        for content_type in self.FILENAME_CHECK_DIRECTORIES:
-            content_dir = pack_path / content_type
-            if not content_dir.exists():
-                continue
+        key = os.path.join(self._cache_root, relative_path)
+        # Taken out and put back, so the dict stays in least recently used order
+        entry = self._cache.pop(key, None)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            findings = entry[2]
+        else:
+            findings = self._scan_file(file_path, groups)
+            self._cache_dirty = True
+            if st.st_mtime_ns > time.time_ns() - CACHE_RACY_WINDOW_NS:
+                return findings
+        self._cache[key] = [st.st_mtime_ns, st.st_size, findings]
+        return findings
+
+    def _load_cache(self) -> dict[str, list]:
+        """Read the results cache, starting afresh if it is missing, unreadable or stale."""
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = loads_json(f.read())
+            if data.get("rules") == self._rules_digest and isinstance(data.get("files"), dict):
+                return data["files"]
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+
+    def save_cache(self) -> None:
+        """
+        Write the results cache back, if caching is on and it has changed.
+        
+        Only the CACHE_MAX_ENTRIES most recently used files are kept.
+        The cache is an optimisation, so failing to write it is not an
+        error. Packs validated in worker processes by validate_all_packs
+        do not add to it.
+        """
+        if self._cache is None or not self._cache_dirty:
+            return
+        excess = len(self._cache) - CACHE_MAX_ENTRIES
+        if excess > 0:
+            for key in list(itertools.islice(self._cache, excess)):
+                del self._cache[key]
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.cache_path, dumps_json({
+                "rules": self._rules_digest,
+                "files": self._cache,
+            }))
+        except OSError:
+            return
+        self._cache_dirty = False
+
+    @staticmethod
+    def _read_content(file_path: str, screens: list[re.Pattern]) -> bytes | str | None:
+        """
+        Read a file for the content rules.
+        
+        The rule patterns are plain ASCII, so most files can be searched
+        as the bytes read from disk. Files with anything that would read
+        or match differently as text (non-ASCII characters, "\r" line
+        endings, unusual line breaks and controls) are decoded instead,
+        as text mode would.
+        
+        Files of MMAP_MIN_SIZE or more are memory-mapped and screened in
+        place first, so a large plain ASCII file that none of the rules
+        match is never copied into memory.
+        
+        Args:
+            file_path: File to read.
+            screens: Combined bytes patterns of the rules that apply.
             
-            for file_path in content_dir.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                
-                # Skip .gitkeep files
-                if file_path.name == ".gitkeep":
-                    continue
-                
-                filename = file_path.name
-                relative_path = str(file_path.relative_to(pack_path.parent))
-                
-                # Check for spaces in filename
-                if " " in filename:
-                    issues.append(ValidationIssue(
-                        rule_name="filename_contains_space",
-                        severity="error",
-                        file_path=relative_path,
-                        message="Filename contains spaces - rename file using underscores or hyphens only"
-                    ))
-                
-                # Check for mixed separators (both underscore and hyphen)
-                has_underscore = "_" in filename.replace(".yml", "").replace(".json", "").replace(".xif", "").replace(".md", "")
-                has_hyphen = "-" in filename.replace(".yml", "").replace(".json", "").replace(".xif", "").replace(".md", "")
-                if has_underscore and has_hyphen:
-                    issues.append(ValidationIssue(
-                        rule_name="filename_mixed_separators",
-                        severity="warning",
-                        file_path=relative_path,
-                        message="Filename uses mixed separators (underscores and hyphens) - consider using consistent separators"
-                    ))
+        Returns:
+            The raw bytes, the decoded text, or None if the file cannot
+            be read as UTF-8 or no rule can match it.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if not TEXT_ONLY_BYTES.search(mapped) and not any(
+                            screen.search(mapped) for screen in screens
+                        ):
+                            return None
+                        data = mapped[:]
+                else:
+                    data = f.read()
+            if not TEXT_ONLY_BYTES.search(data):
+                return data
+            # Decode with text mode's universal newlines
+            return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        except Exception:
+            return None
+
+    def _walk_pack(self, pack_path: Path) -> Iterator[tuple[str, str, str]]:
+        """
+        Walk the content directories of a pack that any check looks at.
         
-        return issues
+        Args:
+            pack_path: Path to the pack directory.
+            
+        Yields:
+            Tuples of (content type, file path, path relative to the
+            Packs directory).
+        """
+        # Missing directories need no stat of their own: _iter_files
+        # skips any it cannot list
+        for content_type in self._content_types:
+            for file_path, relative_path in _iter_files(
+                os.path.join(pack_path, content_type),
+                os.path.join(pack_path.name, content_type)
+            ):
+                yield content_type, file_path, relative_path
+    
+    @staticmethod
+    def _check_filename(
+        filename: str,
+        relative_path: str,
+        issues: list[ValidationIssue]
+    ) -> None:
+        """
+        Check a filename for problematic characters.
+        
+        Detects spaces and other problematic characters in content filenames
+        that may cause issues with XSIAM uploads.
+        
+        Args:
+            filename: Name of the file.
+            relative_path: Path to report the file as.
+            issues: Issue list to append to.
+        """
+        # Skip .gitkeep files
+        if filename == ".gitkeep":
+            return
+        
+        # Check for spaces in filename
+        if " " in filename:
+            issues.append(ValidationIssue(
+                rule_name="filename_contains_space",
+                severity="error",
+                file_path=relative_path,
+                message="Filename contains spaces - rename file using underscores or hyphens only"
+            ))
+        
+        # Check for mixed separators (both underscore and hyphen). None of
+        # the content extensions contain either, so the whole name is tested
+        if "_" in filename and "-" in filename:
+            issues.append(ValidationIssue(
+                rule_name="filename_mixed_separators",
+                severity="warning",
+                file_path=relative_path,
+                message="Filename uses mixed separators (underscores and hyphens) - consider using consistent separators"
+            ))
 
     def validate_all_packs(self) -> dict[str, list[ValidationIssue]]:
         """
@@ -189,62 +551,123 @@ class XSIAMValidator:
         if not self.packs_dir.exists():
             return results
         
-        for pack_dir in self.packs_dir.iterdir():
-            if pack_dir.is_dir() and not pack_dir.name.startswith('.'):
-                issues = self.validate_pack(pack_dir.name)
-                if issues:
-                    results[pack_dir.name] = issues
+        pack_names = [
+            pack_dir.name for pack_dir in self.packs_dir.iterdir()
+            if pack_dir.is_dir() and not pack_dir.name.startswith('.')
+        ]
+        
+        for pack_name, issues in zip(pack_names, self._validate_packs(pack_names)):
+            if issues:
+                results[pack_name] = issues
         
         return results
 
-    def _check_rule(
-        self,
-        pack_path: Path,
-        rule: ValidationRule
-    ) -> list[ValidationIssue]:
+    def _validate_packs(self, pack_names: list[str]) -> list[list[ValidationIssue]]:
         """
-        Check a single rule against a pack.
+        Validate several packs, across worker processes when there are many.
+        
+        Packs are independent of each other, so large Packs directories
+        are shared out between processes. Smaller ones, single-CPU hosts
+        and platforms without working process pools are validated here.
         
         Args:
-            pack_path: Path to the pack directory.
-            rule: The validation rule to check.
+            pack_names: Names of the packs to validate.
             
         Returns:
-            List of issues found for this rule.
+            The issues for each pack, in the order given.
+        """
+        if len(pack_names) >= PARALLEL_VALIDATE_MIN_PACKS and (os.cpu_count() or 1) > 1:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    return list(executor.map(self.validate_pack, pack_names, chunksize=4))
+            except (OSError, NotImplementedError):
+                pass
+        return [self.validate_pack(pack_name) for pack_name in pack_names]
+
+    def _check_rules(
+        self,
+        content: bytes | str,
+        group: _RuleGroup
+    ) -> list[tuple[str, int]]:
         """
-        issues = []
+        Check one file's content against a group of rules.
         
-        # Find the content type directory
-        content_dir = pack_path / rule.content_type
-        if not content_dir.exists():
-            return []
+        Rules whose literal prefilter does not appear anywhere in the
+        content cannot match and are dropped first; if none are left, no
+        regex runs at all. Otherwise the content is searched as a whole
+        with the combined pattern, which finds every line any rule could
+        match. Only those lines are then tested against the remaining
+        rules, so one line can still raise an issue for every rule it
+        breaks.
         
-        # Find all matching files
-        pattern = rule.file_pattern
-        for file_path in content_dir.rglob(pattern):
-            if not file_path.is_file():
-                continue
-            
-            try:
-                content = file_path.read_text(encoding='utf-8')
-            except Exception:
-                continue
-            
-            # Check each line for the pattern
-            compiled_pattern = re.compile(rule.pattern, re.MULTILINE)
+        Args:
+            content: Raw file bytes, or the file text as read in text mode.
+            group: The rules to check.
             
-            for line_num, line in enumerate(content.splitlines(), start=1):
-                if compiled_pattern.search(line):
-                    relative_path = str(file_path.relative_to(pack_path.parent))
-                    issues.append(ValidationIssue(
-                        rule_name=rule.name,
-                        severity=rule.severity,
-                        file_path=relative_path,
-                        message=rule.message,
-                        line_number=line_num
-                    ))
+        Returns:
+            (rule name, line number) for every rule a line breaks, in
+            line order.
+        """
+        literals = group.byte_literals if isinstance(content, bytes) else group.literals
+        active = [
+            position for position, literal in enumerate(literals) if literal in content
+        ]
+        if not active:
+            return []
         
-        return issues
+        if isinstance(content, bytes):
+            lines = content.split(b"\n")
+            candidates = self._candidate_lines(content, group.combined_bytes)
+            patterns = group.byte_patterns
+        elif EXTRA_LINE_BREAKS.search(content):
+            # Rare: let splitlines() decide where lines end
+            lines = content.splitlines()
+            candidates = range(len(lines))
+            patterns = group.patterns
+        else:
+            lines = content.split("\n")
+            candidates = self._candidate_lines(content, group.combined)
+            patterns = group.patterns
+        
+        # Check the candidate lines for the patterns
+        names = group.names
+        findings = []
+        for index in candidates:
+            line = lines[index]
+            for position in active:
+                if patterns[position].search(line):
+                    findings.append((names[position], index + 1))
+        return findings
+
+    @staticmethod
+    def _candidate_lines(content: bytes | str, combined: re.Pattern) -> list[int]:
+        """
+        List the lines of content that any of the combined patterns may match.
+
+        A match of a pattern within a single line is also a match within
+        the whole text, so every line that one of them matches lies inside
+        (or starts) a span found by combined.finditer. Line numbers are
+        only worked out for those spans.
+
+        Args:
+            content: File bytes or text, with "\n" as its only line break.
+            combined: Alternation of the patterns to look for.
+
+        Returns:
+            Zero-based indexes of the candidate lines, in ascending order.
+        """
+        newline = b"\n" if isinstance(content, bytes) else "\n"
+        candidates = []
+        line = 0
+        position = 0
+        for match in combined.finditer(content):
+            line += content.count(newline, position, match.start())
+            last = line + content.count(newline, match.start(), match.end())
+            first = line if not candidates or candidates[-1] < line else line + 1
+            candidates.extend(range(first, last + 1))
+            line = last
+            position = match.end()
+        return candidates
 
     def format_issues(self, issues: list[ValidationIssue]) -> str:
         """
@@ -259,26 +682,30 @@ class XSIAMValidator:
         if not issues:
             return ""
         
-        lines = []
-        errors = [i for i in issues if i.severity == "error"]
-        warnings = [i for i in issues if i.severity == "warning"]
+        errors = []
+        warnings = []
+        for issue in issues:
+            if issue.severity == "error":
+                errors.append(issue)
+            elif issue.severity == "warning":
+                warnings.append(issue)
         
+        lines = []
         if errors:
             lines.append("XSIAM Validation Errors:")
-            for issue in errors:
-                location = f"{issue.file_path}"
-                if issue.line_number:
-                    location += f":{issue.line_number}"
-                lines.append(f"[ERROR] {location}: {issue.message}")
+            lines.extend(self._format_issue("[ERROR]", issue) for issue in errors)
         
         if warnings:
             if errors:
                 lines.append("")
             lines.append("XSIAM Validation Warnings:")
-            for issue in warnings:
-                location = f"{issue.file_path}"
-                if issue.line_number:
-                    location += f":{issue.line_number}"
-                lines.append(f"[WARN] {location}: {issue.message}")
+            lines.extend(self._format_issue("[WARN]", issue) for issue in warnings)
         
         return "\n".join(lines)
+
+    @staticmethod
+    def _format_issue(prefix: str, issue: ValidationIssue) -> str:
+        """Format one issue as a display line, with its line number if known."""
+        if issue.line_number:
+            return f"{prefix} {issue.file_path}:{issue.line_number}: {issue.message}"
+        return f"{prefix} {issue.file_path}: {issue.message}"
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: GoCortexIO
+"""Shared fixtures for the Spellbook test suite."""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+def git(cwd: Path, *args: str) -> str:
+    """Run a git command in cwd and return its output."""
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@localhost", *args],
+        cwd=str(cwd),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def make_pack(packs_dir: Path, name: str, version: str = "1.0.0") -> Path:
+    """Create a minimal pack with a pack_metadata.json and a README."""
+    pack_path = packs_dir / name
+    pack_path.mkdir(parents=True)
+    (pack_path / "pack_metadata.json").write_text(
+        json.dumps({"name": name, "currentVersion": version}), encoding="utf-8"
+    )
+    (pack_path / "README.md").write_text(f"# {name}\n", encoding="utf-8")
+    return pack_path
+
+
+@pytest.fixture
+def instance(tmp_path, monkeypatch):
+    """A content instance with a spellbook.yaml and an empty Packs directory."""
+    (tmp_path / "Packs").mkdir()
+    (tmp_path / "spellbook.yaml").write_text(
+        "packs_directory: Packs\n"
+        "artifacts_directory: artifacts\n"
+        "validation:\n"
+        "  enabled: true\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: GoCortexIO
+"""Tests for the correlation rule importer's YAML output and render pool."""
+
+import json
+import uuid
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+import yaml
+
+from spellbook import content_importer
+from spellbook.content_importer import CorrelationImporter
+from spellbook.fileio import SafeYamlLoader
+
+SAMPLE_RULE = {
+    "name": "Suspicious Login (Brute Force)",
+    "description": "Detects\r\nrepeated failures\n",
+    "xql_query": "dataset = auth_raw\n| filter outcome = \"failure\"\n| comp count() by user",
+    "severity": "SEV_030_MEDIUM",
+    "alert_name": "Café login — 100% weird: yes",
+    "enabled": "yes",
+    "threshold": "1.0",
+    "empty": "",
+    "nothing": None,
+    "mitre": ["T1110", "T1078"],
+    "nested": {"key": "  leading spaces", "on": "null"},
+}
+
+
+def baseline_to_yaml(data: dict) -> str:
+    """The importer's original YAML rendering, kept as the reference."""
+    class MultilineDumper(yaml.SafeDumper):
+        pass
+
+    def str_representer(dumper, value):
+        if "\n" in value:
+            return dumper.represent_scalar("tag:yaml.org,2002:str", value, style="|")
+        return dumper.represent_scalar("tag:yaml.org,2002:str", value)
+
+    MultilineDumper.add_representer(str, str_representer)
+    return yaml.dump(
+        data,
+        Dumper=MultilineDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
+
+
+def test_to_yaml_matches_baseline():
+    assert CorrelationImporter._to_yaml(SAMPLE_RULE) == baseline_to_yaml(SAMPLE_RULE)
+
+
+def test_to_yaml_round_trips_through_the_loader():
+    text = CorrelationImporter._to_yaml(SAMPLE_RULE)
+    assert yaml.load(text, Loader=SafeYamlLoader) == yaml.safe_load(text) == SAMPLE_RULE
+
+
+def test_generated_rule_ids_are_uuid4():
+    rule = CorrelationImporter._clean_rule({"name": "Rule"}, global_rule_id=None)
+    assert uuid.UUID(rule["global_rule_id"]).version == 4
+
+
+@pytest.fixture
+def many_rules():
+    return [dict(SAMPLE_RULE, name=f"Rule {i}") for i in range(
+        content_importer.PARALLEL_RENDER_MIN_RULES
+    )] + [{"description": "no name"}]
+
+
+def rendered_without_ids(items: list) -> list:
+    """Rendered rules with the random global_rule_id line dropped."""
+    out = []
+    for item in items:
+        if isinstance(item, Exception):
+            out.append(repr(item))
+        else:
+            name, filename, text = item
+            text = "\n".join(
+                line for line in text.splitlines()
+                if not line.startswith("global_rule_id:")
+            )
+            out.append((name, filename, text))
+    return out
+
+
+@pytest.mark.parametrize("error", [
+    BrokenProcessPool("worker died"),
+    OSError("cannot start pool"),
+])
+def test_render_falls_back_to_serial_when_the_pool_fails(
+    monkeypatch, tmp_path, many_rules, error
+):
+    class FailingPool:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, *args, **kwargs):
+            raise error
+
+    importer = CorrelationImporter(tmp_path)
+    monkeypatch.setattr(content_importer.os, "cpu_count", lambda: 1)
+    serial = importer._render_rules(many_rules)
+
+    monkeypatch.setattr(content_importer.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(content_importer, "ProcessPoolExecutor", FailingPool)
+    rendered = importer._render_rules(many_rules)
+
+    assert rendered_without_ids(rendered) == rendered_without_ids(serial)
+    assert isinstance(rendered[-1], ValueError)
+
+
+def test_parallel_render_matches_serial(monkeypatch, tmp_path, many_rules):
+    importer = CorrelationImporter(tmp_path)
+    monkeypatch.setattr(content_importer.os, "cpu_count", lambda: 1)
+    serial = importer._render_rules(many_rules)
+    monkeypatch.setattr(content_importer.os, "cpu_count", lambda: 2)
+    parallel = importer._render_rules(many_rules)
+
+    assert rendered_without_ids(parallel) == rendered_without_ids(serial)
+
+
+def test_import_writes_each_rule(tmp_path):
+    (tmp_path / "Pack").mkdir()
+    importer = CorrelationImporter(tmp_path)
+
+    results = importer.import_from_json(json.dumps([SAMPLE_RULE, {"id": 1}]), "Pack")
+
+    assert [result["success"] for result in results] == [True, False]
+    written = (tmp_path / "Pack" / "CorrelationRules" / results[0]["filename"]).read_text()
+    loaded = yaml.safe_load(written)
+    assert loaded["name"] == SAMPLE_RULE["name"]
+    assert loaded["xql_query"] == SAMPLE_RULE["xql_query"]
@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: GoCortexIO
+"""Tests for PackBuilder pack discovery, content renaming and packaging."""
+
+import json
+import os
+import zipfile
+
+import pytest
+import yaml
+
+from spellbook import pack_builder
+from spellbook.pack_builder import PackBuilder
+
+from .conftest import make_pack
+
+CORRELATION_RULE = """\
+global_rule_id: Old_Brute_Force
+name: Brute force (many failures)
+dataset: old_raw
+xql_query: |-
+  dataset = old_raw
+  | filter outcome = "failure"
+  | comp count() as failures by user
+description: >
+  Folded text
+  over two lines.
+mitre_defs: {}
+"""
+
+
+@pytest.fixture
+def builder(instance):
+    return PackBuilder(str(instance / "spellbook.yaml"))
+
+
+def baseline_correlation_rename(content: dict, pack_name: str) -> dict:
+    """The original rename applied to a parsed correlation rule."""
+    content = dict(content)
+    rule_suffix = content["global_rule_id"].split("_", 1)[-1]
+    content["global_rule_id"] = f"{pack_name}_{rule_suffix}"
+    vendor = pack_name.lower()
+    content["dataset"] = f"{vendor}_raw"
+    lines = content["xql_query"].split("\n")
+    if lines[0].strip().startswith("dataset"):
+        lines[0] = f"  dataset = {vendor}_raw"
+    content["xql_query"] = "\n".join(lines)
+    return content
+
+
+def baseline_dump(content: dict) -> str:
+    """YAML as the original rename wrote it."""
+    return yaml.dump(content, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+
+class TestDiscoverPacks:
+    def test_finds_packs_with_metadata(self, instance, builder):
+        make_pack(instance / "Packs", "Beta")
+        make_pack(instance / "Packs", "Alpha")
+        (instance / "Packs" / "NotAPack").mkdir()
+
+        assert builder.discover_packs() == ["Alpha", "Beta"]
+
+    def test_sees_metadata_added_to_an_existing_directory(self, instance, builder):
+        make_pack(instance / "Packs", "Alpha")
+        late = instance / "Packs" / "Late"
+        late.mkdir()
+        assert builder.discover_packs() == ["Alpha"]
+
+        (late / "pack_metadata.json").write_text("{}", encoding="utf-8")
+        assert builder.discover_packs() == ["Alpha", "Late"]
+
+        (late / "pack_metadata.json").unlink()
+        assert builder.discover_packs() == ["Alpha"]
+
+
+class TestRenameContent:
+    def test_correlation_rule_matches_baseline_rename(self, instance, builder):
+        pack_path = make_pack(instance / "Packs", "Acme")
+        rules_dir = pack_path / "CorrelationRules"
+        rules_dir.mkdir()
+        (rules_dir / "Old_Brute_Force.yml").write_text(CORRELATION_RULE, encoding="utf-8")
+
+        renamed = builder.rename_content("Acme")
+
+        assert renamed == {"Old_Brute_Force.yml": "Acme_Brute_Force.yml"}
+        text = (rules_dir / "Acme_Brute_Force.yml").read_text(encoding="utf-8")
+        assert yaml.safe_load(text) == baseline_correlation_rename(
+            yaml.safe_load(CORRELATION_RULE), "Acme"
+        )
+        # Edited in place, so the rest of the file keeps its formatting
+        assert "description: >\n  Folded text\n" in text
+
+    def test_correlation_rule_falls_back_to_baseline_dump(self, instance, builder):
+        pack_path = make_pack(instance / "Packs", "Acme")
+        rules_dir = pack_path / "CorrelationRules"
+        rules_dir.mkdir()
+        original = yaml.safe_load(CORRELATION_RULE)
+        (rules_dir / "Old_Brute_Force.yml").write_text(
+            json.dumps(original), encoding="utf-8"
+        )
+
+        builder.rename_content("Acme")
+
+        text = (rules_dir / "Acme_Brute_Force.yml").read_text(encoding="utf-8")
+        assert text == baseline_dump(baseline_correlation_rename(original, "Acme"))
+
+    def test_modeling_rule_matches_baseline_dump(self, instance, builder):
+        pack_path = make_pack(instance / "Packs", "Acme")
+        rule_dir = pack_path / "ModelingRules" / "OldModelingRule"
+        rule_dir.mkdir(parents=True)
+        content = {
+            "id": "OldModelingRule",
+            "name": "Old Modeling Rule",
+            "fromversion": "8.4.0",
+            "tags": ["yes", "1.0", ""],
+            "rules": "OldModelingRule.xif",
+            "schema": "OldModelingRule_schema.json",
+            "comment": "Line one\nline two — café",
+        }
+        (rule_dir / "OldModelingRule.yml").write_text(baseline_dump(content), encoding="utf-8")
+        (rule_dir / "OldModelingRule.xif").write_text("[MODEL: dataset=old_raw]\n", encoding="utf-8")
+        (rule_dir / "OldModelingRule_schema.json").write_text("{}", encoding="utf-8")
+
+        renamed = builder.rename_content("Acme")
+
+        new_dir = pack_path / "ModelingRules" / "AcmeModelingRule"
+        assert renamed["OldModelingRule"] == "AcmeModelingRule"
+        assert sorted(os.listdir(new_dir)) == [
+            "AcmeModelingRule.xif", "AcmeModelingRule.yml", "AcmeModelingRule_schema.json"
+        ]
+        expected = dict(
+            content,
+            id="AcmeModelingRule",
+            name="Acme Modeling Rule",
+            rules="AcmeModelingRule.xif",
+            schema="AcmeModelingRule_schema.json",
+        )
+        assert (new_dir / "AcmeModelingRule.yml").read_text(encoding="utf-8") == baseline_dump(expected)
+
+
+class TestPackagePack:
+    @pytest.fixture
+    def pack_path(self, instance):
+        pack_path = make_pack(instance / "Packs", "Acme")
+        (pack_path / "Scripts").mkdir()
+        (pack_path / "Scripts" / "script.py").write_text("print('hi')\n", encoding="utf-8")
+        (pack_path / "Scripts" / "script.pyc").write_bytes(b"\0")
+        (pack_path / "__pycache__").mkdir()
+        (pack_path / "__pycache__" / "x.pyc").write_bytes(b"\0")
+        return pack_path
+
+    @staticmethod
+    def backdate(pack_path, seconds: int = 60) -> None:
+        """Move every file's mtime out of the stamp's racy window."""
+        for root, _, files in os.walk(pack_path):
+            for name in files:
+                path = os.path.join(root, name)
+                st = os.stat(path)
+                os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 10**9))
+
+    def test_zip_holds_the_pack_files(self, builder, pack_path, capsys):
+        zip_path = builder.package_pack("Acme")
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert sorted(zipf.namelist()) == [
+                "README.md", "Scripts/script.py", "pack_metadata.json"
+            ]
+            assert zipf.read("Scripts/script.py") == b"print('hi')\n"
+        assert zip_path.name == "Acme-v1.0.0.zip"
+
+    def test_unchanged_pack_reuses_the_zip(self, builder, pack_path, capsys):
+        self.backdate(pack_path)
+        zip_path = builder.package_pack("Acme")
+        assert builder.package_pack("Acme") == zip_path
+
+        assert "Package up to date" in capsys.readouterr().out
+
+    def test_changed_file_rebuilds_the_zip(self, builder, pack_path, capsys):
+        self.backdate(pack_path)
+        builder.package_pack("Acme")
+        (pack_path / "README.md").write_text("# Changed\n", encoding="utf-8")
+        capsys.readouterr()
+
+        zip_path = builder.package_pack("Acme")
+
+        assert "Created package" in capsys.readouterr().out
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.read("README.md") == b"# Changed\n"
+
+    def test_same_tick_edit_of_a_recent_file_rebuilds_the_zip(
+        self, builder, pack_path, capsys
+    ):
+        readme = pack_path / "README.md"
+        readme.write_text("# One\n", encoding="utf-8")
+        st = os.stat(readme)
+        builder.package_pack("Acme")
+
+        # Same size and mtime, as a second write within one tick leaves it
+        readme.write_text("# Two\n", encoding="utf-8")
+        os.utime(readme, ns=(st.st_atime_ns, st.st_mtime_ns))
+        capsys.readouterr()
+        zip_path = builder.package_pack("Acme")
+
+        assert "Created package" in capsys.readouterr().out
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.read("README.md") == b"# Two\n"
+
+    def test_stamp_does_not_depend_on_walk_order(
+        self, builder, pack_path, capsys, monkeypatch
+    ):
+        self.backdate(pack_path)
+        builder.package_pack("Acme")
+        real_walk = os.walk
+
+        def reversed_walk(top, *args, **kwargs):
+            for root, dirs, files in real_walk(top, *args, **kwargs):
+                dirs.reverse()
+                yield root, dirs, files[::-1]
+
+        monkeypatch.setattr(pack_builder.os, "walk", reversed_walk)
+        capsys.readouterr()
+        builder.package_pack("Acme")
+
+        assert "Package up to date" in capsys.readouterr().out
+
+    def test_interrupted_write_does_not_leave_a_stamp(
+        self, builder, pack_path, capsys, monkeypatch
+    ):
+        self.backdate(pack_path)
+        zip_path = builder.package_pack("Acme")
+        (pack_path / "README.md").write_text("# Changed\n", encoding="utf-8")
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(zipfile.ZipFile, "write", fail)
+            assert builder.package_pack("Acme") is None
+        assert not zip_path.exists()
+        assert not zip_path.with_suffix(".zip.stamp").exists()
+
+        capsys.readouterr()
+        builder.package_pack("Acme")
+        assert "Created package" in capsys.readouterr().out
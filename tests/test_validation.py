@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: GoCortexIO
+"""Tests for the batched demisto-sdk validation and its per-pack fallback."""
+
+import os
+import sys
+
+import pytest
+
+from spellbook.pack_builder import PackBuilder
+
+from .conftest import make_pack
+
+# Stands in for demisto-sdk validate: logs each run's -i value and fails
+# packs named Bad*, blaming them by path unless FAKE_SDK_NOPATH is set
+FAKE_SDK = """\
+import os, sys
+paths = sys.argv[sys.argv.index("-i") + 1].split(",")
+with open(os.environ["FAKE_SDK_LOG"], "a") as log:
+    log.write(",".join(os.path.basename(p) for p in paths) + "\\n")
+rc = 0
+for path in paths:
+    name = os.path.basename(path)
+    print(f"Validating {name}")
+    if name.startswith("Bad"):
+        if os.environ.get("FAKE_SDK_NOPATH"):
+            print("[ERROR]: something broke")
+        else:
+            print(f"[ERROR]: Packs/{name}/pack_metadata.json: [PA100] - bad metadata")
+        rc = 1
+sys.exit(rc)
+"""
+
+
+@pytest.fixture
+def fake_sdk(tmp_path_factory, monkeypatch):
+    """Put a fake demisto-sdk first on PATH and return its run log."""
+    bin_dir = tmp_path_factory.mktemp("bin")
+    script = bin_dir / "demisto-sdk"
+    script.write_text(f"#!{sys.executable}\n{FAKE_SDK}", encoding="utf-8")
+    script.chmod(0o755)
+    log = bin_dir / "runs.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_SDK_LOG", str(log))
+    return log
+
+
+def sdk_runs(log) -> list[list[str]]:
+    """Pack names passed to each fake demisto-sdk run, in run order."""
+    return [line.split(",") for line in log.read_text().splitlines()]
+
+
+def per_pack_lines(output: str) -> list[str]:
+    """The "Validating X..." and outcome lines printed for each pack."""
+    return [
+        line for line in output.splitlines()
+        if (line.startswith("Validating ") and line.endswith("...")
+            and "demisto-sdk run" not in line)
+        or line.startswith(("Validation passed for", "Validation failed for"))
+    ]
+
+
+def run_validate_packs(instance, capsys, batch: bool) -> tuple[list, str]:
+    """Validate every pack and return the results and console output."""
+    config = instance / "spellbook.yaml"
+    config.write_text(
+        config.read_text() + f"  batch: {str(batch).lower()}\n", encoding="utf-8"
+    )
+    builder = PackBuilder(str(config))
+    results = list(builder.validate_packs(builder.discover_packs(), jobs=2))
+    return results, capsys.readouterr().out
+
+
+def test_batch_pass_runs_demisto_sdk_once(instance, fake_sdk, capsys):
+    for name in ("Alpha", "Beta"):
+        make_pack(instance / "Packs", name)
+
+    results, output = run_validate_packs(instance, capsys, batch=True)
+
+    assert results == [("Alpha", True), ("Beta", True)]
+    assert sdk_runs(fake_sdk) == [["Alpha", "Beta"]]
+    assert per_pack_lines(output) == [
+        "Validating Alpha...",
+        "Validation passed for Alpha",
+        "Validating Beta...",
+        "Validation passed for Beta",
+    ]
+
+
+def test_batch_failure_revalidates_only_blamed_packs(instance, fake_sdk, capsys):
+    for name in ("Alpha", "BadPack", "Beta"):
+        make_pack(instance / "Packs", name)
+
+    results, output = run_validate_packs(instance, capsys, batch=True)
+
+    assert results == [("Alpha", True), ("BadPack", False), ("Beta", True)]
+    assert sdk_runs(fake_sdk) == [["Alpha", "BadPack", "Beta"], ["BadPack"]]
+    assert "validating BadPack individually" in output
+
+
+def test_batch_failure_without_paths_revalidates_every_pack(
+    instance, fake_sdk, capsys, monkeypatch
+):
+    monkeypatch.setenv("FAKE_SDK_NOPATH", "1")
+    for name in ("Alpha", "BadPack"):
+        make_pack(instance / "Packs", name)
+
+    results, _ = run_validate_packs(instance, capsys, batch=True)
+
+    assert results == [("Alpha", True), ("BadPack", False)]
+    runs = sdk_runs(fake_sdk)
+    assert runs[0] == ["Alpha", "BadPack"]
+    assert sorted(runs[1:]) == [["Alpha"], ["BadPack"]]
+
+
+def test_batch_reports_the_same_as_per_pack_validation(
+    instance, fake_sdk, capsys
+):
+    for name in ("Alpha", "BadPack", "Beta"):
+        make_pack(instance / "Packs", name)
+
+    batch_results, batch_output = run_validate_packs(instance, capsys, batch=True)
+    (instance / "spellbook.yaml").write_text(
+        (instance / "spellbook.yaml").read_text().replace("batch: true", ""),
+        encoding="utf-8",
+    )
+    serial_results, serial_output = run_validate_packs(instance, capsys, batch=False)
+
+    assert batch_results == serial_results
+    assert per_pack_lines(batch_output) == per_pack_lines(serial_output)
+    assert sorted(sdk_runs(fake_sdk)[-3:]) == [["Alpha"], ["BadPack"], ["Beta"]]
+
+
+def test_temporary_git_repo_is_removed(instance, fake_sdk, capsys):
+    make_pack(instance / "Packs", "Alpha")
+
+    run_validate_packs(instance, capsys, batch=True)
+
+    assert not (instance / ".git").exists()
+
+
+def test_skip_checks_must_be_a_list(instance, fake_sdk, capsys):
+    make_pack(instance / "Packs", "Alpha")
+    config = instance / "spellbook.yaml"
+    config.write_text(config.read_text() + "  skip_checks: conf-json\n", encoding="utf-8")
+    builder = PackBuilder(str(config))
+
+    with pytest.raises(SystemExit):
+        list(builder.validate_packs(["Alpha"]))
+
+    assert "must be a list" in capsys.readouterr().out
+    assert sdk_runs(fake_sdk) == []
+
+
+def test_unknown_skip_checks_warn_before_validation(instance, fake_sdk, capsys):
+    make_pack(instance / "Packs", "Alpha")
+    config = instance / "spellbook.yaml"
+    config.write_text(
+        config.read_text() + "  skip_checks: [bogus, conf-json, bogus]\n", encoding="utf-8"
+    )
+    builder = PackBuilder(str(config))
+
+    list(builder.validate_packs(["Alpha"]))
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "[WARN] Unknown validation.skip_checks entry 'bogus'"
+    assert sum("bogus" in line for line in lines) == 1
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: GoCortexIO
+"""Tests for tag listing and version ordering in VersionManager."""
+
+import pytest
+
+from spellbook.version_manager import VersionManager
+
+from .conftest import git
+
+TAGS = [
+    "Pack-v1.2.0",
+    "Pack-v1.10.0",
+    "Pack-v1.9.3",
+    "Pack-v0.0.1",
+    "Pack-vbad",
+    "PackTwo-v3.0.0",
+    "Other-v2.0.0",
+]
+NEWEST_FIRST = ["1.10.0", "1.9.3", "1.2.0", "0.0.1"]
+
+
+@pytest.fixture
+def tagged_repo(tmp_path, monkeypatch):
+    """A Git repository with one commit carrying TAGS."""
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "commit", "-q", "--allow-empty", "-m", "initial")
+    for tag in TAGS:
+        git(tmp_path, "tag", tag)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_pack_tags_are_newest_first_whichever_way_they_are_read(tagged_repo):
+    filtered = VersionManager().get_git_tags("Pack")
+
+    manager = VersionManager()
+    manager.get_git_tags()
+    from_full_list = manager.get_git_tags("Pack")
+
+    assert [tag for tag in filtered if tag != "Pack-vbad"] == [
+        f"Pack-v{version}" for version in NEWEST_FIRST
+    ]
+    assert [tag for tag in from_full_list if tag != "Pack-vbad"] == [
+        tag for tag in filtered if tag != "Pack-vbad"
+    ]
+    assert "PackTwo-v3.0.0" not in filtered + from_full_list
+
+
+def test_pack_versions_match_with_and_without_the_full_tag_list(tagged_repo):
+    filtered = VersionManager()
+
+    full = VersionManager()
+    full.tags_by_pack()
+
+    assert filtered.pack_versions("Pack") == NEWEST_FIRST
+    assert full.pack_versions("Pack") == NEWEST_FIRST
+    assert filtered.pack_versions("Other") == full.pack_versions("Other") == ["2.0.0"]
+
+
+def test_latest_version_and_next_tag(tagged_repo):
+    manager = VersionManager()
+
+    assert manager.get_latest_version("Pack") == "1.10.0"
+    assert manager.get_latest_version("Missing") == VersionManager.DEFAULT_VERSION
+
+    listed = VersionManager()
+    listed.get_git_tags()
+    assert listed.get_latest_version("Pack") == "1.10.0"
+
+    git(tagged_repo, "tag", "Pack-v1.11.0")
+    assert manager.get_latest_version("Pack") == "1.10.0"
+    manager.clear_tag_cache()
+    assert manager.get_latest_version("Pack") == "1.11.0"
+
+
+def test_parse_tag_only_accepts_the_pack_and_a_full_version():
+    manager = VersionManager()
+
+    assert manager.parse_tag("Pack-v1.2.3", "Pack") == "1.2.3"
+    assert manager.parse_tag("PackTwo-v1.2.3", "Pack") is None
+    assert manager.parse_tag("Pack-v1.2", "Pack") is None
@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: GoCortexIO
+"""Tests comparing the XSIAM validator's scanner with a line-by-line reference."""
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from spellbook import xsiam_validator
+from spellbook.xsiam_validator import XSIAMValidator
+
+INGEST = "[INGEST:vendor=acme, product=app, target_dataset=acme_raw, content_id = 1]"
+
+FILES = {
+    "ParsingRules/Rule/Rule.xif": f"// header\n{INGEST}\nalter x = 1;\n{INGEST}\n",
+    "ParsingRules/Rule/Crlf.xif": f"// header\r\n{INGEST}\r\nfilter y;\r\n",
+    "ParsingRules/Rule/LoneCr.xif": f"// a\r// b\r{INGEST}\r",
+    "ParsingRules/Rule/Separators.xif": f"// a {INGEST}\f// c\x1c{INGEST}\n",
+    "ParsingRules/Rule/Unicode.xif": f"// café ✓\n{INGEST}\n",
+    "ParsingRules/Rule/Clean.xif": "[INGEST:vendor=acme, product=app]\n",
+    "ParsingRules/Rule/Notes.txt": f"{INGEST}\n",
+    "CorrelationRules/Schedule.yml": "name: Schedule\nsimple_schedule: daily\n  simple_schedule : x\n",
+    "CorrelationRules/Brackets.yml": "name: Brute force (many)\nother: (x)\n   name: nested )\n",
+    "CorrelationRules/Tabs.yml": "\tname:\t(tab)\nnames: (no)\n",
+    "CorrelationRules/Other.yaml": "simple_schedule: ignored\n",
+    "CorrelationRules/Deep/Nested.yml": "simple_schedule: deep\n",
+    "CorrelationRules/My Rule.yml": "name: Plain\n",
+    "Scripts/mixed_sep-name.json": "{}",
+    "Scripts/.gitkeep": "",
+    "Integrations/Plain.md": "# x\n",
+}
+# Files above MMAP_MIN_SIZE: one matching at the end, one matching
+# nothing, and one that has to be decoded
+LARGE_FILES = {
+    "ParsingRules/Rule/LargeMatch.xif": "alter x = 1;\n" * 30000 + INGEST + "\n",
+    "ParsingRules/Rule/LargeClean.xif": "alter x = 1;\n" * 30000,
+    "ParsingRules/Rule/LargeUnicode.xif": "// café\n" * 40000 + INGEST + "\n",
+}
+INVALID_UTF8 = "ParsingRules/Rule/Invalid.xif"
+
+
+def baseline_issues(packs_dir: Path, pack_name: str) -> list[tuple]:
+    """Issues as the original validator found them, one rule at a time."""
+    pack_path = packs_dir / pack_name
+    issues = []
+    for rule in XSIAMValidator.RULES:
+        content_dir = pack_path / rule.content_type
+        if not content_dir.exists():
+            continue
+        compiled = re.compile(rule.pattern, re.MULTILINE)
+        for file_path in content_dir.rglob(rule.file_pattern):
+            if not file_path.is_file():
+                continue
+            try:
+                content = file_path.read_text(encoding="utf-8")
+            except Exception:
+                continue
+            for line_num, line in enumerate(content.splitlines(), start=1):
+                if compiled.search(line):
+                    issues.append((
+                        rule.name, rule.severity,
+                        str(file_path.relative_to(packs_dir)), rule.message, line_num,
+                    ))
+    for content_type in XSIAMValidator.FILENAME_CHECK_DIRECTORIES:
+        content_dir = pack_path / content_type
+        if not content_dir.exists():
+            continue
+        for file_path in content_dir.rglob("*"):
+            if not file_path.is_file() or file_path.name == ".gitkeep":
+                continue
+            relative = str(file_path.relative_to(packs_dir))
+            if " " in file_path.name:
+                issues.append(("filename_contains_space", "error", relative, None, None))
+            stem = file_path.name
+            for suffix in (".yml", ".json", ".xif", ".md"):
+                stem = stem.replace(suffix, "")
+            if "_" in stem and "-" in stem:
+                issues.append(("filename_mixed_separators", "warning", relative, None, None))
+    return sorted(issues, key=repr)
+
+
+def found_issues(validator: XSIAMValidator, pack_name: str) -> list[tuple]:
+    """The validator's issues in the same form as baseline_issues."""
+    return sorted((
+        (
+            issue.rule_name, issue.severity, issue.file_path,
+            issue.message if issue.line_number else None, issue.line_number,
+        )
+        for issue in validator.validate_pack(pack_name)
+    ), key=repr)
+
+
+@pytest.fixture
+def packs_dir(tmp_path):
+    packs_dir = tmp_path / "Packs"
+    pack_path = packs_dir / "Acme"
+    for relative, text in {**FILES, **LARGE_FILES}.items():
+        path = pack_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(text.encode("utf-8"))
+    (pack_path / INVALID_UTF8).write_bytes(f"\xff\xfe{INGEST}\n".encode("latin-1"))
+    # Old enough to be cached
+    for root, _, files in os.walk(packs_dir):
+        for name in files:
+            os.utime(os.path.join(root, name), (1_600_000_000, 1_600_000_000))
+    return packs_dir
+
+
+def test_large_files_are_large_enough():
+    assert all(
+        len(text.encode("utf-8")) >= xsiam_validator.MMAP_MIN_SIZE
+        for text in LARGE_FILES.values()
+    )
+
+
+@pytest.mark.parametrize("mmap_min_size", [0, xsiam_validator.MMAP_MIN_SIZE, 1 << 40])
+def test_scanner_matches_baseline(packs_dir, monkeypatch, mmap_min_size):
+    monkeypatch.setattr(xsiam_validator, "MMAP_MIN_SIZE", mmap_min_size)
+
+    found = found_issues(XSIAMValidator(packs_dir), "Acme")
+
+    assert found == baseline_issues(packs_dir, "Acme")
+    assert {issue[0] for issue in found} == {
+        "invalid_ingest_content_id",
+        "invalid_simple_schedule",
+        "parentheses_in_correlation_name",
+        "filename_contains_space",
+        "filename_mixed_separators",
+    }
+
+
+def test_read_content_keeps_bytes_only_for_plain_ascii(packs_dir):
+    rule_dir = packs_dir / "Acme" / "ParsingRules" / "Rule"
+    screens = [re.compile(rb"INGEST")]
+
+    assert isinstance(XSIAMValidator._read_content(str(rule_dir / "Rule.xif"), screens), bytes)
+    assert XSIAMValidator._read_content(str(rule_dir / "Crlf.xif"), screens) == (
+        f"// header\n{INGEST}\nfilter y;\n"
+    )
+    assert XSIAMValidator._read_content(str(rule_dir / "Invalid.xif"), screens) is None
+    assert XSIAMValidator._read_content(str(rule_dir / "LargeClean.xif"), screens) is None
+
+
+def test_cached_results_match_a_fresh_scan(packs_dir, tmp_path):
+    cache_path = tmp_path / "cache" / "validator.json"
+    expected = baseline_issues(packs_dir, "Acme")
+
+    first = XSIAMValidator(packs_dir, cache_path=cache_path)
+    assert found_issues(first, "Acme") == expected
+    first.save_cache()
+    assert cache_path.exists()
+
+    second = XSIAMValidator(packs_dir, cache_path=cache_path)
+    assert found_issues(second, "Acme") == expected
+
+    # A changed file is scanned again rather than served from the cache
+    changed = packs_dir / "Acme" / "CorrelationRules" / "Schedule.yml"
+    changed.write_text("name: Schedule\n", encoding="utf-8")
+    os.utime(changed, (1_600_000_100, 1_600_000_100))
+    third = XSIAMValidator(packs_dir, cache_path=cache_path)
+    assert found_issues(third, "Acme") == baseline_issues(packs_dir, "Acme") != expected
+
+
+def test_validate_all_packs_matches_per_pack_results(packs_dir):
+    (packs_dir / "Clean").mkdir()
+    (packs_dir / ".hidden").mkdir()
+    validator = XSIAMValidator(packs_dir)
+
+    results = validator.validate_all_packs()
+
+    assert list(results) == ["Acme"]
+    assert sorted(map(repr, results["Acme"])) == sorted(
+        map(repr, validator.validate_pack("Acme"))
+    )